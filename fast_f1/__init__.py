@@ -14,6 +14,8 @@ from fast_f1.api import (
     get_race_numbers_for_season,
     get_race_results,
     get_session_laps,
+    list_cached_sessions,
+    prefetch_sessions,
     select_practice_sessions_from_available,
     select_practice_sessions_from_event,
 )
@@ -36,6 +38,8 @@ __all__ = [
     "get_race_numbers_for_season",
     "get_race_results",
     "get_session_laps",
+    "list_cached_sessions",
+    "prefetch_sessions",
     "generate_single_race_prediction",
     "generate_historical_metrics",
     "DEFAULT_HISTORICAL_OUTPUT",
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Iterable, Tuple
+from typing import Any, Iterable, NamedTuple, Tuple
 
 import fastf1
 import pandas as pd
@@ -14,6 +17,7 @@ except Exception:
         """Fallback exception alias when fastf1.exceptions is not available."""
         pass
 
+from fast_f1 import local_cache
 from fast_f1.cache import get_local_cache_directory
 from fast_f1.weekend import determine_practice_sessions
 
@@ -41,25 +45,119 @@ _SESSION_CODE_NAMES = {
     "R": "Race",
 }
 _SESSION_NAME_TO_CODE = {name: code for code, name in _SESSION_CODE_NAMES.items()}
+# Practice sessions either weekend format draws on, see ``fast_f1.weekend.determine_practice_sessions``
+PRACTICE_SESSION_CODES = ("FP1", "FP2", "FP3", "SQ")
+# Columns kept from a session's laps
+_SESSION_LAPS_COLUMNS = [
+    "Driver",
+    "LapTime",
+    "LapNumber",
+    "Stint",
+    "PitOutTime",
+    "PitInTime",
+    "Compound",
+    "TyreLife",
+    "FreshTyre",
+]
+# Sessions loaded at once by ``prefetch_sessions``; each load mostly waits on the network and parsing
+_PREFETCH_MAX_WORKERS = 4
+
+# A schedule fetched before its season was over may since have had rounds moved or added, so is refetched once this old
+_SCHEDULE_MAX_AGE = timedelta(hours=12)
+
+
+class _SeasonSchedule(NamedTuple):
+    """A season's schedule as loaded once per process, indexed by round."""
+    schedule: pd.DataFrame
+    events: dict[int, Any]
+    race_numbers: list[int]
+    fetched_at: datetime
+
+
+# Schedules already loaded by this process, keyed by season; the lock keeps prefetch threads to one load each
+_season_schedules: dict[int, _SeasonSchedule] = {}
+_season_schedules_lock = threading.Lock()
 
 
 def get_event_schedule(season_year: int) -> pd.DataFrame:
     """Return a season's event schedule, served from ``local_cache`` when present.
 
-    A schedule covers a whole season, so one fetch serves every race in it.
+    A schedule covers a whole season, so one fetch serves every race in it, and
+    it is loaded once per process. A schedule fetched while its season was
+    still to finish is refetched once it is more than ``_SCHEDULE_MAX_AGE``
+    old, so a season under way picks up rescheduled rounds.
 
     Raises:
         ValueError: If the schedule cannot be loaded.
     """
+    return _get_season_schedule(season_year).schedule
+
+
+def get_race_numbers_for_season(season_year: int) -> list[int]:
+    """Return the round numbers a season scheduled, in ascending order.
+
+    Season length varies - 2024 and 2025 ran 24 rounds where 2023 and 2026 ran
+    22 - so callers walking a whole season must ask rather than assume.
+
+    Raises:
+        ValueError: If the schedule cannot be loaded.
+    """
+    return list(_get_season_schedule(season_year).race_numbers)
+
+
+def get_event_for_race(season_year: int, race_num: int) -> Any:
+    event = _get_season_schedule(season_year).events.get(race_num)
+    if event is None:
+        raise SessionDataUnavailable(f"No event found for season {season_year}, race {race_num}")
+    return event
+
+
+def _get_season_schedule(season_year: int) -> _SeasonSchedule:
+    """Return a season's indexed schedule, loading it if this process has none or only a stale one."""
+    with _season_schedules_lock:
+        season_schedule = _season_schedules.get(season_year)
+        if season_schedule is None or _is_schedule_stale(season_year, season_schedule.fetched_at):
+            season_schedule = _load_season_schedule(season_year)
+            # An empty schedule is a failed fetch, so is retried next time rather than kept
+            if not season_schedule.schedule.empty:
+                _season_schedules[season_year] = season_schedule
+        return season_schedule
+
+
+def _is_schedule_stale(season_year: int, fetched_at: datetime) -> bool:
+    if fetched_at.year > season_year:
+        return False
+    return datetime.now(timezone.utc) - fetched_at > _SCHEDULE_MAX_AGE
+
+
+def _load_season_schedule(season_year: int) -> _SeasonSchedule:
+    """Load a season's schedule from ``local_cache``, or from FastF1 if not cached or stale there.
+
+    A stale cached schedule is still better than none, so it is used when the
+    refetch fails, and tried again once ``_SCHEDULE_MAX_AGE`` has passed.
+
+    Raises:
+        ValueError: If the schedule cannot be loaded.
+    """
+    cached_schedule = None
     cache_path = _get_cache_file_path("event_schedule", season_year)
     if cache_path is not None:
         cached_schedule = _load_cached_dataframe(cache_path)
         if cached_schedule is not None:
-            return cached_schedule
+            fetched_at = datetime.fromtimestamp(cache_path.stat().st_mtime, timezone.utc)
+            if not _is_schedule_stale(season_year, fetched_at):
+                return _index_schedule(cached_schedule, fetched_at)
 
     try:
         schedule = fastf1.get_event_schedule(season_year, include_testing=False)
     except Exception as exc:
+        if cached_schedule is not None:
+            logger.warning(
+                "Could not refresh event schedule for season %s, using the cached one: %s",
+                season_year,
+                exc,
+            )
+            return _index_schedule(cached_schedule, datetime.now(timezone.utc))
         logger.warning(
             "Could not load event schedule for season %s: %s",
             season_year,
@@ -69,29 +167,17 @@ def get_event_schedule(season_year: int) -> pd.DataFrame:
 
     if cache_path is not None:
         _save_cached_dataframe(schedule, cache_path)
-    return schedule
+    return _index_schedule(schedule, datetime.now(timezone.utc))
 
 
-def get_race_numbers_for_season(season_year: int) -> list[int]:
-    """Return the round numbers a season scheduled, in ascending order.
-
-    Season length varies - 2024 and 2025 ran 24 rounds where 2023 and 2026 ran
-    22 - so callers walking a whole season must ask rather than assume.
-
-    Raises:
-        ValueError: If the schedule cannot be loaded.
-    """
-    schedule = get_event_schedule(season_year)
-    return sorted(int(round_number) for round_number in schedule["RoundNumber"] if int(round_number) > 0)
-
-
-def get_event_for_race(season_year: int, race_num: int) -> Any:
-    schedule = get_event_schedule(season_year)
-
-    event_rows = schedule[schedule["RoundNumber"] == race_num]
-    if event_rows.empty:
-        raise SessionDataUnavailable(f"No event found for season {season_year}, race {race_num}")
-    return event_rows.iloc[0]
+def _index_schedule(schedule: pd.DataFrame, fetched_at: datetime) -> _SeasonSchedule:
+    """Index a schedule by round, taking each round's first event as ``get_event_for_race`` always has."""
+    events = {}
+    for position, round_number in enumerate(schedule["RoundNumber"]):
+        if int(round_number) not in events:
+            events[int(round_number)] = schedule.iloc[position]
+    race_numbers = sorted(round_number for round_number in events if round_number > 0)
+    return _SeasonSchedule(schedule, events, race_numbers, fetched_at)
 
 
 def _get_session(event: Any, session_code: str) -> Any:
@@ -124,14 +210,23 @@ def _get_local_cache_path() -> Path | None:
     return local_cache_dir
 
 
+def _get_cache_key(prefix: str, *key_parts: object) -> str:
+    """Return the ``local_cache`` key for a response keyed by ``prefix`` and ``key_parts``."""
+    return "_".join([prefix, *(str(part) for part in key_parts)])
+
+
 def _get_cache_file_path(prefix: str, *key_parts: object) -> Path | None:
-    """Return the ``local_cache`` path for a response keyed by ``prefix`` and ``key_parts``."""
+    """Return the ``local_cache`` pickle path for a response keyed by ``prefix`` and ``key_parts``.
+
+    Only the event schedule is still pickled: it is a FastF1 ``EventSchedule``
+    whose rows must come back as ``Event`` objects for ``get_event_for_race``,
+    and its session dates carry per-event UTC offsets that Arrow cannot hold in
+    one column. Session laps and race results live in ``fast_f1.local_cache``.
+    """
     local_cache_dir = _get_local_cache_path()
     if local_cache_dir is None:
         return None
-
-    file_name = "_".join([prefix, *(str(part) for part in key_parts)])
-    return local_cache_dir / f"{file_name}.pkl"
+    return local_cache_dir / f"{_get_cache_key(prefix, *key_parts)}.pkl"
 
 
 def _load_cached_dataframe(cache_path: Path) -> pd.DataFrame | None:
@@ -162,6 +257,35 @@ def _save_cached_dataframe(df: pd.DataFrame, cache_path: Path) -> None:
         logger.warning("Failed to save cached DataFrame to %s: %s", cache_path, exc)
 
 
+def _load_cached_frame(cache_key: str) -> pd.DataFrame | None:
+    local_cache_dir = _get_local_cache_path()
+    if local_cache_dir is None:
+        return None
+
+    dataframe = local_cache.read_cached_frame(local_cache_dir, cache_key)
+    if dataframe is not None:
+        logger.info("Loaded cached DataFrame from %s", local_cache.get_frame_path(local_cache_dir, cache_key))
+    return dataframe
+
+
+def _save_cached_frame(df: pd.DataFrame, cache_key: str) -> None:
+    local_cache_dir = _get_local_cache_path()
+    if local_cache_dir is not None:
+        local_cache.write_cached_frame(local_cache_dir, cache_key, df)
+
+
+def list_cached_sessions() -> pd.DataFrame:
+    """Return what ``local_cache`` holds, one row per cached frame, read from its manifest alone.
+
+    Columns are ``key``, ``schema_version``, ``rows`` and ``source_timestamp``,
+    the time the data was fetched from FastF1. Empty without a ``local_cache``.
+    """
+    local_cache_dir = _get_local_cache_path()
+    if local_cache_dir is None:
+        return pd.DataFrame(columns=list(local_cache.ManifestEntry._fields))
+    return local_cache.list_cached_frames(local_cache_dir)
+
+
 def _empty_race_results_dataframe() -> pd.DataFrame:
     return pd.DataFrame(
         columns=[
@@ -207,19 +331,13 @@ def get_race_results(season_year: int, race_num: int) -> pd.DataFrame:
     The returned dataframe includes the driver abbreviation, status, position,
     classified position, grid position, points, constructor, and season/race metadata.
     """
-    cache_path = _get_cache_file_path("race_results", season_year, race_num)
-    if cache_path is not None:
-        cache_df = _load_cached_dataframe(cache_path)
-        if cache_df is not None:
-            return cache_df
+    cache_key = _get_cache_key("race_results", season_year, race_num)
+    cache_df = _load_cached_frame(cache_key)
+    if cache_df is not None:
+        return cache_df
 
     try:
-        event = get_event_for_race(season_year, race_num)
-        race = _get_session(event, "R")
-        _load_session(race, laps=False)
-        results = getattr(race, "results", pd.DataFrame())
-        if not isinstance(results, pd.DataFrame) or results.empty:
-            raise SessionDataUnavailable("Race results are unavailable or malformed")
+        results = _fetch_race_results(season_year, race_num)
     except (SessionDataUnavailable, SessionNotAvailableError) as exc:
         logger.warning(
             "Could not load race results for season %s race %s: %s",
@@ -229,6 +347,25 @@ def get_race_results(season_year: int, race_num: int) -> pd.DataFrame:
         )
         return _empty_race_results_dataframe()
 
+    _save_cached_frame(results, cache_key)
+
+    _warm_practice_session_cache(season_year, race_num)
+    return results
+
+
+def _fetch_race_results(season_year: int, race_num: int) -> pd.DataFrame:
+    """Load race results from FastF1, bypassing ``local_cache``.
+
+    Raises:
+        SessionDataUnavailable: If the race has no results.
+    """
+    event = get_event_for_race(season_year, race_num)
+    race = _get_session(event, "R")
+    _load_session(race, laps=False)
+    results = getattr(race, "results", pd.DataFrame())
+    if not isinstance(results, pd.DataFrame) or results.empty:
+        raise SessionDataUnavailable("Race results are unavailable or malformed")
+
     columns = [
         "Abbreviation",
         "Status",
@@ -243,68 +380,28 @@ def get_race_results(season_year: int, race_num: int) -> pd.DataFrame:
     results["Constructor"] = results.get("TeamName")
     results["Season"] = season_year
     results["Race"] = race_num
-    if cache_path is not None:
-        _save_cached_dataframe(results, cache_path)
-
-    _warm_practice_session_cache(event, season_year, race_num)
     return results
 
 
-def _warm_practice_session_cache(event: Any, season_year: int, race_num: int) -> None:
-    """Cache the weekend's practice laps while the event object is already loaded.
+def _warm_practice_session_cache(season_year: int, race_num: int) -> None:
+    """Cache the weekend's practice laps while its race is being fetched anyway.
 
     Best-effort only: a session that will not load costs a later
-    ``get_session_laps`` call nothing but a cache miss, so every failure here
-    is logged and stepped over rather than raised.
+    ``get_session_laps`` call nothing but a cache miss, which is how
+    ``prefetch_sessions`` treats every failure.
     """
-    for sess_code in ("FP1", "FP2", "FP3", "SQ"):
-        try:
-            sess = _get_session(event, sess_code)
-            _load_session(sess, laps=True)
-            laps = getattr(sess, "laps", pd.DataFrame())
-            if not isinstance(laps, pd.DataFrame) or laps.empty:
-                continue
-            cols = [
-                "Driver",
-                "LapTime",
-                "LapNumber",
-                "Stint",
-                "PitOutTime",
-                "PitInTime",
-                "Compound",
-                "TyreLife",
-                "FreshTyre",
-            ]
-            available = [c for c in cols if c in laps.columns]
-            if not available:
-                continue
-            session_laps = laps[available].copy()
-            session_laps["Season"] = season_year
-            session_laps["Race"] = race_num
-            session_laps["SessionType"] = sess_code
-            sess_cache = _get_cache_file_path("session_laps", season_year, race_num, sess_code)
-            if sess_cache is not None:
-                _save_cached_dataframe(session_laps, sess_cache)
-        except Exception as exc:
-            logger.debug("Ignoring unavailable practice session %s for %s %s: %s", sess_code, season_year, race_num, exc)
-            continue
+    prefetch_sessions([(season_year, race_num, sess_code) for sess_code in PRACTICE_SESSION_CODES])
 
 
 def get_session_laps(season_year: int, race_num: int, session_type: str) -> pd.DataFrame:
     """Return session laps for a given season, race, and session."""
-    cache_path = _get_cache_file_path("session_laps", season_year, race_num, session_type)
-    if cache_path is not None:
-        cache_df = _load_cached_dataframe(cache_path)
-        if cache_df is not None:
-            return cache_df
+    cache_key = _get_cache_key("session_laps", season_year, race_num, session_type)
+    cache_df = _load_cached_frame(cache_key)
+    if cache_df is not None:
+        return cache_df
 
     try:
-        event = get_event_for_race(season_year, race_num)
-        session = _get_session(event, session_type)
-        _load_session(session, laps=True)
-        session_laps = getattr(session, "laps", pd.DataFrame())
-        if not isinstance(session_laps, pd.DataFrame) or session_laps.empty:
-            raise SessionDataUnavailable("Session laps are unavailable or malformed")
+        session_laps = _fetch_session_laps(season_year, race_num, session_type)
     except (SessionDataUnavailable, SessionNotAvailableError) as exc:
         logger.warning(
             "Could not load session laps for season %s race %s session %s: %s",
@@ -315,27 +412,99 @@ def get_session_laps(season_year: int, race_num: int, session_type: str) -> pd.D
         )
         return _empty_session_laps_dataframe(season_year, race_num, session_type)
 
-    columns = [
-        "Driver",
-        "LapTime",
-        "LapNumber",
-        "Stint",
-        "PitOutTime",
-        "PitInTime",
-        "Compound",
-        "TyreLife",
-        "FreshTyre",
-    ]
-    available = [c for c in columns if c in session_laps.columns]
+    _save_cached_frame(session_laps, cache_key)
+    return session_laps
+
+
+def _fetch_session_laps(season_year: int, race_num: int, session_type: str) -> pd.DataFrame:
+    """Load session laps from FastF1, bypassing ``local_cache``.
+
+    Raises:
+        SessionDataUnavailable: If the session has no laps.
+    """
+    event = get_event_for_race(season_year, race_num)
+    session = _get_session(event, session_type)
+    _load_session(session, laps=True)
+    session_laps = getattr(session, "laps", pd.DataFrame())
+    if not isinstance(session_laps, pd.DataFrame) or session_laps.empty:
+        raise SessionDataUnavailable("Session laps are unavailable or malformed")
+
+    available = [c for c in _SESSION_LAPS_COLUMNS if c in session_laps.columns]
     session_laps = session_laps[available].copy()
     session_laps["Season"] = season_year
     session_laps["Race"] = race_num
     session_laps["SessionType"] = session_type
-    if cache_path is not None:
-        _save_cached_dataframe(session_laps, cache_path)
     return session_laps
 
 
+def _get_session_cache_key(season_year: int, race_num: int, session_type: str) -> str:
+    """Return the key ``local_cache`` holds a session under: results for the race itself, laps for any other."""
+    if session_type == "R":
+        return _get_cache_key("race_results", season_year, race_num)
+    return _get_cache_key("session_laps", season_year, race_num, session_type)
+
+
+def _prefetch_session(season_year: int, race_num: int, session_type: str, cache_dir: Path, cache_key: str) -> bool:
+    """Load one session into ``local_cache``, run on a ``prefetch_sessions`` worker thread."""
+    if session_type == "R":
+        dataframe = _fetch_race_results(season_year, race_num)
+    else:
+        dataframe = _fetch_session_laps(season_year, race_num, session_type)
+    return local_cache.write_cached_frame(cache_dir, cache_key, dataframe)
+
+
+def prefetch_sessions(
+    keys: Iterable[tuple[int, int, str]],
+    max_workers: int = _PREFETCH_MAX_WORKERS,
+) -> list[tuple[int, int, str]]:
+    """Load any of the given sessions missing from ``local_cache``, several at a time.
+
+    Each key is ``(season, race, session code)``; the race session ``"R"``
+    caches the race results, any other session its laps, exactly as
+    ``get_race_results`` and ``get_session_laps`` would. Loads run on a pool of
+    at most ``max_workers`` threads, each written to the cache as it completes,
+    so those calls afterwards are cache hits.
+
+    Best-effort only: a session that fails to load is logged and left to the
+    later call, which reports it properly. Without a ``local_cache`` there is
+    nowhere to keep anything, so nothing is loaded.
+
+    Returns:
+        The keys loaded into the cache, in the order they completed.
+    """
+    local_cache_dir = _get_local_cache_path()
+    if local_cache_dir is None:
+        return []
+
+    missing = {}
+    for key in dict.fromkeys(keys):
+        cache_key = _get_session_cache_key(*key)
+        if not local_cache.is_frame_cached(local_cache_dir, cache_key):
+            missing[key] = cache_key
+    if not missing:
+        return []
+
+    logger.info("Prefetching %s sessions on %s threads", len(missing), max_workers)
+    loaded = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_prefetch_session, *key, local_cache_dir, cache_key): key
+            for key, cache_key in missing.items()
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                written = future.result()
+            except Exception as exc:
+                # Deliberately broad: the serial call after this one meets the same failure, and
+                # either reports it as missing data or lets it propagate as it always has
+                logger.debug("Could not prefetch season %s race %s session %s: %s", *key, exc)
+                continue
+            if written:
+                loaded.append(key)
+    return loaded
+
+
 def get_available_sessions_from_event(event: Any) -> list[str]:
     """Extract available session type names from a FastF1 Event object.
 
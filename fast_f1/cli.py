@@ -11,8 +11,10 @@ from fast_f1.api import SessionDataUnavailable
 from fast_f1.cache import setup_fastf1_cache
 from fast_f1.output import (
     DEFAULT_HISTORICAL_OUTPUT,
+    export_historical_metrics,
     generate_historical_metrics,
     generate_single_race_prediction,
+    get_historical_store_path,
 )
 
 logger = logging.getLogger(__name__)
@@ -25,11 +27,23 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument("--historical", action="store_true", help="Generate historical metrics for a range of races")
     parser.add_argument("--cache-dir", type=str, help="FastF1 cache directory")
     parser.add_argument("--output", type=str, help="Output file path")
+    parser.add_argument("--jobs", type=int, default=1, help="With --historical, worker processes building races at once")
+    parser.add_argument("--export", action="store_true", help="Export the historical metrics store to its workbook, building nothing")
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_arguments()
+
+    if args.export:
+        # Reads only the store, so there is no FastF1 cache to set up
+        output_path = Path(args.output) if args.output else DEFAULT_HISTORICAL_OUTPUT
+        dataframe = export_historical_metrics(get_historical_store_path(output_path), output_path)
+        if dataframe.empty:
+            logger.error("No historical metrics stored for %s", output_path)
+            sys.exit(1)
+        return
+
     setup_fastf1_cache(cache_dir=args.cache_dir, interactive=args.cache_dir is None)
 
     if args.historical:
@@ -42,7 +56,7 @@ def main() -> None:
         output_arg = str(output_path)
 
         logger.info("Generating historical metrics for %s seasons", len(season_years))
-        generate_historical_metrics(season_years, output_path=output_arg)
+        generate_historical_metrics(season_years, output_path=output_arg, jobs=args.jobs)
         logger.info("Historical metrics generation complete: %s", output_arg)
         return
 
@@ -0,0 +1,176 @@
+"""fast_f1.local_cache: Columnar `local_cache` of FastF1 responses, indexed by a manifest.
+
+Each cached frame is an Arrow IPC file named after its key, e.g.
+`session_laps_2025_1_FP2.arrow`, read memory-mapped so a read of a few
+columns only touches those columns. Alongside them `manifest.jsonl` records
+every frame written: its key, schema version, row count and when its data was
+fetched from FastF1. The manifest is append-only, one JSON line per write with
+the last line for a key winning, so concurrent writers never lose each other's
+entries, and it answers "is this cached" and "what is cached" without touching
+any frame.
+
+Frames cached as pickles before this format are migrated the first time they
+are looked up: read, written as Arrow, and the pickle removed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import NamedTuple
+
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.jsonl"
+# Bumped whenever the layout of a cached frame changes, orphaning entries written before it
+SCHEMA_VERSION = 1
+
+_FRAME_SUFFIX = ".arrow"
+_LEGACY_SUFFIX = ".pkl"
+
+# Serialises manifest appends and the parsed copy below between threads of one process
+_manifest_lock = threading.Lock()
+# Parsed manifest per cache directory, reused until the file's size or modification time changes
+_manifest_entries: dict[Path, tuple[tuple[int, int], dict[str, "ManifestEntry"]]] = {}
+
+
+class ManifestEntry(NamedTuple):
+    """One cached frame, as recorded in the manifest."""
+    key: str
+    schema_version: int
+    rows: int
+    source_timestamp: str
+
+
+def get_frame_path(cache_dir: Path, key: str) -> Path:
+    return cache_dir / f"{key}{_FRAME_SUFFIX}"
+
+
+def read_manifest(cache_dir: Path) -> dict[str, ManifestEntry]:
+    """Return the current manifest entry for each key cached in `cache_dir`, any schema version."""
+    manifest_path = cache_dir / MANIFEST_FILENAME
+    try:
+        stat = manifest_path.stat()
+    except FileNotFoundError:
+        return {}
+
+    with _manifest_lock:
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _manifest_entries.get(cache_dir)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        entries = {}
+        with open(manifest_path, encoding="utf-8") as manifest:
+            for line in manifest:
+                try:
+                    entry = ManifestEntry(**json.loads(line))
+                except (ValueError, TypeError):
+                    # A line cut short by a crash mid-append, anything after it is still good
+                    logger.debug("Ignoring unreadable manifest line in %s: %r", manifest_path, line)
+                    continue
+                entries[entry.key] = entry
+        _manifest_entries[cache_dir] = (signature, entries)
+        return entries
+
+
+def list_cached_frames(cache_dir: Path) -> pd.DataFrame:
+    """Return every frame cached in `cache_dir` at the current schema version, one row each."""
+    entries = [entry for entry in read_manifest(cache_dir).values() if entry.schema_version == SCHEMA_VERSION]
+    return pd.DataFrame(entries, columns=list(ManifestEntry._fields)).sort_values("key", ignore_index=True)
+
+
+def is_frame_cached(cache_dir: Path, key: str) -> bool:
+    """Return whether `key` is cached at the current schema version, migrating a legacy pickle if there is one."""
+    entry = read_manifest(cache_dir).get(key)
+    if entry is not None and entry.schema_version == SCHEMA_VERSION:
+        return True
+    return _migrate_legacy_pickle(cache_dir, key)
+
+
+def read_cached_frame(cache_dir: Path, key: str, columns: list[str] | None = None) -> pd.DataFrame | None:
+    """Read a cached frame, or only `columns` of it, or None if it is not cached."""
+    if not is_frame_cached(cache_dir, key):
+        return None
+
+    frame_path = get_frame_path(cache_dir, key)
+    try:
+        with pa.memory_map(str(frame_path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+            if columns is not None:
+                table = table.select([c for c in columns if c in table.column_names])
+            dataframe = table.to_pandas()
+    except (OSError, pa.ArrowInvalid) as exc:
+        logger.warning("Failed to load cached DataFrame from %s: %s", frame_path, exc)
+        return None
+    return dataframe
+
+
+def write_cached_frame(cache_dir: Path, key: str, df: pd.DataFrame, source_timestamp: str | None = None) -> bool:
+    """Cache a frame under `key` and record it in the manifest, returning whether it was written.
+
+    `source_timestamp` is when the data was fetched from FastF1, now if not
+    given. The frame is written under a temporary name and renamed into place
+    before its manifest line is appended, so a listed frame is always complete.
+    An empty frame is refused: caching it would turn a session FastF1 has not
+    published yet into a permanent miss.
+    """
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        logger.debug("Refusing to cache an empty or invalid result as %s", key)
+        return False
+
+    if source_timestamp is None:
+        source_timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    frame_path = get_frame_path(cache_dir, key)
+    tmp_path = cache_dir / f".{key}.{uuid.uuid4().hex}.tmp"
+    try:
+        table = pa.Table.from_pandas(df)
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, frame_path)
+    except (OSError, pa.ArrowException) as exc:
+        logger.warning("Failed to save cached DataFrame to %s: %s", frame_path, exc)
+        tmp_path.unlink(missing_ok=True)
+        return False
+
+    entry = ManifestEntry(key=key, schema_version=SCHEMA_VERSION, rows=len(df.index), source_timestamp=source_timestamp)
+    with _manifest_lock:
+        # One write of one line in append mode, so lines from other processes interleave rather than mix
+        with open(cache_dir / MANIFEST_FILENAME, "a", encoding="utf-8") as manifest:
+            manifest.write(json.dumps(entry._asdict()) + "\n")
+
+    logger.debug("Saved cached dataframe to %s", frame_path)
+    return True
+
+
+def _migrate_legacy_pickle(cache_dir: Path, key: str) -> bool:
+    """Move a frame cached as a pickle into the columnar format, returning whether there was one."""
+    legacy_path = cache_dir / f"{key}{_LEGACY_SUFFIX}"
+    if not legacy_path.exists():
+        return False
+
+    try:
+        dataframe = pd.read_pickle(legacy_path)
+    except Exception as exc:
+        # Deliberately broad: unpickling raises whatever the pickled classes do, and
+        # an unreadable pickle is only ever a cache miss
+        logger.warning("Failed to migrate cached DataFrame from %s: %s", legacy_path, exc)
+        return False
+
+    source_timestamp = datetime.fromtimestamp(legacy_path.stat().st_mtime, timezone.utc).isoformat(timespec="seconds")
+    if not write_cached_frame(cache_dir, key, dataframe, source_timestamp):
+        return False
+
+    legacy_path.unlink(missing_ok=True)
+    logger.info("Migrated cached DataFrame from %s", legacy_path)
+    return True
@@ -0,0 +1,77 @@
+"""fast_f1.metrics_store: Append-only store of historical metrics, one fragment per race.
+
+Each race's metric frame is written as its own parquet file in a directory
+partitioned by season, `<root>/season=2025/race=3.parquet`, so building a race
+costs only that race's rows instead of rewriting every race so far. Which races
+are done is read from the file names alone. Writing a race again replaces its
+fragment, and every write goes under a temporary name first, so an interrupted
+run never leaves a partial fragment behind.
+
+Races are read back one fragment at a time and concatenated, rather than as one
+parquet dataset, because their columns differ with the practice sessions each
+weekend held.
+"""
+
+import logging
+import os
+import re
+import uuid
+from pathlib import Path
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_FRAGMENT_PATTERN = re.compile(r"race=(\d+)\.parquet")
+_SEASON_PATTERN = re.compile(r"season=(\d+)")
+
+
+def get_fragment_path(root: Path, season_year: int, race_num: int) -> Path:
+    return root / f"season={season_year}" / f"race={race_num}.parquet"
+
+
+def write_race_metrics(root: Path, season_year: int, race_num: int, dataframe: pd.DataFrame) -> Path:
+    """Store one race's metrics, replacing any stored before."""
+    fragment_path = get_fragment_path(root, season_year, race_num)
+    fragment_path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = fragment_path.parent / f".{fragment_path.name}.{uuid.uuid4().hex}.tmp"
+    try:
+        dataframe.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, fragment_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    logger.debug("Wrote metrics of shape %s to %s", dataframe.shape, fragment_path)
+    return fragment_path
+
+
+def list_stored_races(root: Path) -> list[tuple[int, int]]:
+    """Return the (season, race) pairs stored under `root`, in order, from the file names alone."""
+    if not root.is_dir():
+        return []
+
+    keys = []
+    for season_dir in root.iterdir():
+        season_match = _SEASON_PATTERN.fullmatch(season_dir.name)
+        if season_match is None or not season_dir.is_dir():
+            continue
+        for fragment in season_dir.iterdir():
+            race_match = _FRAGMENT_PATTERN.fullmatch(fragment.name)
+            if race_match is not None:
+                keys.append((int(season_match.group(1)), int(race_match.group(1))))
+    return sorted(keys)
+
+
+def get_store_mtime_ns(root: Path) -> int | None:
+    """Return when the most recent fragment under `root` was written, None if nothing is stored."""
+    mtimes = [get_fragment_path(root, *key).stat().st_mtime_ns for key in list_stored_races(root)]
+    return max(mtimes, default=None)
+
+
+def read_stored_metrics(root: Path) -> pd.DataFrame:
+    """Return every stored race's metrics as one frame, in season and race order."""
+    fragments = [pd.read_parquet(get_fragment_path(root, *key)) for key in list_stored_races(root)]
+    if not fragments:
+        return pd.DataFrame()
+    return pd.concat(fragments, ignore_index=True, sort=False)
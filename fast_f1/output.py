@@ -1,18 +1,22 @@
 from __future__ import annotations
 
 import logging
+from multiprocessing import Pool
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 import pandas as pd
 
 from fast_f1.api import (
+    PRACTICE_SESSION_CODES,
     get_event_for_race,
     get_race_numbers_for_season,
     get_race_results,
     get_session_laps,
+    prefetch_sessions,
     select_practice_sessions_from_event,
 )
+from fast_f1.cache import get_persisted_cache_directory, setup_fastf1_cache
 from fast_f1.metrics import (
     aggregate_metrics,
     calculate_constructor_rolling_points,
@@ -21,6 +25,7 @@ from fast_f1.metrics import (
     calculate_rolling_points,
     get_rolling_window_races,
 )
+from fast_f1.metrics_store import get_store_mtime_ns, list_stored_races, read_stored_metrics, write_race_metrics
 
 from common import AssetType
 from import_data.odds import load_odds
@@ -30,6 +35,7 @@ logger = logging.getLogger(__name__)
 DEFAULT_HISTORICAL_OUTPUT = Path("data/fastf1_practice_rolling_metrics.xlsx")
 DEFAULT_OUTPUT_DIRECTORY = Path("outputs")
 _DEFAULT_SHEET_NAME = "PracticeRollingMetrics"
+_DEFAULT_ROLLING_WINDOW = 3
 
 
 def _ensure_parent_directory(output_path: Path) -> None:
@@ -71,11 +77,19 @@ def _load_driver_odds(season_year: int, race_num: int) -> dict[str, float]:
 def build_race_metrics(
     season_year: int,
     race_num: int,
-    rolling_window: int = 3,
+    rolling_window: int = _DEFAULT_ROLLING_WINDOW,
 ) -> pd.DataFrame:
     """Build the full metric set for a single race using FastF1 inputs."""
     event = get_event_for_race(season_year, race_num)
     practice_session_codes = select_practice_sessions_from_event(event)
+    previous_race_numbers = get_rolling_window_races(race_num, rolling_window)
+
+    # Every session read below, loaded together rather than one after another
+    prefetch_sessions(
+        [(season_year, race_num, session_code) for session_code in practice_session_codes]
+        + [(season_year, prior_race, "R") for prior_race in previous_race_numbers]
+        + [(season_year, race_num, "R")]
+    )
 
     practice_dfs: list[pd.DataFrame] = []
     for session_code in practice_session_codes:
@@ -92,7 +106,6 @@ def build_race_metrics(
             raise RuntimeError(msg)
         practice_dfs.append(calculate_practice_performance(session_laps))
 
-    previous_race_numbers = get_rolling_window_races(race_num, rolling_window)
     previous_results = pd.DataFrame()
     if not previous_race_numbers:
         if race_num == 1:
@@ -235,6 +248,30 @@ def save_metrics(dataframe: pd.DataFrame, output_path: Path | str) -> None:
         dataframe.to_excel(writer, sheet_name=_DEFAULT_SHEET_NAME, index=False)
 
 
+def get_historical_store_path(output_path: Path | str) -> Path:
+    """Return where the per-race metrics behind a historical workbook are stored, beside it."""
+    path = Path(output_path)
+    return path.parent / f"{path.stem}_store"
+
+
+def export_historical_metrics(store_path: Path | str, output_path: Path | str) -> pd.DataFrame:
+    """Write every race in the metrics store to one workbook, returning what was written."""
+    dataframe = read_stored_metrics(Path(store_path))
+    if not dataframe.empty:
+        save_metrics(dataframe, output_path)
+        logger.info("Exported %s metric rows to %s", len(dataframe.index), output_path)
+    return dataframe
+
+
+def is_export_stale(store_path: Path | str, output_path: Path | str) -> bool:
+    """Return whether the metrics store holds anything written since the workbook was last exported."""
+    store_mtime_ns = get_store_mtime_ns(Path(store_path))
+    if store_mtime_ns is None:
+        return False
+    path = Path(output_path)
+    return not path.exists() or store_mtime_ns > path.stat().st_mtime_ns
+
+
 def load_existing_metrics(output_path: Path | str) -> pd.DataFrame:
     path = Path(output_path)
     if not path.exists():
@@ -263,44 +300,126 @@ def generate_single_race_prediction(
     return path, dataframe
 
 
+def _get_historical_session_keys(season_year: int, race_nums: list[int], rolling_window: int) -> list[tuple[int, int, str]]:
+    """Sessions ``build_race_metrics`` may read for these races, to prefetch a season at a time.
+
+    The practice sessions a race uses depend on its weekend format, so every
+    candidate is listed; those a weekend does not hold simply fail to load.
+    """
+    keys = []
+    for race_num in race_nums:
+        keys.extend((season_year, race_num, session_code) for session_code in PRACTICE_SESSION_CODES)
+        keys.extend((season_year, prior_race, "R") for prior_race in get_rolling_window_races(race_num, rolling_window))
+        keys.append((season_year, race_num, "R"))
+    return keys
+
+
+def _import_existing_metrics(output_path: Path, store_path: Path) -> None:
+    """Seed a new metrics store from a workbook written before the store existed, one fragment per race."""
+    existing_metrics = load_existing_metrics(output_path)
+    if existing_metrics.empty:
+        return
+
+    for (season_year, race_num), race_metrics in existing_metrics.groupby(["Season", "Race"], sort=True):
+        write_race_metrics(store_path, int(season_year), int(race_num), race_metrics)
+    logger.info("Imported existing metrics from %s into %s", output_path, store_path)
+
+
+def _init_backfill_worker() -> None:
+    """Point a backfill worker process at the same on-disk FastF1 cache as the run that started it."""
+    if get_persisted_cache_directory() is not None:
+        setup_fastf1_cache(interactive=False)
+
+
+def _build_race_metrics_or_skip(key: tuple[int, int]) -> tuple[pd.DataFrame | None, str | None]:
+    """Build one race's metrics, or return why it was skipped; run in a worker process under `jobs`."""
+    logger.info("Computing metrics for season %s race %s", *key)
+    try:
+        return build_race_metrics(*key), None
+    except RuntimeError as exc:
+        return None, str(exc)
+
+
+def _build_races(
+    keys: list[tuple[int, int]],
+    jobs: int,
+) -> Iterator[tuple[tuple[int, int], pd.DataFrame | None, str | None]]:
+    """Build each race's metrics, yielding them in the order of `keys` however many jobs build them.
+
+    A race depends only on cached FastF1 inputs, never on another race's
+    metrics, so with more than one job they are built in a process pool. Every
+    worker uses the same on-disk cache, which is safe for concurrent writers,
+    and results are taken back in order so the store grows the same way as a
+    serial run.
+    """
+    if jobs <= 1 or len(keys) <= 1:
+        for key in keys:
+            yield key, *_build_race_metrics_or_skip(key)
+        return
+
+    with Pool(processes=min(jobs, len(keys)), initializer=_init_backfill_worker) as pool:
+        for key, (race_metrics, skip_reason) in zip(keys, pool.imap(_build_race_metrics_or_skip, keys)):
+            yield key, race_metrics, skip_reason
+
+
 def generate_historical_metrics(
     season_years: Iterable[int],
     output_path: Path | str = DEFAULT_HISTORICAL_OUTPUT,
+    jobs: int = 1,
 ) -> pd.DataFrame:
     """Build metrics for every scheduled race of each season, resuming where left off.
 
     Each season is walked over the rounds it actually scheduled, so seasons of
-    differing length are all covered in full.
+    differing length are all covered in full. The sessions of every race still
+    to build are prefetched, a season at a time, before any race is built.
+
+    Each race built is appended to the metrics store beside the workbook (see
+    `get_historical_store_path`), and races already in the store are skipped.
+    The workbook is exported from the store once, at the end, whenever the
+    store has been written since the workbook was, so an export that failed
+    last time, say with the workbook open in Excel, is retried on the next run.
+
+    Args:
+        season_years: Seasons to walk.
+        output_path: Workbook the metrics are exported to.
+        jobs: Worker processes building races at once; 1 builds them in this process.
     """
     path = Path(output_path)
-    existing_metrics = load_existing_metrics(path)
-    existing_keys = set()
-    if not existing_metrics.empty:
-        existing_keys = set(zip(existing_metrics["Season"], existing_metrics["Race"]))
-
-    updated = existing_metrics.copy()
+    store_path = get_historical_store_path(path)
+    if not store_path.exists():
+        _import_existing_metrics(path, store_path)
+    existing_keys = set(list_stored_races(store_path))
 
+    pending_keys = []
     for season_year in season_years:
-        for race_num in get_race_numbers_for_season(season_year):
+        race_nums = get_race_numbers_for_season(season_year)
+        prefetch_sessions(
+            _get_historical_session_keys(
+                season_year,
+                [race_num for race_num in race_nums if (season_year, race_num) not in existing_keys],
+                _DEFAULT_ROLLING_WINDOW,
+            )
+        )
+
+        for race_num in race_nums:
             if (season_year, race_num) in existing_keys:
                 logger.info("Skipping existing metrics for season %s race %s", season_year, race_num)
                 continue
+            pending_keys.append((season_year, race_num))
+
+    for (season_year, race_num), race_metrics, skip_reason in _build_races(pending_keys, jobs):
+        if race_metrics is None:
+            logger.warning(
+                "Skipping season %s race %s due to missing data: %s",
+                season_year,
+                race_num,
+                skip_reason,
+            )
+            continue
 
-            logger.info("Computing metrics for season %s race %s", season_year, race_num)
-            try:
-                race_metrics = build_race_metrics(season_year, race_num)
-            except RuntimeError as exc:
-                logger.warning(
-                    "Skipping season %s race %s due to missing data: %s",
-                    season_year,
-                    race_num,
-                    exc,
-                )
-                continue
-
-            updated = pd.concat([updated, race_metrics], ignore_index=True, sort=False)
-            save_metrics(updated, path)
-            existing_keys.add((season_year, race_num))
-            logger.info("Saved updated metrics to %s", path)
+        fragment_path = write_race_metrics(store_path, season_year, race_num, race_metrics)
+        logger.info("Saved metrics for season %s race %s to %s", season_year, race_num, fragment_path)
 
-    return updated
+    if is_export_stale(store_path, path):
+        return export_historical_metrics(store_path, path)
+    return read_stored_metrics(store_path)
@@ -1,25 +1,101 @@
 import pandas as pd
 import numpy as np
 import functools
+from typing import Iterable
 
 from common import AssetType
-from import_data.import_history import load_archive_data_season
+from import_data.archive_cache import get_cache_path, get_previous_cache_path, read_cached_frames, write_cached_frames
+from import_data.import_history import _FILE_ARCHIVE_INPUTS, load_archive_data
 from import_data.derivations import (
     derivation_cum_tot_constructor,
     derivation_cum_tot_driver,
+    derivation_cum_tot_update,
     get_race_driver_constructor_pairs,
 )
 
 
+_DIR_ARCHIVE_CACHE = "outputs/archive_cache"
+_ROLLING_WINDOWS = (3,)
+
+
+def load_with_derivations(season: int, rolling_windows: Iterable[int] = _ROLLING_WINDOWS) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Load a season from the archive with its derivations, as (driver PPM, constructor PPM, driver pairs).
+
+    Derivations are added for every rolling window in `rolling_windows`.
+    Served from the on-disk archive cache when it holds this version of the
+    workbook and set of windows, otherwise built from the workbook and cached
+    for next time.  If the previous version of the workbook is still cached,
+    only the races archived since then are derived.
+    """
+    return _load_with_derivations(season, tuple(sorted(set(rolling_windows))))
+
+
+def load_seasons_with_derivations(
+        seasons: Iterable[int],
+        rolling_windows: Iterable[int] = _ROLLING_WINDOWS,
+    ) -> dict[int, tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
+    """Several seasons of :func:`load_with_derivations`, mapped by season.
+
+    Seasons not cached are read from one opening of the workbook, and every
+    one of them is derived before the cache is written, so each can start from
+    the previous version's cache before writing removes it.
+    """
+    return _build_with_derivations(tuple(seasons), tuple(sorted(set(rolling_windows))))
+
+
 @functools.cache
-def load_with_derivations(season: int) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    df_driver = load_archive_data_season(AssetType.DRIVER, season)
-    df_constructor = load_archive_data_season(AssetType.CONSTRUCTOR, season)
-    df_driver_pairs = get_race_driver_constructor_pairs(df_driver)
-    df_driver_ppm = derivation_cum_tot_driver(df_driver, rolling_window=3)
-    df_constructor_ppm = derivation_cum_tot_constructor(df_constructor, rolling_window=3)
-
-    return (df_driver_ppm, df_constructor_ppm, df_driver_pairs)
+def _load_with_derivations(season: int, rolling_windows: tuple[int, ...]) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    return _build_with_derivations((season,), rolling_windows)[season]
+
+
+def _build_with_derivations(
+        seasons: tuple[int, ...],
+        rolling_windows: tuple[int, ...],
+    ) -> dict[int, tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]:
+    variant = "window_" + "_".join(str(w) for w in rolling_windows)
+    cache_path = get_cache_path(_DIR_ARCHIVE_CACHE, _FILE_ARCHIVE_INPUTS, variant)
+    cache_path_previous = get_previous_cache_path(_DIR_ARCHIVE_CACHE, _FILE_ARCHIVE_INPUTS, variant)
+
+    results = {}
+    names_missing = {}
+    for season in seasons:
+        names = [f"{season}_driver_ppm", f"{season}_constructor_ppm", f"{season}_driver_pairs"]
+        frames = read_cached_frames(cache_path, names)
+        if frames is not None:
+            results[season] = tuple(frames[name] for name in names)
+        else:
+            names_missing[season] = names
+
+    if not names_missing:
+        return results
+
+    dfs_archive = load_archive_data([AssetType.DRIVER, AssetType.CONSTRUCTOR], list(names_missing.keys()))
+    frames_built = {}
+    for season, names in names_missing.items():
+        df_driver = dfs_archive[(AssetType.DRIVER, season)]
+        df_constructor = dfs_archive[(AssetType.CONSTRUCTOR, season)]
+        df_driver_pairs = get_race_driver_constructor_pairs(df_driver)
+
+        frames_previous = None
+        if cache_path_previous is not None:
+            frames_previous = read_cached_frames(cache_path_previous, names)
+
+        if frames_previous is not None:
+            df_driver_ppm = derivation_cum_tot_update(
+                frames_previous[names[0]], df_driver, AssetType.DRIVER, list(rolling_windows)
+            )
+            df_constructor_ppm = derivation_cum_tot_update(
+                frames_previous[names[1]], df_constructor, AssetType.CONSTRUCTOR, list(rolling_windows)
+            )
+        else:
+            df_driver_ppm = derivation_cum_tot_driver(df_driver, rolling_window=list(rolling_windows))
+            df_constructor_ppm = derivation_cum_tot_constructor(df_constructor, rolling_window=list(rolling_windows))
+
+        results[season] = (df_driver_ppm, df_constructor_ppm, df_driver_pairs)
+        frames_built.update(zip(names, results[season]))
+
+    write_cached_frames(cache_path, frames_built)
+    return {season: results[season] for season in seasons}
 
 
 def safe_to_float(value, default=0.0) -> float:
@@ -0,0 +1,105 @@
+"""import_data.archive_cache: On-disk cache of frames built from the archive workbook.
+
+Parsing the Excel archive and computing derivations costs every fresh process
+the same work, which `functools.cache` cannot share between processes. Frames
+built from the archive are kept here as Arrow IPC files, under a directory
+named after a content hash of the workbook, so editing the workbook moves to a
+new directory and the old one is removed the next time the cache is written.
+
+Layout: `<cache_dir>/<workbook hash>/<variant>/<name>.arrow`, where the variant
+separates frames built from the same workbook with different parameters,
+e.g. the rolling window.
+"""
+
+import functools
+import hashlib
+import logging
+import os
+import shutil
+import uuid
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+# Hash prefix long enough to never collide between versions of one workbook
+_HASH_LENGTH = 16
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+@functools.cache
+def _get_file_hash(fn: str, mtime_ns: int, size: int) -> str:
+    sha = hashlib.sha256()
+    with open(fn, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            sha.update(chunk)
+    return sha.hexdigest()[:_HASH_LENGTH]
+
+
+def get_file_hash(fn: str) -> str:
+    """Return a hash of the file's contents, only re-read if the file has been modified."""
+    stat = os.stat(fn)
+    return _get_file_hash(os.path.abspath(fn), stat.st_mtime_ns, stat.st_size)
+
+
+def get_cache_path(cache_dir: str, fn_source: str, variant: str) -> Path:
+    """Return the directory holding frames built from `fn_source` as it currently is."""
+    return Path(cache_dir) / get_file_hash(fn_source) / variant
+
+
+def get_previous_cache_path(cache_dir: str, fn_source: str, variant: str) -> Path | None:
+    """Return the directory holding frames built from an earlier version of `fn_source`, if one is still cached.
+
+    Earlier versions are removed the next time the cache is written, so there
+    is at most one.
+    """
+    cache_path = get_cache_path(cache_dir, fn_source, variant)
+    if not cache_path.parent.parent.exists():
+        return None
+    for hash_path in cache_path.parent.parent.iterdir():
+        if hash_path.is_dir() and hash_path != cache_path.parent and (hash_path / variant).is_dir():
+            return hash_path / variant
+    return None
+
+
+def read_cached_frames(cache_path: Path, names: list[str]) -> dict[str, pd.DataFrame] | None:
+    """Read frames from the cache into ordinary, writable dataframes.
+
+    Returns:
+        Mapping of name to dataframe, or None if any of them is not cached.
+    """
+    frames = {}
+    for name in names:
+        fn = cache_path / f"{name}.arrow"
+        if not fn.exists():
+            return None
+        with pa.OSFile(str(fn), "rb") as source:
+            frames[name] = pa.ipc.open_file(source).read_all().to_pandas()
+
+    logging.debug(f"Read {names} from {cache_path}")
+    return frames
+
+
+def write_cached_frames(cache_path: Path, frames: dict[str, pd.DataFrame]):
+    """Write frames to the cache, and remove anything cached for other versions of the source.
+
+    Each file is written under a temporary name and renamed into place, so a
+    concurrent reader never sees a partial file.
+    """
+    cache_path.mkdir(parents=True, exist_ok=True)
+    for name, df in frames.items():
+        fn = cache_path / f"{name}.arrow"
+        fn_tmp = cache_path / f".{name}.{uuid.uuid4().hex}.tmp"
+        table = pa.Table.from_pandas(df)
+        with pa.OSFile(str(fn_tmp), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(fn_tmp, fn)
+
+    hash_path = cache_path.parent
+    for stale in hash_path.parent.iterdir():
+        if stale.is_dir() and stale != hash_path:
+            shutil.rmtree(stale, ignore_errors=True)
+            logging.info(f"Removed stale archive cache {stale}")
+
+    logging.info(f"Cached {list(frames.keys())} in {cache_path}")
@@ -1,3 +1,6 @@
+import bisect
+import logging
+
 import pandas as pd
 import numpy as np
 from enum import StrEnum
@@ -40,10 +43,149 @@ def get_derivation_name(deriv_type: DerivationType, deriv_param: int) -> str:
         return f"{deriv_type.value} ({deriv_param})"
 
 
+def get_group_starts(df: pd.DataFrame, group_cols: list[str]) -> np.ndarray:
+    """Return the row positions where each group starts, in a frame sorted by `group_cols`."""
+    if df.empty:
+        return np.zeros(0, dtype=np.int64)
+    changed = np.zeros(len(df.index), dtype=bool)
+    changed[0] = True
+    for col in group_cols:
+        values = df[col].to_numpy()
+        changed[1:] |= values[1:] != values[:-1]
+    return np.flatnonzero(changed)
+
+
+def rolling_sums_shifted(values: np.ndarray, group_starts: np.ndarray, rolling_windows: list[int]) -> dict[int, np.ndarray]:
+    """Sum the previous `rolling_window` values within each group, for every row and window at once.
+
+    Equivalent to, and bit-identical with, the per-group pandas expression
+    ``s.fillna(0).shift(1).rolling(window=rolling_window, min_periods=1).sum()``,
+    so the first row of each group is NaN.
+
+    Rather than differencing a cumulative sum, whose rounding differs from
+    pandas' in the last place for fractional prices, the groups are laid out as
+    rows of a matrix, padded with NaN, and pandas' compensated rolling sum is run
+    one race position at a time across every group together.  The layout is
+    shared by every window.
+
+    Args:
+        values: Values sorted by group, then race.
+        group_starts: Position of the first row of each group, see :func:`get_group_starts`.
+        rolling_windows: Numbers of previous rows to sum.
+
+    Returns:
+        Mapping of window to the rolling sums, aligned with `values`.
+    """
+    num_rows = len(values)
+    if num_rows == 0:
+        return {rolling_window: np.zeros(0) for rolling_window in rolling_windows}
+
+    lengths = np.diff(np.append(group_starts, num_rows))
+    group_ids = np.repeat(np.arange(len(group_starts)), lengths)
+    positions = np.arange(num_rows) - group_starts[group_ids]
+
+    # Shifted by one within each group; NaN both for the first row and for the padding, which pandas skips
+    shifted = np.full((len(group_starts), lengths.max()), np.nan)
+    mask = positions + 1 < lengths[group_ids]
+    shifted[group_ids[mask], positions[mask] + 1] = np.nan_to_num(values[mask], nan=0.0)
+
+    results = {}
+    for rolling_window in rolling_windows:
+        sums = np.full(shifted.shape, np.nan)
+        for i in range(shifted.shape[1]):
+            # A window of one never overlaps the last, so pandas starts each one afresh
+            if i == 0 or rolling_window <= 1:
+                state = _RollingSumState(shifted[:, i])
+            elif i >= rolling_window:
+                state.remove(shifted[:, i - rolling_window])
+            state.add(shifted[:, i])
+            sums[:, i] = state.result()
+        results[rolling_window] = sums[group_ids, positions]
+
+    return results
+
+
+def rolling_sum_shifted(values: np.ndarray, group_starts: np.ndarray, rolling_window: int) -> np.ndarray:
+    """Single window version of :func:`rolling_sums_shifted`."""
+    return rolling_sums_shifted(values, group_starts, [rolling_window])[rolling_window]
+
+
+class _RollingSumState:
+    """Running state of pandas' Kahan-compensated rolling sum, one element per group.
+
+    Mirrors `add_sum`, `remove_sum` and `calc_sum` in pandas' window
+    aggregations, operation for operation, with a minimum of one observation.
+    """
+    def __init__(self, first_values: np.ndarray):
+        num_groups = len(first_values)
+        self.nobs = np.zeros(num_groups, dtype=np.int64)
+        self.sum_x = np.zeros(num_groups)
+        self.compensation_add = np.zeros(num_groups)
+        self.compensation_remove = np.zeros(num_groups)
+        self.num_consecutive_same_value = np.zeros(num_groups, dtype=np.int64)
+        self.prev_value = first_values.copy()
+
+    def add(self, values: np.ndarray):
+        valid = ~np.isnan(values)
+        y = values - self.compensation_add
+        t = self.sum_x + y
+        self.compensation_add = np.where(valid, t - self.sum_x - y, self.compensation_add)
+        self.sum_x = np.where(valid, t, self.sum_x)
+        self.nobs = self.nobs + valid
+        self.num_consecutive_same_value = np.where(
+            valid,
+            np.where(values == self.prev_value, self.num_consecutive_same_value + 1, 1),
+            self.num_consecutive_same_value,
+        )
+        self.prev_value = np.where(valid, values, self.prev_value)
+
+    def remove(self, values: np.ndarray):
+        valid = ~np.isnan(values)
+        y = -values - self.compensation_remove
+        t = self.sum_x + y
+        self.compensation_remove = np.where(valid, t - self.sum_x - y, self.compensation_remove)
+        self.sum_x = np.where(valid, t, self.sum_x)
+        self.nobs = self.nobs - valid
+
+    def result(self) -> np.ndarray:
+        # A run of identical values is returned as an exact multiple, to avoid floating point artifacts
+        result = np.where(self.num_consecutive_same_value >= self.nobs, self.prev_value * self.nobs, self.sum_x)
+        return np.where(self.nobs >= 1, result, np.nan)
+
+
+def get_derivation_columns(rolling_window: int, sums_pts: np.ndarray, sums_prc: np.ndarray) -> dict[str, np.ndarray]:
+    """Return the points, price, ppm and p2pm columns for one window, from its rolling sums."""
+    # Cumulative points are whole numbers
+    cum_pts = np.nan_to_num(sums_pts, nan=0.0).astype(int)
+    cum_pts_float = cum_pts.astype(float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Expected cumulative points-per-money (ppm) = cumulative points divided by cumulative price.
+        # Use the computed cumulative columns to avoid relying on pre-computed input fields.
+        # Leave division-by-zero results as NaN (e.g., 0/0 or x/0 -> inf replaced by NaN).
+        ppm = cum_pts_float / sums_prc
+
+        # Points squared per million enhanced the above to give greater emphasis to points scored, but still reflecting
+        # good value drivers who return a high ppm.
+        # Use an absolute value for one of the points numbers, to ensure that negative points gives a negative squared
+        # value.
+        p2pm = (cum_pts_float * np.abs(cum_pts_float)) / sums_prc
+
+    ppm[np.isinf(ppm)] = np.nan
+    p2pm[np.isinf(p2pm)] = np.nan
+
+    return {
+        get_derivation_name(DerivationType.POINTS_CUMULATIVE, rolling_window): cum_pts,
+        get_derivation_name(DerivationType.PRICE_CUMULATIVE, rolling_window): sums_prc,
+        get_derivation_name(DerivationType.PPM_CUMULATIVE, rolling_window): ppm,
+        get_derivation_name(DerivationType.P2PM_CUMULATIVE, rolling_window): p2pm,
+    }
+
+
 def derivation_cum_tot(
         df_input: pd.DataFrame,
         asset_type: AssetType,
-        rolling_window: int = -1
+        rolling_window: int | list[int] = -1
     ) -> pd.DataFrame:
     """Compute cumulative derived metrics grouped by season and asset.
 
@@ -56,7 +198,7 @@ def derivation_cum_tot(
     ``Constructor``), ``Points``, and ``Price``. The returned dataframe
     will be grouped and sorted by ``Season``, the asset column, and
     ``Race`` and will include additional columns named using
-    :func:`get_derivation_name` for the requested ``rolling_window``.
+    :func:`get_derivation_name` for each requested ``rolling_window``.
 
     Args:
         df_input: Source dataframe containing race-level points and
@@ -64,21 +206,16 @@ def derivation_cum_tot(
         asset_type: An :class:`AssetType` enum value specifying whether
             to aggregate by driver or constructor.
         rolling_window: Number of previous races to include when
-            computing the cumulative totals. Use ``-1`` to include all
-            previous races in the season (default: ``-1``).
+            computing the cumulative totals, or a list of them to compute
+            every window from one grouping of the input. Use ``-1`` to
+            include all previous races in the season (default: ``-1``).
 
     Returns:
         A dataframe with grouped rows and additional cumulative
-        derivation columns for points, price, ppm and p2pm.
+        derivation columns for points, price, ppm and p2pm, for each
+        window in turn.
     """
-    col_pts = get_derivation_name(DerivationType.POINTS_CUMULATIVE, rolling_window)
-    col_prc = get_derivation_name(DerivationType.PRICE_CUMULATIVE, rolling_window)
-    col_ppm = get_derivation_name(DerivationType.PPM_CUMULATIVE, rolling_window)
-    col_p2pm = get_derivation_name(DerivationType.P2PM_CUMULATIVE, rolling_window)
-
-    # If no rolling window, assume total cumulative
-    if rolling_window == -1:
-        rolling_window = len(df_input.index)
+    rolling_windows = rolling_window if isinstance(rolling_window, list) else [rolling_window]
 
     # Just columns of interest
     df = df_input[["Season", "Race", asset_type.value, "Points", "Price"]]
@@ -89,38 +226,205 @@ def derivation_cum_tot(
     # Ensure rows are ordered by the grouping keys and race
     df = df.sort_values(["Season", asset_type.value, "Race"], ignore_index=True)
 
+    # If no rolling window, assume total cumulative
+    window_sizes = {w: len(df_input.index) if w == -1 else w for w in rolling_windows}
+
     # Cumulative totals per group, treating NaN as zero
     # Shift by 1 to exclude current value and sum previous values
-    df[col_pts] = df.groupby(["Season", asset_type.value])["Points"] \
-                        .transform(lambda s: s.fillna(0).shift(1).rolling(window=rolling_window, min_periods=1).sum()) \
-                        .fillna(0) \
-                        .astype(int)  # if you know result should be integer
-
-    df[col_prc] = df.groupby(["Season", asset_type.value])["Price"] \
-                        .transform(lambda s: s.fillna(0.0).shift(1).rolling(window=rolling_window, min_periods=1).sum())  # float
-
-    # Expected cumulative points-per-money (ppm) = cumulative points divided by cumulative price.
-    # Use the computed cumulative columns to avoid relying on pre-computed input fields.
-    # Leave division-by-zero results as NaN (e.g., 0/0 or x/0 -> inf replaced by NaN).
-    df[col_ppm] = (
-        df[col_pts].astype(float)
-        .div(df[col_prc]) 
-        .replace([np.inf, -np.inf], np.nan)
-    )
+    group_starts = get_group_starts(df, ["Season", asset_type.value])
+    sums_pts = rolling_sums_shifted(df["Points"].to_numpy(dtype=float), group_starts, list(window_sizes.values()))
+    sums_prc = rolling_sums_shifted(df["Price"].to_numpy(dtype=float), group_starts, list(window_sizes.values()))
 
-    # Points squared per million enhanced the above to give greater emphasis to points scored, but still reflecting good
-    # value drivers who return a high ppm.
-    # Use an absolute value for one of the points numbers, to ensure that negative points gives a negative squared value.
-    df[col_p2pm] = (
-        (df[col_pts].astype(float) * abs(df[col_pts].astype(float)))
-        .div(df[col_prc]) 
-        .replace([np.inf, -np.inf], np.nan)
-    )
+    for w, window_size in window_sizes.items():
+        for col, values in get_derivation_columns(w, sums_pts[window_size], sums_prc[window_size]).items():
+            df[col] = values
+
+    return df
+
+
+def sum_by_race(df_input: pd.DataFrame, asset_type: AssetType) -> pd.DataFrame:
+    """Total points and price for each asset and race, sorted by season, asset and race.
+
+    The same as ``df.groupby(["Season", asset, "Race"]).sum().reset_index()``
+    over those columns, computed in NumPy, which avoids the groupby's fixed
+    overhead on the few rows of a newly archived race.
+    """
+    flt = df_input[asset_type.value].notna().to_numpy()
+    seasons = df_input["Season"].to_numpy()[flt]
+    races = df_input["Race"].to_numpy()[flt]
+    (asset_codes, assets) = pd.factorize(df_input[asset_type.value].to_numpy()[flt], sort=True)
+
+    order = np.lexsort((races, asset_codes, seasons))
+    (seasons, asset_codes, races) = (seasons[order], asset_codes[order], races[order])
+    firsts = np.ones(len(order), dtype=bool)
+    firsts[1:] = (seasons[1:] != seasons[:-1]) | (asset_codes[1:] != asset_codes[:-1]) | (races[1:] != races[:-1])
+    starts = np.flatnonzero(firsts)
+
+    cols = {"Season": seasons[starts], asset_type.value: assets[asset_codes[starts]], "Race": races[starts]}
+    for col in ["Points", "Price"]:
+        values = np.nan_to_num(df_input[col].to_numpy(dtype=float)[flt][order], nan=0.0)
+        sums = np.add.reduceat(values, starts) if len(starts) > 0 else values
+        cols[col] = sums.astype(df_input[col].dtype) if df_input[col].dtype.kind in "iuf" else sums
+
+    return pd.DataFrame(cols)
+
+
+def derivation_cum_tot_append(
+        df_derived: pd.DataFrame,
+        df_input_new: pd.DataFrame,
+        asset_type: AssetType,
+        rolling_window: int | list[int] = -1,
+        check: bool = False,
+    ) -> pd.DataFrame:
+    """Add newly archived races to a frame already returned by :func:`derivation_cum_tot`.
+
+    Only the assets with a new race are summed again, over their rows for the
+    season, with the same compensated rolling sums as :func:`derivation_cum_tot`,
+    so the new rows are identical to a full recompute whichever races were
+    derived before.
+
+    Args:
+        df_derived: Previously derived frame, for the same `asset_type` and
+            `rolling_window`.
+        df_input_new: Source rows for the new races, as passed to
+            :func:`derivation_cum_tot`.
+        asset_type: An :class:`AssetType` enum value specifying whether
+            to aggregate by driver or constructor.
+        rolling_window: As used to build `df_derived`.
+        check: Also run a full recompute, and raise if it differs at all.
+
+    Returns:
+        The derived frame with the new rows added, sorted as by
+        :func:`derivation_cum_tot`.
+
+    Raises:
+        ValueError: If a new row is not after every race already derived for
+            its asset, or if `check` finds a difference.
+    """
+    rolling_windows = rolling_window if isinstance(rolling_window, list) else [rolling_window]
+    group_cols = ["Season", asset_type.value]
+
+    df_new = sum_by_race(df_input_new, asset_type)
+    races_new = df_new["Race"].to_numpy()
+
+    # Each asset's rows in the derived frame, which is sorted by asset then race
+    group_starts = get_group_starts(df_derived, group_cols)
+    group_ends = np.append(group_starts[1:], len(df_derived.index))
+    group_keys = list(zip(df_derived["Season"].to_numpy()[group_starts], df_derived[asset_type.value].to_numpy()[group_starts]))
+    group_ids = {key: g for g, key in enumerate(group_keys)}
+    races_derived = df_derived["Race"].to_numpy()
+
+    insert_before = np.empty(len(df_new.index))
+    rows_history = []
+    groups_history = set()
+    for i, key in enumerate(zip(df_new["Season"].to_numpy(), df_new[asset_type.value].to_numpy())):
+        g = group_ids.get(key)
+        if g is None:
+            # An asset new to the season, placed where it sorts among the others
+            g_next = bisect.bisect_left(group_keys, key)
+            insert_before[i] = (group_starts[g_next] if g_next < len(group_starts) else len(df_derived.index)) - 0.5
+            continue
+
+        (start, end) = (group_starts[g], group_ends[g])
+        if races_new[i] <= races_derived[end - 1]:
+            raise ValueError(f"New {asset_type.value} rows must come after the races already derived for them")
+        insert_before[i] = end - 0.5
+        # The asset's derived rows are summed again along with its new ones
+        if g not in groups_history:
+            groups_history.add(g)
+            rows_history.extend(range(start, end))
+
+    # Every row of the assets with a new race, laid out by asset then race as derivation_cum_tot does
+    cols_sum = {
+        col: np.concatenate([df_derived[col].to_numpy()[rows_history], df_new[col].to_numpy()])
+        for col in ["Season", asset_type.value, "Race", "Points", "Price"]
+    }
+    asset_codes = pd.factorize(cols_sum[asset_type.value])[0]
+    order_sum = np.lexsort((cols_sum["Race"], asset_codes, cols_sum["Season"]))
+    (seasons, asset_codes) = (cols_sum["Season"][order_sum], asset_codes[order_sum])
+    firsts = np.ones(len(order_sum), dtype=bool)
+    firsts[1:] = (seasons[1:] != seasons[:-1]) | (asset_codes[1:] != asset_codes[:-1])
+    sum_starts = np.flatnonzero(firsts)
+    # Positions of the new rows in the layout, in their own order, as they are added below
+    rows_new = np.argsort(order_sum)[len(rows_history):]
+
+    # As in derivation_cum_tot, no rolling window is one longer than any asset's season
+    window_sizes = {w: len(order_sum) if w == -1 else w for w in rolling_windows}
+    sums_pts = rolling_sums_shifted(cols_sum["Points"].astype(float)[order_sum], sum_starts, list(window_sizes.values()))
+    sums_prc = rolling_sums_shifted(cols_sum["Price"].astype(float)[order_sum], sum_starts, list(window_sizes.values()))
+
+    cols_added = {col: df_new[col].to_numpy() for col in df_new.columns}
+    for w, window_size in window_sizes.items():
+        cols_added.update(get_derivation_columns(w, sums_pts[window_size][rows_new], sums_prc[window_size][rows_new]))
+
+    # Each new row goes after its asset's last derived row, keeping the new rows' own order
+    order = np.argsort(np.concatenate([np.arange(len(df_derived.index)), insert_before]), kind="stable")
+    df = pd.DataFrame({
+        col: np.concatenate([df_derived[col].to_numpy(), cols_added[col].astype(df_derived[col].dtype, copy=False)])[order]
+        for col in df_derived.columns
+    })
+
+    if check:
+        df_full = derivation_cum_tot(df[["Season", "Race", asset_type.value, "Points", "Price"]], asset_type, rolling_window)
+        for col in df.columns:
+            values = df[col].to_numpy()
+            values_full = df_full[col].to_numpy()
+            if not np.array_equal(values, values_full, equal_nan=values.dtype.kind == "f"):
+                raise ValueError(f"Incremental {asset_type.value} derivation differs from a full recompute in {col}")
 
     return df
 
 
-def derivation_cum_tot_driver(df_input: pd.DataFrame, rolling_window: int = -1) -> pd.DataFrame:
+def derivation_cum_tot_update(
+        df_derived: pd.DataFrame,
+        df_input: pd.DataFrame,
+        asset_type: AssetType,
+        rolling_window: int | list[int] = -1,
+    ) -> pd.DataFrame:
+    """Bring a frame returned by :func:`derivation_cum_tot` up to date with the whole of `df_input`.
+
+    Races in `df_input` after the last race derived for their season are added
+    with :func:`derivation_cum_tot_append`.  If the rows of the races already
+    derived have since changed in any way, everything is recomputed instead.
+
+    Args:
+        df_derived: Previously derived frame, for the same `asset_type` and
+            `rolling_window`.
+        df_input: Source rows for every race, as passed to :func:`derivation_cum_tot`.
+        asset_type: An :class:`AssetType` enum value specifying whether
+            to aggregate by driver or constructor.
+        rolling_window: As used to build `df_derived`.
+
+    Returns:
+        The derived frame for all of `df_input`.
+    """
+    df_all = sum_by_race(df_input, asset_type)
+
+    # Rows after the last race derived for their season
+    seasons = df_all["Season"].to_numpy()
+    seasons_derived = df_derived["Season"].to_numpy()
+    races_derived = df_derived["Race"].to_numpy()
+    last_races = np.zeros(len(seasons))
+    for season in np.unique(seasons_derived):
+        last_races[seasons == season] = races_derived[seasons_derived == season].max()
+    flt_new = df_all["Race"].to_numpy() > last_races
+
+    # The races already derived must be exactly as they were
+    unchanged = (~flt_new).sum() == len(df_derived.index) and all(
+        np.array_equal(df_all[col].to_numpy()[~flt_new], df_derived[col].to_numpy())
+        for col in df_all.columns
+    )
+    if not unchanged:
+        logging.info(f"Archived {asset_type.value} races have changed, recomputing derivations")
+        return derivation_cum_tot(df_input, asset_type, rolling_window)
+
+    if not flt_new.any():
+        return df_derived
+
+    return derivation_cum_tot_append(df_derived, df_all[flt_new], asset_type, rolling_window)
+
+
+def derivation_cum_tot_driver(df_input: pd.DataFrame, rolling_window: int | list[int] = -1) -> pd.DataFrame:
     """Convenience wrapper to compute cumulative derivations for drivers.
 
     See :func:`derivation_cum_tot` for behavior and expected input
@@ -130,7 +434,7 @@ def derivation_cum_tot_driver(df_input: pd.DataFrame, rolling_window: int = -1)
     return derivation_cum_tot(df_input, AssetType.DRIVER, rolling_window)
 
 
-def derivation_cum_tot_constructor(df_input: pd.DataFrame, rolling_window: int = -1) -> pd.DataFrame:
+def derivation_cum_tot_constructor(df_input: pd.DataFrame, rolling_window: int | list[int] = -1) -> pd.DataFrame:
     """Convenience wrapper to compute cumulative derivations for constructors.
 
     See :func:`derivation_cum_tot` for behavior and expected input
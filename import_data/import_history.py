@@ -75,22 +75,20 @@ def convert_data_sheet(df_input: pd.DataFrame, season: int, id_cols: list, sheet
     return df_melted
 
 
-def load_archive_sheet(sheet_info: ArchiveSheetInfo, fn: str=_FILE_ARCHIVE_INPUTS) -> pd.DataFrame:
-    """Load and convert a single archive sheet from the Excel archive.
+def prepare_archive_sheet(df_input: pd.DataFrame, sheet_info: ArchiveSheetInfo) -> pd.DataFrame:
+    """Convert a raw archive sheet, as read from Excel, to tidy format.
 
-    The sheet is read using pandas, a common misnamed column `Team` is
-    normalized to `Constructor`, then the sheet is converted to tidy
-    format via `convert_data_sheet`.
+    A common misnamed column `Team` is normalized to `Constructor`, driver
+    names are suffixed with their constructor, then the sheet is converted
+    via `convert_data_sheet`.
 
     Args:
-        sheet_info: `ArchiveSheetInfo` describing which sheet to load.
-        fn: Path to the archive Excel file.
+        df_input: Raw sheet read from the archive workbook.
+        sheet_info: `ArchiveSheetInfo` describing the sheet.
 
     Returns:
-        Converted tidy dataframe for the requested sheet.
+        Converted tidy dataframe for the sheet.
     """
-    df_input = pd.read_excel(fn, sheet_name=sheet_info.sheet_name)
-
     # Patch up column name, if incorrect in input file
     df_input = df_input.rename(columns={"Team": "Constructor"})
 
@@ -98,15 +96,49 @@ def load_archive_sheet(sheet_info: ArchiveSheetInfo, fn: str=_FILE_ARCHIVE_INPUT
     if "Driver" in df_input.columns:
         df_input["Driver"] = df_input["Driver"].astype(str) + "@" + df_input["Constructor"].astype(str)
 
-    df_converted = convert_data_sheet(
+    return convert_data_sheet(
         df_input=df_input,
         season=sheet_info.season,
         id_cols=sheet_info.id_cols,
         sheet_type=sheet_info.sheet_type,
     )
 
-    logging.info(f"Loaded {fn}({sheet_info.sheet_name}) for season {sheet_info.season}, shape: {df_converted.shape}")        
-    return df_converted
+
+def load_archive_sheets(sheet_infos: list[ArchiveSheetInfo], fn: str=_FILE_ARCHIVE_INPUTS) -> dict[str, pd.DataFrame]:
+    """Load and convert several archive sheets, opening the workbook once.
+
+    Every sheet is parsed in a single `read_excel` call, rather than the
+    workbook being re-opened and re-parsed per sheet.
+
+    Args:
+        sheet_infos: `ArchiveSheetInfo` for each sheet to load.
+        fn: Path to the archive Excel file.
+
+    Returns:
+        Mapping of sheet name to converted tidy dataframe.
+    """
+    dfs_input = pd.read_excel(fn, sheet_name=[sheet_info.sheet_name for sheet_info in sheet_infos])
+
+    dfs_converted = {}
+    for sheet_info in sheet_infos:
+        df_converted = prepare_archive_sheet(dfs_input[sheet_info.sheet_name], sheet_info)
+        logging.info(f"Loaded {fn}({sheet_info.sheet_name}) for season {sheet_info.season}, shape: {df_converted.shape}")
+        dfs_converted[sheet_info.sheet_name] = df_converted
+
+    return dfs_converted
+
+
+def load_archive_sheet(sheet_info: ArchiveSheetInfo, fn: str=_FILE_ARCHIVE_INPUTS) -> pd.DataFrame:
+    """Load and convert a single archive sheet from the Excel archive.
+
+    Args:
+        sheet_info: `ArchiveSheetInfo` describing which sheet to load.
+        fn: Path to the archive Excel file.
+
+    Returns:
+        Converted tidy dataframe for the requested sheet.
+    """
+    return load_archive_sheets([sheet_info], fn)[sheet_info.sheet_name]
 
 
 def get_id_cols(asset_type: AssetType) -> list:
@@ -274,6 +306,45 @@ def check_drivers_against_constructors(df_merged_drivers: pd.DataFrame, df_merge
         raise ValueError(f"Mismatched constructors and drivers {diffs}")
 
 
+def load_archive_data(
+    asset_types: list[AssetType],
+    seasons: list[int],
+    fn: str=_FILE_ARCHIVE_INPUTS,
+) -> dict[tuple[AssetType, int], pd.DataFrame]:
+    """Load and merge Points and Price sheets for several asset types and seasons.
+
+    All of the sheets are read from one opening of the workbook.
+
+    Args:
+        asset_types: Asset types to load (driver and/or constructor).
+        seasons: Season years to load.
+        fn: Path to archive Excel file.
+
+    Returns:
+        Mapping of (asset type, season) to the merged dataframe.
+    """
+    archive_sheets = {
+        (asset_type, season): get_archive_sheet_infos(season, asset_type)
+        for asset_type in asset_types
+        for season in seasons
+    }
+    dfs_sheets = load_archive_sheets(
+        [sheet_info for sheet_infos in archive_sheets.values() for sheet_info in sheet_infos.values()],
+        fn,
+    )
+
+    dfs_merged = {}
+    for (asset_type, season), sheet_infos in archive_sheets.items():
+        logging.info(f"Loading season {season} {asset_type.value}...")
+        dfs_merged[(asset_type, season)] = merge_sheet_points_price(
+            dfs_sheets[sheet_infos[DataSheetType.POINTS].sheet_name],
+            dfs_sheets[sheet_infos[DataSheetType.PRICE].sheet_name],
+            asset_type,
+        )
+
+    return dfs_merged
+
+
 def load_archive_data_season(asset_type: AssetType, season: int, fn: str=_FILE_ARCHIVE_INPUTS) -> pd.DataFrame:
     """Load and merge Points and Price sheets for a single season.
 
@@ -285,20 +356,15 @@ def load_archive_data_season(asset_type: AssetType, season: int, fn: str=_FILE_A
     Returns:
         Merged dataframe for the requested season and asset type.
     """
-    archive_sheets = get_archive_sheet_infos(season, asset_type)
-    logging.info(f"Loading season {season} {asset_type.value}...")
-
-    df_points = load_archive_sheet(archive_sheets[DataSheetType.POINTS])
-    df_price = load_archive_sheet(archive_sheets[DataSheetType.PRICE])
-    return merge_sheet_points_price(df_points, df_price, asset_type)
+    return load_archive_data([asset_type], [season], fn)[(asset_type, season)]
 
 
 def load_all_archive_data(asset_type: AssetType, fn: str=_FILE_ARCHIVE_INPUTS) -> pd.DataFrame:
     """Load and concatenate archive data for all known seasons.
 
-    Iterates over seasons declared in `F1_SEASON_CONSTRUCTORS`, loads the
-    merged points/price data for each season and concatenates them into a
-    single dataframe.
+    Loads the merged points/price data for every season declared in
+    `F1_SEASON_CONSTRUCTORS` from one opening of the workbook, and
+    concatenates them into a single dataframe.
 
     Args:
         asset_type: Asset type to load (driver or constructor).
@@ -307,10 +373,5 @@ def load_all_archive_data(asset_type: AssetType, fn: str=_FILE_ARCHIVE_INPUTS) -
     Returns:
         A dataframe containing merged archive data for all seasons.
     """
-    df_all_data = pd.DataFrame()
-
-    for season in F1_SEASON_CONSTRUCTORS.keys():
-        df_merged = load_archive_data_season(asset_type=asset_type, season=season, fn=fn)
-        df_all_data = pd.concat([df_all_data, df_merged], ignore_index=True).reset_index(drop=True)
-
-    return df_all_data
+    dfs_merged = load_archive_data([asset_type], list(F1_SEASON_CONSTRUCTORS.keys()), fn)
+    return pd.concat(dfs_merged.values(), ignore_index=True).reset_index(drop=True)
@@ -0,0 +1,228 @@
+"""linear.solver_enumerate: In-process exact solver for enumerable team selections.
+
+A team selection problem picks a fixed number of drivers and constructors, so
+its whole candidate space is the product of two small combination sets - under
+a million and a half teams for an eleven constructor season. Scoring every one
+of them with NumPy finds the same optimum as CBC without writing an MPS file or
+starting a subprocess for each race.
+"""
+
+import functools
+import logging
+import math
+
+import numpy as np
+from pulp import LpProblem, LpSolver, LpVariable, PULP_CBC_CMD
+from pulp.constants import (
+    LpConstraintEQ,
+    LpConstraintGE,
+    LpConstraintLE,
+    LpInteger,
+    LpMaximize,
+    LpStatusInfeasible,
+    LpStatusOptimal,
+)
+
+from races.first_picks import get_combination_matrix
+
+
+# Largest candidate space scored in one pass, each constraint costs one float per candidate
+# left after pruning
+MAX_CANDIDATES = 5_000_000
+
+# Same order as CBC's own primal tolerance, constraints are already padded for float noise
+FEASIBILITY_TOLERANCE = 1e-7
+
+# Objectives equal to this precision are ties, broken by enumeration order
+OBJECTIVE_PRECISION = 9
+
+
+# Selection matrices with variables fixed by their bounds, a season only has a handful of distinct line-ups
+_FIXED_SELECTION_CACHE_SIZE = 32
+
+
+@functools.cache
+def _get_selection_matrix(num_total: int, num_allowed: int) -> np.ndarray:
+    """Return the 0/1 combination matrix as floats, shared between solves."""
+    matrix = get_combination_matrix(num_total, num_allowed).astype(float)
+    matrix.flags.writeable = False
+    return matrix
+
+
+@functools.lru_cache(maxsize=_FIXED_SELECTION_CACHE_SIZE)
+def _get_fixed_selection_matrix(num_total: int, num_allowed: int, fixed_out: tuple[int, ...], fixed_in: tuple[int, ...]) -> np.ndarray:
+    """Return the rows of the combination matrix which leave out `fixed_out` and include `fixed_in`, shared between solves."""
+    matrix = _get_selection_matrix(num_total, num_allowed)
+    keep = np.ones(matrix.shape[0], dtype=bool)
+    if len(fixed_out) > 0:
+        keep &= ~matrix[:, list(fixed_out)].any(axis=1)
+    if len(fixed_in) > 0:
+        keep &= matrix[:, list(fixed_in)].all(axis=1)
+
+    matrix = matrix[keep]
+    matrix.flags.writeable = False
+    return matrix
+
+
+def get_group_selection_matrix(variables: list[LpVariable], size: int) -> np.ndarray:
+    """Return every selection of `size` of the variables as a 0/1 float matrix, respecting any fixed by their bounds."""
+    fixed_out = tuple(i for i, var in enumerate(variables) if var.upBound == 0)
+    fixed_in = tuple(i for i, var in enumerate(variables) if var.lowBound == 1)
+    if len(fixed_out) == 0 and len(fixed_in) == 0:
+        return _get_selection_matrix(len(variables), size)
+    return _get_fixed_selection_matrix(len(variables), size, fixed_out, fixed_in)
+
+
+def is_selection_variable(var: LpVariable) -> bool:
+    """Return whether a variable is binary, or a binary fixed at 0 or 1 by its bounds."""
+    return var.cat == LpInteger and var.lowBound in (0, 1) and var.upBound in (0, 1) and var.lowBound <= var.upBound
+
+
+def get_selection_groups(lp: LpProblem) -> dict[str, tuple[list[LpVariable], int]] | None:
+    """Split a problem's variables into groups of "choose exactly k" binaries.
+
+    Each group comes from an equality constraint summing its variables with unit
+    coefficients, which is how `StrategyBase` fixes the team sizes.  A binary may
+    be fixed by its bounds, as `StrategyModel` does for assets missing from a race.
+
+    Returns:
+        A mapping of constraint name to (variables, size), or None if any variable
+        is not binary or not covered by exactly one group, in which case the
+        problem cannot be enumerated.
+    """
+    groups = {}
+    grouped = set()
+
+    for name, constraint in lp.constraints.items():
+        if constraint.sense != LpConstraintEQ:
+            continue
+        terms = list(constraint.items())
+        size = -constraint.constant
+        if len(terms) == 0 or any(coef != 1 for _, coef in terms) or size != int(size):
+            continue
+        if any(var.name in grouped for var, _ in terms):
+            return None
+        groups[name] = ([var for var, _ in terms], int(size))
+        grouped.update(var.name for var, _ in terms)
+
+    for var in lp.variables():
+        if (not is_selection_variable(var)) or (var.name not in grouped):
+            return None
+
+    return groups
+
+
+def score_groups(expression, groups: dict, selections: list[np.ndarray]) -> list[np.ndarray]:
+    """Evaluate each group's share of a linear expression, for every selection in that group.
+
+    The constant term is left out, callers add it where it matters.
+    """
+    # Keyed on name, as comparing LpVariables builds a constraint rather than a bool
+    coefs_by_name = {var.name: coef for var, coef in expression.items()}
+    parts = []
+    for (variables, _), selection in zip(groups.values(), selections):
+        coefs = np.array([coefs_by_name.get(var.name, 0.0) for var in variables], dtype=float)
+        parts.append(selection @ coefs)
+    return parts
+
+
+class EnumerationSolver(LpSolver):
+    """PuLP solver which scores every candidate team in-process.
+
+    Only handles problems where every variable is a binary selection within a
+    "choose exactly k" group, i.e. the base `StrategyBase` model plus any linear
+    objective over it. Anything else, such as the auxiliary pair variables of
+    the betting odds concentration measure, is passed to `fallback`.
+
+    Where several teams share the optimal objective CBC's choice between them is
+    arbitrary; here the first in enumeration order is taken.
+
+    Attributes:
+        fallback: Solver used for problems which cannot be enumerated.
+        max_candidates: Largest candidate space to enumerate before falling back.
+    """
+    name = "EnumerationSolver"
+
+    def __init__(self, fallback: LpSolver | None = None, max_candidates: int = MAX_CANDIDATES, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fallback = fallback if fallback is not None else PULP_CBC_CMD(msg=0)
+        self.max_candidates = max_candidates
+
+    def available(self) -> bool:
+        return True
+
+    def copy(self):
+        copied = super().copy()
+        copied.fallback = self.fallback
+        copied.max_candidates = self.max_candidates
+        return copied
+
+    def actualSolve(self, lp: LpProblem, **kwargs) -> int:
+        groups = get_selection_groups(lp)
+        if groups is None:
+            logging.debug(f"Problem {lp.name} is not enumerable, using {self.fallback.name}")
+            return self.fallback.actualSolve(lp, **kwargs)
+
+        if any(math.comb(len(variables), size) > self.max_candidates for variables, size in groups.values()):
+            logging.debug(f"Problem {lp.name} has too many selections in one group, using {self.fallback.name}")
+            return self.fallback.actualSolve(lp, **kwargs)
+
+        selections = [get_group_selection_matrix(variables, size) for variables, size in groups.values()]
+
+        # Every other constraint as "sum of group parts + constant <= 0", an equality becoming a pair of them.
+        # Team sizes are skipped, every candidate meets those by construction.
+        bounds = []
+        for name, constraint in lp.constraints.items():
+            if name in groups:
+                continue
+            parts = score_groups(constraint, groups, selections)
+            if constraint.sense in (LpConstraintLE, LpConstraintEQ):
+                bounds.append((parts, constraint.constant))
+            if constraint.sense in (LpConstraintGE, LpConstraintEQ):
+                bounds.append(([-part for part in parts], -constraint.constant))
+
+        # Drop any selection which breaks a constraint whatever the other groups pick.  The move limit alone
+        # rules out most of the driver combinations, so far fewer candidates need pairing up below.
+        rows = [np.arange(selection.shape[0]) for selection in selections]
+        for parts, constant in bounds:
+            lowest = [part[row].min(initial=np.inf) for part, row in zip(parts, rows)]
+            for i in range(len(rows)):
+                others = sum(lowest[:i]) + sum(lowest[i + 1:])
+                rows[i] = rows[i][parts[i][rows[i]] + others + constant <= FEASIBILITY_TOLERANCE]
+
+        shape = tuple(len(row) for row in rows)
+        if int(np.prod(shape)) == 0:
+            lp.assignStatus(LpStatusInfeasible)
+            return LpStatusInfeasible
+        if int(np.prod(shape)) > self.max_candidates:
+            logging.debug(f"Problem {lp.name} has {int(np.prod(shape))} candidates, using {self.fallback.name}")
+            return self.fallback.actualSolve(lp, **kwargs)
+
+        feasible = np.ones(int(np.prod(shape)), dtype=bool)
+        for parts, constant in bounds:
+            feasible &= self._combine(parts, rows) + constant <= FEASIBILITY_TOLERANCE
+
+        if not feasible.any():
+            lp.assignStatus(LpStatusInfeasible)
+            return LpStatusInfeasible
+
+        objective = np.round(self._combine(score_groups(lp.objective, groups, selections), rows), OBJECTIVE_PRECISION)
+        if lp.sense != LpMaximize:
+            objective = -objective
+        objective[~feasible] = -np.inf
+        best = np.unravel_index(int(np.argmax(objective)), shape)
+
+        for (variables, _), selection, row, position in zip(groups.values(), selections, rows, best):
+            for var, picked in zip(variables, selection[row[position]]):
+                var.varValue = float(picked)
+
+        lp.assignStatus(LpStatusOptimal)
+        return LpStatusOptimal
+
+    @classmethod
+    def _combine(cls, parts: list[np.ndarray], rows: list[np.ndarray]) -> np.ndarray:
+        """Sum group parts over every pairing of the remaining rows, flattened in enumeration order."""
+        total = np.zeros(1)
+        for part, row in zip(parts, rows):
+            total = np.add.outer(total, part[row]).ravel()
+        return total
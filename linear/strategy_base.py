@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
-from pulp import LpAffineExpression, LpProblem, LpVariable, lpSum, PULP_CBC_CMD
+from pulp import LpAffineExpression, LpConstraint, LpMaximize, LpProblem, LpSolver, LpVariable, lpSum, PULP_CBC_CMD
+from pulp.constants import LpConstraintEQ, LpConstraintGE, LpConstraintLE
 from enum import Enum, auto
 import numpy as np
 
 
 COST_PROHIBITIVE = 999999.99  # A really big float number that we can never afford
+COST_EPSILON = 0.0000001  # Budget slack against floating point issues in the prices
+_CUTOFF_TOLERANCE = 0.000001  # Objective slack below keeping the team, against summation order in the solvers
 
 
 class VarType(Enum):
@@ -17,6 +20,7 @@ class VarType(Enum):
     OptimiseMax = auto()
     DrsDriver = auto()
     Concentration = auto()
+    ObjectiveCutoff = auto()
 
 
 class StrategyBase(ABC):
@@ -53,6 +57,11 @@ class StrategyBase(ABC):
         Race number within season
     season_year : int
         Season year in full e.g. 2025
+    solver : LpSolver | None
+        Solver used by `execute`, defaults to CBC.  `EnumerationSolver` solves in-process.
+    warm_start : bool
+        Start the solve from the current team where it can be kept, see `get_incumbent`,
+        off by default.  A CBC solver passed in needs `warmStart=True` to use it.
     """
     def __init__(
         self,
@@ -68,6 +77,8 @@ class StrategyBase(ABC):
         derivs_assets: dict[str, dict[str, float]],  # First dict is by derivation name
         race_num: int,
         season_year: int,
+        solver: LpSolver | None = None,
+        warm_start: bool = False,
     ) -> None:
         # Check team constructors are available in list of all constructors
         for i in team_constructors:
@@ -133,6 +144,8 @@ class StrategyBase(ABC):
         self._max_moves = max_moves
         self._race_num = race_num
         self._season_year = season_year
+        self._solver = solver
+        self._warm_start = warm_start
 
         # Collections to support constraints and variables
         self._lp_variables = {}
@@ -192,6 +205,44 @@ class StrategyBase(ABC):
                 selection_dict[i] = 0
         return selection_dict
 
+    def get_race_num(self) -> int:
+        """Return the race number within the season."""
+        return self._race_num
+
+    def get_team_drivers(self) -> list[str]:
+        """Return the drivers currently on the team."""
+        return self._team_drivers
+
+    def get_team_constructors(self) -> list[str]:
+        """Return the constructors currently on the team."""
+        return self._team_constructors
+
+    def get_available_drivers(self) -> list[str]:
+        """Return the drivers available for selection."""
+        return self._all_available_drivers
+
+    def get_available_constructors(self) -> list[str]:
+        """Return the constructors available for selection."""
+        return self._all_available_constructors
+
+    def get_price(self, asset: str) -> float:
+        """Return an asset's price, `COST_PROHIBITIVE` for a team driver who is no longer available.
+
+        Raises
+        ------
+        KeyError
+            If the asset is neither available nor on the team.
+        """
+        return self._prices_assets[asset]
+
+    def get_max_cost(self) -> float:
+        """Return the budget available for the team."""
+        return self._max_cost
+
+    def get_max_moves(self) -> int:
+        """Return the number of asset moves allowed."""
+        return self._max_moves
+
     def initialise(self):
         """Create LP variables and base constraints common to strategies.
 
@@ -220,7 +271,7 @@ class StrategyBase(ABC):
 
         # Variable and constraint for total cost
         self._lp_variables[VarType.TotalCost] = lpSum(cost_drivers + cost_constructors)
-        self._lp_constraints[VarType.TotalCost] = self._lp_variables[VarType.TotalCost] <= (self._max_cost + 0.0000001)  # Add a small epsilon to avoid floating point issues
+        self._lp_constraints[VarType.TotalCost] = self._lp_variables[VarType.TotalCost] <= (self._max_cost + COST_EPSILON)
 
         # Convenience variable for unused budget, we don't need a constraint for this
         self._lp_variables[VarType.UnusedBudget] = self._max_cost - self._lp_variables[VarType.TotalCost]
@@ -237,28 +288,86 @@ class StrategyBase(ABC):
         self._lp_variables[VarType.TeamMoves] = team_size_total - lpSum(driver_moves + constructor_moves)
         self._lp_constraints[VarType.TeamMoves] = self._lp_variables[VarType.TeamMoves] <= self._max_moves
 
-    def execute(self) -> LpProblem:
+    def execute(self, model: "StrategyModel | None" = None) -> LpProblem:
         """Build and solve the LP problem returning the solved LpProblem.
 
         The concrete strategy must implement `get_problem` to provide the objective
         and any additional strategy-specific constraints.
+
+        If `model` is given and the strategy's objective is linear in the selections,
+        see `get_objective`, the model is updated for this race and solved instead of
+        building a new problem.
+
+        Unless warm starts are turned off, the current team is given to the solver as
+        its starting solution, and no team scoring worse than keeping it is considered.
         """
+        objective = self.get_objective()
+        incumbent = self.get_incumbent()
+        cutoff = self.get_cutoff(objective, incumbent)
+        solver = self._solver if self._solver is not None else PULP_CBC_CMD(msg=0, warmStart=self._warm_start)
+
+        if model is not None and objective is not None:
+            model.update(self, objective, cutoff)
+            self.set_initial_values(incumbent)
+            solver.solve(model.problem)
+            return model.problem
+
         # Base initialisation and constraints
         self.initialise()
 
         # Create the model, add the objective and constraints
-        model = self.get_problem()
+        problem = self.get_problem()
         # Make sure objective is added
-        if model.objective is None:
+        if problem.objective is None:
             raise ValueError("Objective function not set in the problem")
-        
+
+        if cutoff is not None:
+            self._lp_constraints[VarType.ObjectiveCutoff] = lpSum(
+                [objective.get(i, 0.0) * v for i, v in self._lp_variables[VarType.TeamDrivers].items()]
+                + [objective.get(i, 0.0) * v for i, v in self._lp_variables[VarType.TeamConstructors].items()]
+            ) >= cutoff
+
         # Add the constraints
         for constraint in self._lp_constraints.values():
-            model += constraint
+            problem += constraint
 
         # Solve and return the model
-        PULP_CBC_CMD(msg=0).solve(model)
-        return model
+        self.set_initial_values(incumbent)
+        solver.solve(problem)
+        return problem
+
+    def get_incumbent(self) -> set[str] | None:
+        """Return the current team if it is a feasible selection for this race, to warm start the solve from.
+
+        None if warm starts are turned off, or the team cannot be kept as it is: an asset
+        is no longer available, or it no longer fits the budget.
+        """
+        if not self._warm_start:
+            return None
+
+        team = self._team_drivers + self._team_constructors
+        if any(i not in self._all_available_drivers for i in self._team_drivers) \
+                or any(i not in self._all_available_constructors for i in self._team_constructors):
+            return None
+        if sum(self._prices_assets[i] for i in team) > self._max_cost + COST_EPSILON:
+            return None
+
+        return set(team)
+
+    @classmethod
+    def get_cutoff(cls, objective: dict[str, float] | None, incumbent: set[str] | None) -> float | None:
+        """Return the lowest objective worth considering, that of keeping the incumbent, or None if unknown."""
+        if objective is None or incumbent is None:
+            return None
+        return sum(objective.get(i, 0.0) for i in incumbent) - _CUTOFF_TOLERANCE
+
+    def set_initial_values(self, incumbent: set[str] | None):
+        """Set the selection variables to the incumbent team, as the solver's starting solution."""
+        if incumbent is None:
+            return
+        for asset_type in [VarType.TeamDrivers, VarType.TeamConstructors]:
+            for i, var in self._lp_variables[asset_type].items():
+                var.setInitialValue(1 if i in incumbent else 0)
 
     @abstractmethod
     def get_problem(self) -> LpProblem:
@@ -269,12 +378,124 @@ class StrategyBase(ABC):
         """
         pass
 
+    def get_objective(self) -> dict[str, float] | None:
+        """Return the objective being maximised as a coefficient per available asset.
+
+        Used to solve with a `StrategyModel`, and to cut off teams worse than keeping
+        the current one.  The default implementation returns None, meaning the objective
+        or constraints of `get_problem` cannot be expressed this way, and a new problem
+        is built without a cutoff.
+        """
+        return None
+
     def get_drs_driver(self) -> str:
-        """Return the driver chosen for DRS based on strategy-specific logic.
+        """Return the driver chosen for DRS from the solved team, see `select_drs_driver`."""
+        variables = self._lp_variables.get(VarType.TeamDrivers, {})
+        selected = {d for d, v in variables.items() if (v.value() or 0.0) > 0}
+        return self.select_drs_driver(selected)
+
+    def select_drs_driver(self, selected_drivers: set[str]) -> str:
+        """Return the driver chosen for DRS from the selected drivers, based on strategy-specific logic.
 
         The default implementation returns an empty string to indicate no explicit
-        choice; subclasses may override to choose a specific driver from the selected team.
+        choice; subclasses may override to choose a specific driver from the selection.
         """
         # By default, strategy won't select a DRS driver, so the team point scoring will just select the highest
         # value driver for DRS.
         return ""
+
+
+class StrategyModel:
+    """LP model for one team's season, kept across races rather than rebuilt for each one.
+
+    Holds the same variables and constraints as `StrategyBase.initialise`, over every
+    driver and constructor in the season. Only prices, the current team, move and
+    budget limits and the objective change between races, so `update` patches those
+    coefficients in place. Assets not available for a race are fixed out by their
+    upper bound, which is how a team driver who has left the grid is dropped.
+    The objective cutoff is a copy of the objective, switched off by zeroing it
+    when there is no incumbent, as constraints cannot be removed from a problem.
+
+    Attributes:
+        problem: The LpProblem, solved in place by `StrategyBase.execute`.
+        drivers: Selection variable for each driver in the season.
+        constructors: Selection variable for each constructor in the season.
+    """
+    def __init__(self, drivers: list[str], constructors: list[str], name: str = "StrategyModel"):
+        self.problem = LpProblem(name, LpMaximize)
+        self.drivers = LpVariable.dicts('driver', drivers, cat="Binary")
+        self.constructors = LpVariable.dicts('constructor', constructors, cat="Binary")
+        all_variables = list(self.drivers.values()) + list(self.constructors.values())
+
+        # Every coefficient is patched by update, the structure is all that is built here
+        self.problem += LpAffineExpression([(v, 0.0) for v in all_variables])
+        self._total_cost = LpAffineExpression([(v, 0.0) for v in all_variables])
+        self._unused_budget = LpAffineExpression([(v, 0.0) for v in all_variables])
+        self._team_moves = LpAffineExpression([(v, 0.0) for v in all_variables])
+        self._cutoff = LpAffineExpression([(v, 0.0) for v in all_variables])
+
+        self._constraints = {
+            VarType.TotalCost: LpConstraint(self._total_cost, LpConstraintLE, name="total_cost", rhs=0.0),
+            VarType.TeamDrivers: LpConstraint(lpSum(self.drivers.values()), LpConstraintEQ, name="team_drivers", rhs=0.0),
+            VarType.TeamConstructors: LpConstraint(lpSum(self.constructors.values()), LpConstraintEQ, name="team_constructors", rhs=0.0),
+            VarType.TeamMoves: LpConstraint(self._team_moves, LpConstraintLE, name="team_moves", rhs=0.0),
+            VarType.ObjectiveCutoff: LpConstraint(self._cutoff, LpConstraintGE, name="objective_cutoff", rhs=0.0),
+        }
+        for constraint in self._constraints.values():
+            self.problem += constraint
+
+        # Patch coefficients through the expressions the problem's constraints hold, not those they were built from,
+        # which PuLP 2 copied
+        self._total_cost = self._constraints[VarType.TotalCost].expr
+        self._team_moves = self._constraints[VarType.TeamMoves].expr
+        self._cutoff = self._constraints[VarType.ObjectiveCutoff].expr
+
+    def update(self, strategy: StrategyBase, objective: dict[str, float], cutoff: float | None = None):
+        """Set the model up for a strategy's race, and point the strategy's LP variables at it.
+
+        `cutoff` is the lowest objective to consider, None for no limit.
+
+        Raises
+        ------
+        ValueError
+            If an available or team asset is not in the model.
+        """
+        for assets, variables in [
+            (strategy._all_available_drivers + strategy._team_drivers, self.drivers),
+            (strategy._all_available_constructors + strategy._team_constructors, self.constructors),
+        ]:
+            for i in assets:
+                if i not in variables:
+                    raise ValueError(f"Asset {i} is not in the model")
+
+        available = set(strategy._all_available_drivers).union(strategy._all_available_constructors)
+        team = set(strategy._team_drivers).union(strategy._team_constructors)
+        team_size_drivers = len(strategy._team_drivers)
+        team_size_constructors = len(strategy._team_constructors)
+        team_size_total = team_size_drivers + team_size_constructors
+
+        for i, var in list(self.drivers.items()) + list(self.constructors.items()):
+            is_available = i in available
+            var.upBound = 1 if is_available else 0
+            price = strategy._prices_assets[i] if is_available else 0.0
+            self._total_cost[var] = price
+            self._unused_budget[var] = -price
+            self._team_moves[var] = -1 if i in team else 0
+            self.problem.objective[var] = objective.get(i, 0.0) if is_available else 0.0
+            self._cutoff[var] = self.problem.objective[var] if cutoff is not None else 0.0
+
+        self._constraints[VarType.TotalCost].changeRHS(strategy._max_cost + COST_EPSILON)
+        self._unused_budget.constant = strategy._max_cost
+        self._constraints[VarType.TeamDrivers].changeRHS(team_size_drivers)
+        self._constraints[VarType.TeamConstructors].changeRHS(team_size_constructors)
+        self._team_moves.constant = team_size_total
+        self._constraints[VarType.TeamMoves].changeRHS(strategy._max_moves - team_size_total)
+        self._constraints[VarType.ObjectiveCutoff].changeRHS(cutoff if cutoff is not None else 0.0)
+
+        strategy._lp_variables[VarType.TeamDrivers] = self.drivers
+        strategy._lp_variables[VarType.TeamConstructors] = self.constructors
+        strategy._lp_variables[VarType.TotalCost] = self._total_cost
+        strategy._lp_variables[VarType.UnusedBudget] = self._unused_budget
+        strategy._lp_variables[VarType.TeamMoves] = self._team_moves
+        strategy._lp_variables[VarType.OptimiseMax] = self.problem.objective
+        strategy._lp_constraints = dict(self._constraints)
@@ -0,0 +1,282 @@
+"""linear.strategy_batch: Solve one race for many teams at once.
+
+Every team running a strategy through the same race picks from the same
+candidate teams, at the same prices and for the same objective; only the
+current team, the budget and the moves allowed differ.  So the driver and
+constructor selections are scored once for the race, then each team only pairs
+up the selections within its move limit.  Teams whose move limit cannot bind,
+as with the unlimited moves chip, are decided by budget alone, so they share
+one pass over every candidate sorted by cost.
+
+Candidates are scored and compared exactly as `EnumerationSolver` does for a
+`StrategyModel`, so each team gets the same selection, ties included, as
+calling `execute` on its strategy with that model.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from common import AssetType
+from linear.solver_enumerate import (
+    FEASIBILITY_TOLERANCE,
+    OBJECTIVE_PRECISION,
+    get_group_selection_matrix,
+    get_selection_groups,
+    score_groups,
+)
+from linear.strategy_base import COST_EPSILON, StrategyBase, StrategyModel
+
+
+# Teams scored against the driver and constructor selections in one matrix product
+_TEAM_CHUNK_SIZE = 256
+
+
+class BatchSelection(NamedTuple):
+    """One team's solve from `execute_batch`, as read off the LP variables after `StrategyBase.execute`.
+
+    Assets are in the model's order, as they would be read off its variables.
+    """
+    drivers: list[str]
+    constructors: list[str]
+    unused_budget: float
+    moves: float
+    drs_driver: str
+
+
+class _RaceCandidates(NamedTuple):
+    """Driver and constructor selections available in a race, scored once for every team."""
+    names: dict[AssetType, list[str]]
+    selections: dict[AssetType, np.ndarray]
+    prices: dict[AssetType, np.ndarray]
+    costs: dict[AssetType, np.ndarray]
+    objectives: dict[AssetType, np.ndarray]
+
+
+def execute_batch(strategies: list[StrategyBase], model: StrategyModel) -> list[BatchSelection | None]:
+    """Solve the same race for every strategy, returning each team's selection, or None if it has none.
+
+    The strategies must be one class, for one race, differing only in their teams, budgets
+    and moves, as `factory_strategies` builds them.  Each result matches what `execute(model)`
+    selects with `EnumerationSolver`.  Afterwards `model` is set up for the first strategy's
+    race, without its cutoff, and left unsolved.
+
+    Raises
+    ------
+    ValueError
+        If the strategies do not share a race, or their objective is not linear, see `get_objective`.
+    """
+    if len(strategies) == 0:
+        return []
+
+    base = strategies[0]
+    objective = base.get_objective()
+    if objective is None:
+        raise ValueError(f"{type(base).__name__} has no linear objective to solve in a batch")
+    for strategy in strategies[1:]:
+        _verify_same_race(base, objective, strategy)
+
+    candidates = _get_race_candidates(base, objective, model)
+    results: list[BatchSelection | None] = [None] * len(strategies)
+
+    # Teams whose moves cannot bind all rank the same candidates, only their budgets differ
+    unlimited = [i for i, s in enumerate(strategies) if not _is_moves_limited(s)]
+    if len(unlimited) > 0:
+        best = _get_best_within_budget(candidates, [strategies[i] for i in unlimited])
+        for i, picks in zip(unlimited, best):
+            results[i] = _get_batch_selection(strategies[i], candidates, picks)
+
+    limited = [i for i, s in enumerate(strategies) if _is_moves_limited(s)]
+    for start in range(0, len(limited), _TEAM_CHUNK_SIZE):
+        chunk = limited[start:start + _TEAM_CHUNK_SIZE]
+        kept = _get_kept_counts(candidates, [strategies[i] for i in chunk])
+        for j, i in enumerate(chunk):
+            picks = _get_best_within_moves(candidates, strategies[i], kept[AssetType.DRIVER][:, j], kept[AssetType.CONSTRUCTOR][:, j])
+            results[i] = _get_batch_selection(strategies[i], candidates, picks)
+
+    return results
+
+
+def _is_moves_limited(strategy: StrategyBase) -> bool:
+    """Return whether a team's move limit can bind, short of changing every asset."""
+    return strategy.get_max_moves() < len(strategy.get_team_drivers()) + len(strategy.get_team_constructors())
+
+
+def _verify_same_race(base: StrategyBase, objective: dict[str, float], strategy: StrategyBase):
+    race_num = base.get_race_num()
+    if type(strategy) is not type(base) or strategy.get_race_num() != race_num:
+        raise ValueError(f"Strategy for race {strategy.get_race_num()} cannot be batched with race {race_num}")
+    if strategy.get_available_drivers() != base.get_available_drivers() \
+            or strategy.get_available_constructors() != base.get_available_constructors():
+        raise ValueError(f"Strategies for race {race_num} do not share their available assets")
+
+    strategy_objective = strategy.get_objective()
+    for i in base.get_available_drivers() + base.get_available_constructors():
+        if strategy.get_price(i) != base.get_price(i) or strategy_objective.get(i, 0.0) != objective.get(i, 0.0):
+            raise ValueError(f"Strategies for race {race_num} do not share the price and objective of {i}")
+
+
+def _get_race_candidates(base: StrategyBase, objective: dict[str, float], model: StrategyModel) -> _RaceCandidates:
+    """Score the race's selections through the model, exactly as `EnumerationSolver` would."""
+    model.update(base, objective)
+    groups = get_selection_groups(model.problem)
+    selections = [get_group_selection_matrix(variables, size) for variables, size in groups.values()]
+    costs = score_groups(model.problem.constraints["total_cost"], groups, selections)
+    objectives = score_groups(model.problem.objective, groups, selections)
+
+    asset_types = [AssetType.DRIVER, AssetType.CONSTRUCTOR]
+    names = {AssetType.DRIVER: list(model.drivers), AssetType.CONSTRUCTOR: list(model.constructors)}
+    available = set(base.get_available_drivers()).union(base.get_available_constructors())
+    prices = {
+        asset_type: np.array([base.get_price(i) if i in available else 0.0 for i in names[asset_type]])
+        for asset_type in asset_types
+    }
+    return _RaceCandidates(
+        names=names,
+        selections=dict(zip(asset_types, selections)),
+        prices=prices,
+        costs=dict(zip(asset_types, costs)),
+        objectives=dict(zip(asset_types, objectives)),
+    )
+
+
+def _get_kept_counts(candidates: _RaceCandidates, strategies: list[StrategyBase]) -> dict[AssetType, np.ndarray]:
+    """Return how many of each team's assets every selection keeps, one column per team."""
+    kept = {}
+    for asset_type, get_team in [(AssetType.DRIVER, StrategyBase.get_team_drivers), (AssetType.CONSTRUCTOR, StrategyBase.get_team_constructors)]:
+        position = {name: j for j, name in enumerate(candidates.names[asset_type])}
+        in_team = np.zeros((len(position), len(strategies)))
+        for k, strategy in enumerate(strategies):
+            for i in get_team(strategy):
+                if i not in position:
+                    raise ValueError(f"Asset {i} is not in the model")
+                in_team[position[i], k] = 1.0
+        kept[asset_type] = np.rint(candidates.selections[asset_type] @ in_team).astype(int)
+    return kept
+
+
+def _get_best_within_moves(
+    candidates: _RaceCandidates,
+    strategy: StrategyBase,
+    kept_drivers: np.ndarray,
+    kept_constructors: np.ndarray,
+) -> tuple[int, int] | None:
+    """Return the best (driver, constructor) selection rows for a team, pairing only those within its moves."""
+    team_size_drivers = len(strategy.get_team_drivers())
+    team_size_constructors = len(strategy.get_team_constructors())
+    max_moves = strategy.get_max_moves()
+    driver_moves = team_size_drivers - kept_drivers
+    constructor_moves = team_size_constructors - kept_constructors
+
+    # Every pairing of a selection making `moves` driver changes with one making few enough constructor changes
+    pairs = []
+    for moves in range(min(max_moves, team_size_drivers) + 1):
+        driver_rows = np.flatnonzero(driver_moves == moves)
+        constructor_rows = np.flatnonzero(constructor_moves <= max_moves - moves)
+        pairs.append((np.repeat(driver_rows, len(constructor_rows)), np.tile(constructor_rows, len(driver_rows))))
+    driver_rows = np.concatenate([d for d, _ in pairs])
+    constructor_rows = np.concatenate([c for _, c in pairs])
+
+    cost = candidates.costs[AssetType.DRIVER][driver_rows] + candidates.costs[AssetType.CONSTRUCTOR][constructor_rows]
+    feasible = cost + _get_cost_constant(strategy) <= FEASIBILITY_TOLERANCE
+    if not feasible.any():
+        return None
+    (driver_rows, constructor_rows) = (driver_rows[feasible], constructor_rows[feasible])
+
+    objective = np.round(
+        candidates.objectives[AssetType.DRIVER][driver_rows] + candidates.objectives[AssetType.CONSTRUCTOR][constructor_rows],
+        OBJECTIVE_PRECISION,
+    )
+    # Ties go to the first in enumeration order, drivers before constructors
+    tied = np.flatnonzero(objective == objective.max())
+    num_constructor_rows = len(candidates.costs[AssetType.CONSTRUCTOR])
+    best = tied[np.argmin(driver_rows[tied] * num_constructor_rows + constructor_rows[tied])]
+    return (int(driver_rows[best]), int(constructor_rows[best]))
+
+
+def _get_best_within_budget(candidates: _RaceCandidates, strategies: list[StrategyBase]) -> list[tuple[int, int] | None]:
+    """Return the best (driver, constructor) selection rows for teams with any number of moves.
+
+    Every candidate is sorted by cost, and the best of each prefix found in one pass, so a
+    team only has to find how many candidates its budget affords.
+    """
+    num_constructor_rows = len(candidates.costs[AssetType.CONSTRUCTOR])
+    cost = np.add.outer(candidates.costs[AssetType.DRIVER], candidates.costs[AssetType.CONSTRUCTOR]).ravel()
+    objective = np.round(
+        np.add.outer(candidates.objectives[AssetType.DRIVER], candidates.objectives[AssetType.CONSTRUCTOR]).ravel(),
+        OBJECTIVE_PRECISION,
+    )
+
+    order = np.argsort(cost, kind="stable")
+    cost = cost[order]
+    objective = objective[order]
+    num_candidates = len(order)
+
+    # Best of each prefix, ties to the first in enumeration order.  Each new best starts a segment, and the
+    # candidates within it which tie that best are the only ones able to take over, by coming earlier.
+    best_so_far = np.maximum.accumulate(objective)
+    is_new_best = np.ones(num_candidates, dtype=bool)
+    is_new_best[1:] = objective[1:] > best_so_far[:-1]
+    is_tie = np.zeros(num_candidates, dtype=bool)
+    is_tie[1:] = objective[1:] == best_so_far[:-1]
+    segment = np.cumsum(is_new_best)
+    # Offset by segment, so a running minimum starts again at each new best
+    offset = segment * (num_candidates + 1)
+    position = np.where(is_new_best | is_tie, order, num_candidates) - offset
+    best_in_prefix = np.minimum.accumulate(position) + offset
+
+    results = []
+    for strategy in strategies:
+        constant = _get_cost_constant(strategy)
+        affordable = int(np.searchsorted(cost, FEASIBILITY_TOLERANCE - constant, side="right"))
+        # The search is on rearranged float sums, so settle the edge on the same test as the solver
+        while affordable < num_candidates and cost[affordable] + constant <= FEASIBILITY_TOLERANCE:
+            affordable += 1
+        while affordable > 0 and cost[affordable - 1] + constant > FEASIBILITY_TOLERANCE:
+            affordable -= 1
+
+        if affordable == 0:
+            results.append(None)
+        else:
+            best = int(best_in_prefix[affordable - 1])
+            results.append((best // num_constructor_rows, best % num_constructor_rows))
+    return results
+
+
+def _get_cost_constant(strategy: StrategyBase) -> float:
+    """Return the budget constraint's constant for a team, as `StrategyModel.update` sets it."""
+    return -(strategy.get_max_cost() + COST_EPSILON)
+
+
+def _get_batch_selection(
+    strategy: StrategyBase,
+    candidates: _RaceCandidates,
+    picks: tuple[int, int] | None,
+) -> BatchSelection | None:
+    """Return a team's selection as `execute` would leave it in the model's variables, DRS driver included."""
+    if picks is None:
+        return None
+
+    selected = {}
+    unused_budget = strategy.get_max_cost()
+    for asset_type, row in zip([AssetType.DRIVER, AssetType.CONSTRUCTOR], picks):
+        picked = candidates.selections[asset_type][row]
+        selected[asset_type] = [i for i, p in zip(candidates.names[asset_type], picked) if p == 1]
+        # Summed in the model's order, as the unused budget expression evaluates
+        for price in candidates.prices[asset_type][picked == 1]:
+            unused_budget -= price
+
+    # Team size less the team's assets kept, as the team moves expression evaluates
+    team = set(strategy.get_team_drivers()).union(strategy.get_team_constructors())
+    moves = float(len(strategy.get_team_drivers()) + len(strategy.get_team_constructors()))
+    for i in selected[AssetType.DRIVER] + selected[AssetType.CONSTRUCTOR]:
+        if i in team:
+            moves -= 1.0
+
+    return BatchSelection(
+        drivers=selected[AssetType.DRIVER],
+        constructors=selected[AssetType.CONSTRUCTOR],
+        unused_budget=unused_budget,
+        moves=moves,
+        drs_driver=strategy.select_drs_driver(set(selected[AssetType.DRIVER])),
+    )
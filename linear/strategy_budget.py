@@ -8,6 +8,9 @@ class StrategyMaxBudget(StrategyBase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+    def get_objective(self) -> dict[str, float]:
+        return self._prices_assets
+
     def get_problem(self) -> LpProblem:
         """Construct an LP problem that maximises the total cost (spend) of the selected team."""
         problem = LpProblem(self.__class__.__name__, LpMaximize)
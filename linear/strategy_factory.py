@@ -1,52 +1,97 @@
+from pulp import LpSolver
+
 from common import AssetType
-from linear.strategy_base import StrategyBase
-from races.season import Race
+from linear.strategy_base import StrategyBase, StrategyModel
+from races.season import Race, Season
 from races.team import Team
 
 
-def factory_strategy(race: Race, race_prev: Race, team: Team, strategy: type[StrategyBase], max_moves, season_year: int) -> StrategyBase:
+def factory_strategy(
+    race: Race,
+    race_prev: Race,
+    team: Team,
+    strategy: type[StrategyBase],
+    max_moves,
+    season_year: int,
+    solver: LpSolver | None = None,
+    warm_start: bool = False,
+) -> StrategyBase:
     """Create and return a configured instance of `strategy` for a given race and team.
 
-    Gathers current prices and derivations from the `race` object and computes the
+    Gathers current prices and derivations from the `race` object's arrays and computes the
     budget available using `team.total_budget` (using `race_prev` if needed).
+    `solver` and `warm_start` are passed through to the strategy, a None solver leaves it on CBC.
     """
-    team_drivers = team.assets[AssetType.DRIVER]
-    team_constructors = team.assets[AssetType.CONSTRUCTOR]
-    all_available_drivers = list(race.drivers.keys())
-    all_available_constructors = list(race.constructors.keys())
-    all_available_driver_pairs = {driver: race.drivers[driver].constructor for driver in race.drivers}
-    prev_available_driver_pairs = {driver: race_prev.drivers[driver].constructor for driver in race_prev.drivers}
-    max_cost = team.total_budget(race, race_prev)  # Previous race, in case current race has no driver valuation
-
-    all_derivs = set()
-    prices_assets = {}
-
-    for driver in race.drivers.values():
-        prices_assets[driver.driver] = driver.price
-        all_derivs.update(driver.derivs.keys())
-    for constructor in race.constructors.values():
-        prices_assets[constructor.constructor] = constructor.price
-        all_derivs.update(constructor.derivs.keys())
-
-    derivs_assets = {}
-    for deriv in all_derivs:
-        derivs_assets[deriv] = {}
-        for driver in race.drivers.values():
-            derivs_assets[deriv][driver.driver] = driver.derivs[deriv]
-        for constructor in race.constructors.values():
-            derivs_assets[deriv][constructor.constructor] = constructor.derivs[deriv]
-
     return strategy(
-        team_drivers=team_drivers,
-        team_constructors=team_constructors,
-        all_available_drivers=all_available_drivers,
-        all_available_constructors=all_available_constructors,
-        all_available_driver_pairs=all_available_driver_pairs,
-        prev_available_driver_pairs=prev_available_driver_pairs,
-        max_cost=max_cost,
+        team_drivers=team.assets[AssetType.DRIVER],
+        team_constructors=team.assets[AssetType.CONSTRUCTOR],
+        max_cost=team.total_budget(race, race_prev),  # Previous race, in case current race has no driver valuation
         max_moves=max_moves,
-        prices_assets=prices_assets,
-        derivs_assets=derivs_assets,
-        race_num=race.race,
         season_year=season_year,
+        solver=solver,
+        warm_start=warm_start,
+        **get_race_inputs(race, race_prev),
     )
+
+
+def factory_strategies(
+    race: Race,
+    race_prev: Race,
+    teams: list[Team],
+    strategy: type[StrategyBase],
+    max_moves: list[int],
+    season_year: int,
+) -> list[StrategyBase]:
+    """Create an instance of `strategy` for each of `teams` in the same race, for `execute_batch`.
+
+    As `factory_strategy`, but the race's prices and derivations are gathered once and
+    shared by every instance.  `max_moves` holds each team's allowed moves.
+    """
+    race_inputs = get_race_inputs(race, race_prev)
+    return [
+        strategy(
+            team_drivers=team.assets[AssetType.DRIVER],
+            team_constructors=team.assets[AssetType.CONSTRUCTOR],
+            max_cost=team.total_budget(race, race_prev),
+            max_moves=team_max_moves,
+            season_year=season_year,
+            **race_inputs,
+        )
+        for (team, team_max_moves) in zip(teams, max_moves, strict=True)
+    ]
+
+
+def get_race_inputs(race: Race, race_prev: Race) -> dict:
+    """Return the strategy arguments taken from the race rather than the team: assets, pairings, prices and derivations."""
+    drivers = race.arrays(AssetType.DRIVER)
+    constructors = race.arrays(AssetType.CONSTRUCTOR)
+    drivers_prev = race_prev.arrays(AssetType.DRIVER)
+
+    prices_assets = dict(zip(drivers.names, drivers.price.tolist()))
+    prices_assets.update(zip(constructors.names, constructors.price.tolist()))
+
+    derivs_assets = {}
+    for deriv in drivers.derivs.keys() | constructors.derivs.keys():
+        derivs_assets[deriv] = dict(zip(drivers.names, drivers.derivs[deriv].tolist()))
+        derivs_assets[deriv].update(zip(constructors.names, constructors.derivs[deriv].tolist()))
+
+    return {
+        "all_available_drivers": list(drivers.names),
+        "all_available_constructors": list(constructors.names),
+        "all_available_driver_pairs": dict(zip(drivers.names, drivers.constructors)),
+        "prev_available_driver_pairs": dict(zip(drivers_prev.names, drivers_prev.constructors)),
+        "prices_assets": prices_assets,
+        "derivs_assets": derivs_assets,
+        "race_num": race.race,
+    }
+
+
+def factory_strategy_model(season: Season) -> StrategyModel:
+    """Create a `StrategyModel` covering every driver and constructor who appears in `season`."""
+    drivers = {}
+    constructors = {}
+    for race in season.races.values():
+        drivers.update(dict.fromkeys(race.arrays(AssetType.DRIVER).names))
+        constructors.update(dict.fromkeys(race.arrays(AssetType.CONSTRUCTOR).names))
+
+    return StrategyModel(list(drivers), list(constructors), name=f"StrategyModel_{season.season}")
@@ -95,7 +95,7 @@ class StrategyBettingOdds(StrategyBase):
         return problem
 
 
-    def get_drs_driver(self) -> str:
+    def select_drs_driver(self, selected_drivers: set[str]) -> str:
         """Select a driver from the chosen team to assign DRS based on maximum odds value
 
         Returns an empty string if no suitable driver has points data.
@@ -104,9 +104,7 @@ class StrategyBettingOdds(StrategyBase):
         max_driver = ""
 
         for d in self._all_available_drivers:
-            # This will only be called after the strategy has run, so self._lp_variables[VarType.TeamDrivers] will
-            # represent the selected drivers
-            if self._lp_variables[VarType.TeamDrivers][d].value() > 0:
+            if d in selected_drivers:
                 if self._odds_assets[d] > max_odds:
                     max_odds = self._odds_assets[d]
                     max_driver = d
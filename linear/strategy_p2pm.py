@@ -19,10 +19,8 @@ class StrategyMaxP2PM(StrategyBase):
             team_size_constructors = (len(self._team_constructors))
             self._max_moves = team_size_drivers + team_size_constructors
 
-    def get_problem(self) -> LpProblem:
-        """Build an LP problem whose objective is the cumulative P2PM over selected assets."""
-        problem = LpProblem(self.__class__.__name__, LpMaximize)
-
+    def get_p2pm_values(self) -> dict[str, float]:
+        """Return the cumulative P2PM of each available asset, anything without one being worth nothing."""
         deriv_name = get_derivation_name(DerivationType.P2PM_CUMULATIVE, 3)
 
         # Ensure anything without the P2PM value defaults to zero, i.e. it's worth nothing
@@ -32,9 +30,20 @@ class StrategyMaxP2PM(StrategyBase):
             else:
                 self._derivs_assets[deriv_name][d] = safe_to_float(self._derivs_assets[deriv_name][d])
 
+        return self._derivs_assets[deriv_name]
+
+    def get_objective(self) -> dict[str, float]:
+        return self.get_p2pm_values()
+
+    def get_problem(self) -> LpProblem:
+        """Build an LP problem whose objective is the cumulative P2PM over selected assets."""
+        problem = LpProblem(self.__class__.__name__, LpMaximize)
+
+        p2pm_values = self.get_p2pm_values()
+
         # P2PM values as based on the team selection, using the LP variables already provided by the base class
-        p2pm_drivers = [self._derivs_assets[deriv_name][i] * self._lp_variables[VarType.TeamDrivers][i] for i in self._all_available_drivers]
-        p2pm_constructors = [self._derivs_assets[deriv_name][i] * self._lp_variables[VarType.TeamConstructors][i] for i in self._all_available_constructors]
+        p2pm_drivers = [p2pm_values[i] * self._lp_variables[VarType.TeamDrivers][i] for i in self._all_available_drivers]
+        p2pm_constructors = [p2pm_values[i] * self._lp_variables[VarType.TeamConstructors][i] for i in self._all_available_constructors]
 
         # Variable for total P2PM
         self._lp_variables[VarType.OptimiseMax] = lpSum(p2pm_drivers + p2pm_constructors)
@@ -44,7 +53,7 @@ class StrategyMaxP2PM(StrategyBase):
         return problem
 
 
-    def get_drs_driver(self) -> str:
+    def select_drs_driver(self, selected_drivers: set[str]) -> str:
         """Select a driver from the chosen team to assign DRS based on maximum recent points.
 
         Returns an empty string if no suitable driver has points data.
@@ -56,9 +65,7 @@ class StrategyMaxP2PM(StrategyBase):
         max_driver = ""
 
         for d in self._all_available_drivers:
-            # This will only be called after the strategy has run, so self._lp_variables[VarType.TeamDrivers] will
-            # represent the selected drivers
-            if self._lp_variables[VarType.TeamDrivers][d].value() > 0:
+            if d in selected_drivers:
                 if self._derivs_assets[deriv_points][d] > max_points:
                     max_points = self._derivs_assets[deriv_points][d]
                     max_driver = d
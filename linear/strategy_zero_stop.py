@@ -20,6 +20,9 @@ class StrategyZeroStop(StrategyBase):
         # Usually, this will be zero
         self._max_moves = num_unavailable_drivers
 
+    def get_objective(self) -> dict[str, float]:
+        return self._prices_assets
+
     def get_problem(self) -> LpProblem:
         """Construct an LP problem that behaves like maximizing budget while preventing non-essential changes."""
         # Otherwise we'll do same as max budget strategy, to ensure all the variables behave as expected
@@ -4,11 +4,76 @@ Contains the base Asset class and concrete Driver and Constructor
 classes, plus helpers to build assets from PPM dataframes.
 """
 
+import functools
+from typing import Iterator, Mapping
+
 import pandas as pd
 import numpy as np
 
 from common import AssetType
 
+# Every other PPM column is a derivation
+_NON_DERIV_COLS = ["Season", "Driver", "Constructor", "Race", "Price", "Points"]
+
+# Position marking an (asset, race) pair found on more than one row
+_DUPLICATE = -1
+
+
+class DerivSchema:
+    """Fixed order of derivation names, shared by every asset with the same derivations.
+
+    Use :func:`get_deriv_schema` rather than constructing directly, so each set of
+    names has a single schema, including after unpickling.
+
+    Attributes:
+        names: Derivation names, in order.
+        index: Mapping of derivation name to its position in `names`.
+    """
+    __slots__ = ("names", "index")
+
+    def __init__(self, names: tuple[str, ...]):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+
+    def __reduce__(self):
+        return (get_deriv_schema, (self.names,))
+
+
+@functools.cache
+def get_deriv_schema(names: tuple[str, ...]) -> DerivSchema:
+    """Return the shared :class:`DerivSchema` for these derivation names."""
+    return DerivSchema(names)
+
+
+class Derivs(Mapping[str, float]):
+    """Read-only mapping of derivation name to value, stored as a tuple against a shared schema."""
+    __slots__ = ("schema", "values_")
+
+    def __init__(self, schema: DerivSchema, values: tuple[float, ...]):
+        if len(values) != len(schema.names):
+            raise ValueError(f"Expected {len(schema.names)} derivation values, got {len(values)}")
+        self.schema = schema
+        self.values_ = values
+
+    @classmethod
+    def from_dict(cls, derivs: dict[str, float]) -> "Derivs":
+        return cls(get_deriv_schema(tuple(derivs.keys())), tuple(derivs.values()))
+
+    def __getitem__(self, name: str) -> float:
+        return self.values_[self.schema.index[name]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.schema.names)
+
+    def __len__(self) -> int:
+        return len(self.schema.names)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def __reduce__(self):
+        return (Derivs, (self.schema, self.values_))
+
 
 class Asset:
     """Base class for a fantasy asset.
@@ -19,11 +84,13 @@ class Asset:
         points: Points scored in the race.
         derivs: Derivative metrics from PPM data (e.g., expected points).
     """
-    def __init__(self, constructor: str, price: float, points: int, derivs: dict[str, float]):
+    __slots__ = ("constructor", "price", "points", "derivs")
+
+    def __init__(self, constructor: str, price: float, points: int, derivs: Mapping[str, float]):
         self.constructor = constructor
         self.price: float = float(price)
         self.points:int = int(points)
-        self.derivs = derivs
+        self.derivs: Derivs = derivs if isinstance(derivs, Derivs) else Derivs.from_dict(derivs)
 
 
 class Driver(Asset):
@@ -31,19 +98,29 @@ class Driver(Asset):
 
     Inherits from :class:`Asset` and adds the driver's name.
     """
-    def __init__(self, driver: str, constructor: str, price: float, points: int, derivs: dict[str, float]):
+    __slots__ = ("driver",)
+
+    def __init__(self, driver: str, constructor: str, price: float, points: int, derivs: Mapping[str, float]):
         super().__init__(constructor, price, points, derivs)
         self.driver = driver
 
+    def __reduce__(self):
+        return (Driver, (self.driver, self.constructor, self.price, self.points, self.derivs))
+
 
 class Constructor(Asset):
     """Constructor/team asset.
 
     Same fields as :class:`Asset`, representing a constructor.
     """
-    def __init__(self, constructor: str, price: float, points: int, derivs: dict[str, float]):
+    __slots__ = ()
+
+    def __init__(self, constructor: str, price: float, points: int, derivs: Mapping[str, float]):
         super().__init__(constructor, price, points, derivs)   
 
+    def __reduce__(self):
+        return (Constructor, (self.constructor, self.price, self.points, self.derivs))
+
 
 def factory_asset(
     df_ppm_data: pd.DataFrame,
@@ -53,6 +130,9 @@ def factory_asset(
 ) -> tuple[dict[str, float], float, int]:
     """Build asset data from a PPM DataFrame for a given race.
 
+    Indexes the whole frame for one lookup, so use an :class:`AssetIndex`
+    directly to build many assets from the same frame.
+
     Args:
         df_ppm_data: PPM dataframe containing Price, Points and derivative cols.
         asset_type: Enum specifying whether DRIVER or CONSTRUCTOR.
@@ -66,27 +146,48 @@ def factory_asset(
     Raises:
         ValueError: If asset not found or multiple entries exist for the asset.
     """
+    (derivs, price, points) = AssetIndex(df_ppm_data, asset_type).get(asset_name, race)
+    return (dict(derivs), price, points)
+
+
+class AssetIndex:
+    """Lookup of asset data by (asset name, race) over a whole PPM DataFrame.
+
+    The frame is indexed in a single pass, so building many assets from it costs
+    one dictionary lookup each rather than a scan of the frame per asset.
+    Price and points are only read for an asset found, so a frame without them
+    still reports a missing or duplicated asset.
+
+    Attributes:
+        asset_type: Enum specifying whether DRIVER or CONSTRUCTOR.
+    """
+    def __init__(self, df_ppm_data: pd.DataFrame, asset_type: AssetType):
+        self.asset_type = asset_type
+        self._deriv_cols = [c for c in df_ppm_data.columns if c not in _NON_DERIV_COLS]
+        self._values = {col: df_ppm_data[col].to_numpy() for col in ["Price", "Points"] if col in df_ppm_data.columns}
+        self._derivs = df_ppm_data[self._deriv_cols].to_numpy()
+        self._schema = get_deriv_schema(tuple(self._deriv_cols))
+
+        self._positions: dict[tuple[str, int], int] = {}
+        for pos, key in enumerate(zip(df_ppm_data[asset_type.value], df_ppm_data["Race"])):
+            self._positions[key] = _DUPLICATE if key in self._positions else pos
 
-    df_ppm_filtered = df_ppm_data[
-        (df_ppm_data[asset_type.value] == asset_name) &
-        (df_ppm_data["Race"] == race)
-    ]
+    def get(self, asset_name: str, race: int) -> tuple[Derivs, float, int]:
+        """Return (derivs, price, points) for an asset in a race.
 
-    if df_ppm_filtered.empty:
-        raise ValueError(f"{asset_type.value} {asset_name} not found for race {race}")
-    
-    if df_ppm_filtered.shape[0] > 1:
-        raise ValueError(f"Multiple entries found for {asset_type.value} {asset_name} in race {race}")
+        Raises:
+            ValueError: If asset not found or multiple entries exist for the asset.
+        """
+        pos = self._positions.get((asset_name, race))
 
-    price = df_ppm_filtered.iloc[0]["Price"]    
-    points = df_ppm_filtered.iloc[0]["Points"]
+        if pos is None:
+            raise ValueError(f"{self.asset_type.value} {asset_name} not found for race {race}")
 
-    derivs = {}
-    for c in df_ppm_filtered.columns:
-        if c not in ["Season", "Driver", "Constructor", "Race", "Price", "Points"]:
-            derivs[c] = float(df_ppm_filtered.iloc[0][c])
+        if pos == _DUPLICATE:
+            raise ValueError(f"Multiple entries found for {self.asset_type.value} {asset_name} in race {race}")
 
-    return (derivs, price, points)
+        derivs = Derivs(self._schema, tuple(float(v) for v in self._derivs[pos]))
+        return (derivs, self._values["Price"][pos], self._values["Points"][pos])
 
 
 def factory_driver(
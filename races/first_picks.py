@@ -7,19 +7,26 @@ budget constraint.
 
 import pandas as pd
 from itertools import combinations
+import functools
 import logging
+import math
 import numpy as np
+from typing import Iterator, NamedTuple
 
-from common import CONSTRUCTORS_PER_TEAM, DEFAULT_STARTING_BUDGET, DRIVERS_PER_CONSTRUCTOR, DRIVERS_PER_TEAM, F1_SEASON_CONSTRUCTORS, setup_logging
+from common import AssetType, CONSTRUCTORS_PER_TEAM, DEFAULT_STARTING_BUDGET, DRIVERS_PER_CONSTRUCTOR, DRIVERS_PER_TEAM, F1_SEASON_CONSTRUCTORS, setup_logging
 from races.season import Race, factory_race
 from races.team import factory_team_row
 from helpers import load_with_derivations
+from import_data.odds import load_odds
 
 
 # Team values are compared against budget thresholds that hundreds of teams hit
 # exactly, so round away float summation noise before comparing
 _VALUE_PRECISION = 6
 
+# Starting teams yielded at a time by iter_starting_teams
+_CHUNK_SIZE = 1024
+
 
 def get_combination_matrix(num_total: int, num_allowed: int) -> np.ndarray:
     """Return all combinations as a 0/1 matrix, one row per combination.
@@ -41,6 +48,95 @@ def get_combination_matrix(num_total: int, num_allowed: int) -> np.ndarray:
     return matrix
 
 
+@functools.cache
+def _get_binomial_table(num_total: int, num_allowed: int) -> np.ndarray:
+    """Return C(d, i) for d in [0, num_total] and i in [0, num_allowed], as a read-only int64 matrix indexed [i, d]."""
+    table = np.array([[math.comb(d, i) for d in range(num_total + 1)] for i in range(num_allowed + 1)], dtype=np.int64)
+    table.flags.writeable = False
+    return table
+
+
+def rank_combinations(picks: np.ndarray, num_total: int) -> np.ndarray:
+    """Return the position of each combination in :func:`get_combination_matrix` order, without building it.
+
+    Uses the combinatorial number system: mirroring each pick `c` to
+    `num_total - 1 - c` turns lexicographic order into reverse colexicographic
+    order, where a combination's rank is a sum of binomial coefficients.
+
+    Args:
+        picks: Selected item indices, one combination per row, in any order within a row.
+        num_total: Total number of items.
+
+    Returns:
+        Rank of each row.
+    """
+    picks = np.atleast_2d(picks)
+    num_allowed = picks.shape[1]
+    table = _get_binomial_table(num_total, num_allowed)
+
+    mirrored = np.sort(num_total - 1 - picks, axis=1)
+    colex_ranks = table[np.arange(1, num_allowed + 1), mirrored].sum(axis=1)
+    return table[num_allowed, num_total] - 1 - colex_ranks
+
+
+def unrank_combinations(ranks: np.ndarray, num_total: int, num_allowed: int) -> np.ndarray:
+    """Return the combination at each position of :func:`get_combination_matrix` order, without building it.
+
+    The inverse of :func:`rank_combinations`, one pass per selected item.
+
+    Args:
+        ranks: Positions in combination order.
+        num_total: Total number of items.
+        num_allowed: Number of items selected.
+
+    Returns:
+        Selected item indices, one ascending row per rank.
+
+    Raises:
+        ValueError: If a rank is outside the number of combinations.
+    """
+    ranks = np.atleast_1d(np.asarray(ranks, dtype=np.int64))
+    table = _get_binomial_table(num_total, num_allowed)
+    if ranks.size > 0 and (ranks.min() < 0 or ranks.max() >= table[num_allowed, num_total]):
+        raise ValueError(f"Rank out of range for {num_total} choose {num_allowed}")
+
+    remaining = table[num_allowed, num_total] - 1 - ranks
+    picks = np.zeros((len(ranks), num_allowed), dtype=np.int64)
+    for i in range(num_allowed, 0, -1):
+        # Largest mirrored item d with C(d, i) still within the remaining rank
+        mirrored = np.searchsorted(table[i, :num_total], remaining, side="right") - 1
+        remaining = remaining - table[i, mirrored]
+        picks[:, num_allowed - i] = num_total - 1 - mirrored
+
+    return picks
+
+
+def get_team_index(
+    driver_picks: np.ndarray,
+    constructor_picks: np.ndarray,
+    num_drivers_total: int,
+    num_constructors_total: int,
+) -> np.ndarray:
+    """Return each team's position in the full set of starting combinations, as used to index them."""
+    num_constructor_combinations = math.comb(num_constructors_total, CONSTRUCTORS_PER_TEAM)
+    return rank_combinations(driver_picks, num_drivers_total) * num_constructor_combinations \
+        + rank_combinations(constructor_picks, num_constructors_total)
+
+
+def get_team_picks(
+    team_index: np.ndarray,
+    num_drivers_total: int,
+    num_constructors_total: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the (driver picks, constructor picks) of teams from their position in the full set of starting combinations."""
+    num_constructor_combinations = math.comb(num_constructors_total, CONSTRUCTORS_PER_TEAM)
+    (driver_ranks, constructor_ranks) = np.divmod(np.asarray(team_index, dtype=np.int64), num_constructor_combinations)
+    return (
+        unrank_combinations(driver_ranks, num_drivers_total, DRIVERS_PER_TEAM),
+        unrank_combinations(constructor_ranks, num_constructors_total, CONSTRUCTORS_PER_TEAM),
+    )
+
+
 def get_all_combinations(
     num_total: int,
     num_allowed: int,
@@ -77,28 +173,198 @@ def set_combination_assets(df_combinations: pd.DataFrame, race: Race) -> pd.Data
     return df_combinations
 
 
-def get_starting_combinations(season: int, race_num: int, min_total_value: float, max_total_value: float=DEFAULT_STARTING_BUDGET) -> pd.DataFrame:
-    """Generate price-based team combinations that satisfy a budget window.
-
-    This loads PPM derivations for a season, builds a `Race` object for the
-    requested race, converts 0/1 combinations into price lists and filters
-    teams by total value between `min_total_value` (exclusive) and
-    `max_total_value` (inclusive).
+def get_budget_window_pairs(
+    driver_values: np.ndarray,
+    constructor_values: np.ndarray,
+    min_total_value: float,
+    max_total_value: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find every (driver combination, constructor combination) pair whose total value is in a budget window.
 
-    A team's value is its driver combination plus its constructor combination,
-    so the budget filter is applied to the sum of the two sides and only the
-    teams that survive it are ever priced up. Building every combination first
-    costs hundreds of megabytes for a handful of thousands of valid teams.
+    The constructor values are sorted once, then each driver combination's
+    window of constructor values is found by binary search, so only pairs at or
+    near the window are ever summed, rather than the whole cross product.
+    Candidates are widened by the rounding tolerance and then filtered on the
+    exact rounded total, so the result is the same as masking the full outer
+    sum.
 
     Args:
-        season: Season year used to load PPM derivations.
-        race_num: Race number within the season.
+        driver_values: Value of each driver combination.
+        constructor_values: Value of each constructor combination.
         min_total_value: Exclusive lower bound on team total value.
-        max_total_value: Inclusive upper bound on team total value (default 100).
+        max_total_value: Inclusive upper bound on team total value.
 
     Returns:
-        DataFrame of valid, priced team combinations for the given race,
-        indexed by each team's position in the full set of combinations.
+        Tuple of (driver rows, constructor rows, total values), ordered by
+        driver row then constructor row.
+    """
+    tolerance = 10.0 ** -_VALUE_PRECISION
+    constructor_order = np.argsort(constructor_values, kind="stable")
+    constructor_sorted = constructor_values[constructor_order]
+
+    starts = np.searchsorted(constructor_sorted, min_total_value - driver_values - tolerance, side="left")
+    ends = np.searchsorted(constructor_sorted, max_total_value - driver_values + tolerance, side="right")
+    counts = np.maximum(ends - starts, 0)
+
+    driver_rows = np.repeat(np.arange(len(driver_values)), counts)
+    offsets = np.arange(len(driver_rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+    constructor_rows = constructor_order[np.repeat(starts, counts) + offsets]
+
+    total_values = np.round(driver_values[driver_rows] + constructor_values[constructor_rows], _VALUE_PRECISION)
+    within_budget = (total_values <= max_total_value) & (total_values > min_total_value)
+    (driver_rows, constructor_rows, total_values) = (driver_rows[within_budget], constructor_rows[within_budget], total_values[within_budget])
+
+    order = np.lexsort((constructor_rows, driver_rows))
+    return (driver_rows[order], constructor_rows[order], total_values[order])
+
+
+class StartingTeams(NamedTuple):
+    """A chunk of starting teams as compact index arrays.
+
+    Attributes:
+        index: Each team's position in the full set of combinations.
+        driver_picks: Positions of each team's drivers in the race line-up, ascending.
+        constructor_picks: Positions of each team's constructors in the race line-up, ascending.
+        total_value: Each team's total value.
+    """
+    index: np.ndarray
+    driver_picks: np.ndarray
+    constructor_picks: np.ndarray
+    total_value: np.ndarray
+
+
+class Prescreen(NamedTuple):
+    """Cut-off applied to the starting teams before they are simulated.
+
+    Teams are scored on `column` as it stood at race `race_num`, the sum over
+    their assets, and the best `top_k` kept. With `num_bands` above one, the
+    budget window is split into that many equal bands of total value and
+    `top_k` shared between them, the cheaper bands taking any remainder, so
+    cheaper teams are not crowded out by the dearest.
+
+    The scores may only use what was known before the starting race, or the
+    back-test would pick its teams with hindsight: derivations, prices and
+    odds from the starting race or earlier, points from earlier races only.
+    See :meth:`check_look_ahead`.
+
+    Attributes:
+        column: Derivation to score on, or "Points", "Price" or "Odds".
+        race_num: Race whose asset values are scored, missing values count as 0.
+        top_k: Number of teams kept.
+        num_bands: Number of value bands to stratify over.
+    """
+    column: str
+    race_num: int
+    top_k: int
+    num_bands: int = 1
+
+    def get_key(self) -> str:
+        """Return the cut-off as a label for simulation keys, free of the brackets they are delimited by."""
+        column = self.column.replace("(", "").replace(")", "")
+        bands = f"x{self.num_bands}" if self.num_bands > 1 else ""
+        return f"top{self.top_k}{bands}:{column}:r{self.race_num}"
+
+    def check_look_ahead(self, starting_race_num: int):
+        """Raise if the scores would use results from races not yet run when the teams start.
+
+        Derivations only cover the races before their own, and prices and odds
+        are set before the race, so those may be taken from the starting race;
+        points are that race's result.
+
+        Raises:
+            ValueError: If scoring would look ahead of `starting_race_num`.
+        """
+        last_race_num = starting_race_num - 1 if self.column == "Points" else starting_race_num
+        if self.race_num > last_race_num:
+            raise ValueError(
+                f"Pre-screen on {self.column} at race {self.race_num} looks ahead of teams starting at race {starting_race_num}"
+            )
+
+
+def get_asset_scores(race: Race, asset_type: AssetType, column: str, season: int, names: list[str] | None = None) -> np.ndarray:
+    """Return `column` for each asset of a race, with missing values as 0.
+
+    Scores are in the race's line-up order, or for each of `names` if given,
+    an asset not in the race scoring 0.  Line-ups change order between races,
+    so score another race's assets by name.
+
+    "Odds" scores each asset on its implied probability from the betting odds,
+    as used by `StrategyBettingOdds`, a constructor's being the sum of its
+    drivers'.
+
+    Raises:
+        ValueError: If the column is not a derivation, "Points", "Price" or "Odds".
+    """
+    arrays = race.arrays(asset_type)
+    if column == "Odds":
+        odds = load_odds(asset_type, season, race.race)
+        values = np.array([odds.get(name, 0.0) for name in arrays.names], dtype=float)
+    elif column == "Points":
+        values = arrays.points
+    elif column == "Price":
+        values = arrays.price
+    elif column in arrays.derivs:
+        values = arrays.derivs[column]
+    else:
+        raise ValueError(f"Unable to score {asset_type.value} on {column}")
+    values = np.nan_to_num(values.astype(float))
+
+    if names is None:
+        return values
+    return np.array([values[arrays.index[name]] if name in arrays.index else 0.0 for name in names], dtype=float)
+
+
+def select_prescreen(
+    total_values: np.ndarray,
+    scores: np.ndarray,
+    min_total_value: float,
+    max_total_value: float,
+    top_k: int,
+    num_bands: int = 1,
+) -> np.ndarray:
+    """Return the positions of the teams kept by a pre-screen, in their original order.
+
+    Within each band the highest scores are kept, ties going to the earlier team.
+
+    Args:
+        total_values: Total value of each team.
+        scores: Score of each team.
+        min_total_value: Exclusive lower bound of the budget window.
+        max_total_value: Inclusive upper bound of the budget window.
+        top_k: Number of teams kept across all bands.
+        num_bands: Number of equal-width value bands.
+
+    Raises:
+        ValueError: If there are more bands than teams to keep.
+    """
+    if top_k < num_bands:
+        raise ValueError(f"Unable to keep {top_k} teams across {num_bands} value bands")
+
+    # An equal share per band, the cheaper bands taking one each of the remainder
+    quotas = top_k // num_bands + (np.arange(num_bands) < top_k % num_bands)
+
+    edges = np.linspace(min_total_value, max_total_value, num_bands + 1)
+    bands = np.clip(np.searchsorted(edges, total_values, side="left") - 1, 0, num_bands - 1)
+
+    # Bands first, then best score first, then original order
+    order = np.lexsort((np.arange(len(scores)), -scores, bands))
+    band_starts = np.searchsorted(bands[order], np.arange(num_bands), side="left")
+    rank_in_band = np.arange(len(order)) - band_starts[bands[order]]
+
+    return np.sort(order[rank_in_band < quotas[bands[order]]])
+
+
+def _get_starting_window(
+    season: int,
+    race_num: int,
+    min_total_value: float,
+    max_total_value: float,
+) -> tuple[Race, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return the race and the teams within the budget window.
+
+    Returns:
+        Tuple of (race, driver prices, constructor prices, driver ranks,
+        constructor ranks, total values), one rank and value per team.
     """
     (df_driver_ppm, df_constructor_ppm, df_driver_pairs) = load_with_derivations(season)
 
@@ -111,20 +377,57 @@ def get_starting_combinations(season: int, race_num: int, min_total_value: float
 
     num_constructors_total = F1_SEASON_CONSTRUCTORS[season]  # Intentionally throw if we can't find the season
     num_drivers_total = num_constructors_total * DRIVERS_PER_CONSTRUCTOR
-    driver_combinations = get_combination_matrix(num_drivers_total, DRIVERS_PER_TEAM)
-    constructor_combinations = get_combination_matrix(num_constructors_total, CONSTRUCTORS_PER_TEAM)
 
     driver_prices = np.array([driver.price for driver in race.drivers.values()], dtype=float)
     constructor_prices = np.array([constructor.price for constructor in race.constructors.values()], dtype=float)
     if len(driver_prices) != num_drivers_total or len(constructor_prices) != num_constructors_total:
         raise ValueError("Combinations shape did not match race line-up")
 
-    driver_values = driver_combinations @ driver_prices
-    constructor_values = constructor_combinations @ constructor_prices
-    total_values = np.round(driver_values[:, None] + constructor_values[None, :], _VALUE_PRECISION)
+    driver_values = get_combination_matrix(num_drivers_total, DRIVERS_PER_TEAM) @ driver_prices
+    constructor_values = get_combination_matrix(num_constructors_total, CONSTRUCTORS_PER_TEAM) @ constructor_prices
+    (driver_rows, constructor_rows, total_values) = get_budget_window_pairs(
+        driver_values,
+        constructor_values,
+        min_total_value,
+        max_total_value,
+    )
+    return (race, driver_prices, constructor_prices, driver_rows, constructor_rows, total_values)
 
-    within_budget = (total_values <= max_total_value) & (total_values > min_total_value)
-    driver_rows, constructor_rows = np.nonzero(within_budget)
+
+def get_starting_combinations(season: int, race_num: int, min_total_value: float, max_total_value: float=DEFAULT_STARTING_BUDGET) -> pd.DataFrame:
+    """Generate price-based team combinations that satisfy a budget window.
+
+    This loads PPM derivations for a season, builds a `Race` object for the
+    requested race, converts 0/1 combinations into price lists and filters
+    teams by total value between `min_total_value` (exclusive) and
+    `max_total_value` (inclusive).
+
+    A team's value is its driver combination plus its constructor combination,
+    so the budget filter is applied to the sum of the two sides, see
+    :func:`get_budget_window_pairs`, and only the teams that survive it are
+    ever priced up. Building every combination first costs hundreds of
+    megabytes for a handful of thousands of valid teams.
+
+    Args:
+        season: Season year used to load PPM derivations.
+        race_num: Race number within the season.
+        min_total_value: Exclusive lower bound on team total value.
+        max_total_value: Inclusive upper bound on team total value (default 100).
+
+    Returns:
+        DataFrame of valid, priced team combinations for the given race,
+        indexed by each team's position in the full set of combinations.
+    """
+    (race, driver_prices, constructor_prices, driver_rows, constructor_rows, total_values) = _get_starting_window(
+        season,
+        race_num,
+        min_total_value,
+        max_total_value,
+    )
+    num_drivers_total = len(driver_prices)
+    num_constructors_total = len(constructor_prices)
+    driver_combinations = get_combination_matrix(num_drivers_total, DRIVERS_PER_TEAM)
+    constructor_combinations = get_combination_matrix(num_constructors_total, CONSTRUCTORS_PER_TEAM)
 
     selections = np.hstack([driver_combinations[driver_rows], constructor_combinations[constructor_rows]])
     prices = np.concatenate([driver_prices, constructor_prices])
@@ -135,11 +438,75 @@ def get_starting_combinations(season: int, race_num: int, min_total_value: float
         index=driver_rows * len(constructor_combinations) + constructor_rows,
     )
     df_combinations = set_combination_assets(df_combinations, race)
-    df_combinations["total_value"] = total_values[driver_rows, constructor_rows]
+    df_combinations["total_value"] = total_values
 
     return df_combinations
 
 
+def iter_starting_teams(
+    season: int,
+    race_num: int,
+    min_total_value: float,
+    max_total_value: float = DEFAULT_STARTING_BUDGET,
+    chunk_size: int = _CHUNK_SIZE,
+    prescreen: Prescreen | None = None,
+) -> Iterator[StartingTeams]:
+    """Yield the teams of :func:`get_starting_combinations` in chunks of index arrays, in the same order.
+
+    Only the budget window itself is held for the whole season, a few integers
+    per team; each chunk's picks are unranked from it as the chunk is reached.
+    Build teams from a chunk with :func:`races.team.factory_team_picks`.
+
+    Args:
+        season: Season year used to load PPM derivations.
+        race_num: Race number within the season.
+        min_total_value: Exclusive lower bound on team total value.
+        max_total_value: Inclusive upper bound on team total value (default 100).
+        chunk_size: Teams per chunk, the last chunk may be shorter.
+        prescreen: Cut-off to apply before chunking, None keeps every team.
+    """
+    (race, driver_prices, constructor_prices, driver_rows, constructor_rows, total_values) = _get_starting_window(
+        season,
+        race_num,
+        min_total_value,
+        max_total_value,
+    )
+    num_drivers_total = len(driver_prices)
+    num_constructors_total = len(constructor_prices)
+    num_constructor_combinations = math.comb(num_constructors_total, CONSTRUCTORS_PER_TEAM)
+
+    if prescreen is not None:
+        prescreen.check_look_ahead(race_num)
+        (df_driver_ppm, df_constructor_ppm, df_driver_pairs) = load_with_derivations(season)
+        race_score = factory_race(df_driver_ppm, df_constructor_ppm, df_driver_pairs, prescreen.race_num)
+        # Scored by name, as the line-up may be in a different order, or have other drivers, in the scoring race
+        (driver_names, constructor_names) = (race.arrays(AssetType.DRIVER).names, race.arrays(AssetType.CONSTRUCTOR).names)
+        driver_scores = get_combination_matrix(num_drivers_total, DRIVERS_PER_TEAM) \
+            @ get_asset_scores(race_score, AssetType.DRIVER, prescreen.column, season, driver_names)
+        constructor_scores = get_combination_matrix(num_constructors_total, CONSTRUCTORS_PER_TEAM) \
+            @ get_asset_scores(race_score, AssetType.CONSTRUCTOR, prescreen.column, season, constructor_names)
+
+        kept = select_prescreen(
+            total_values,
+            driver_scores[driver_rows] + constructor_scores[constructor_rows],
+            min_total_value,
+            max_total_value,
+            prescreen.top_k,
+            prescreen.num_bands,
+        )
+        logging.info(f"Pre-screen {prescreen.get_key()} kept {len(kept)} of {len(driver_rows)} starting teams")
+        (driver_rows, constructor_rows, total_values) = (driver_rows[kept], constructor_rows[kept], total_values[kept])
+
+    for start in range(0, len(driver_rows), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        yield StartingTeams(
+            index=driver_rows[chunk] * num_constructor_combinations + constructor_rows[chunk],
+            driver_picks=unrank_combinations(driver_rows[chunk], num_drivers_total, DRIVERS_PER_TEAM),
+            constructor_picks=unrank_combinations(constructor_rows[chunk], num_constructors_total, CONSTRUCTORS_PER_TEAM),
+            total_value=total_values[chunk],
+        )
+
+
 if __name__ == "__main__":
     setup_logging()
 
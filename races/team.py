@@ -7,6 +7,7 @@ teams from rows or lists.
 
 import pandas as pd
 import numpy as np
+from typing import Sequence
 
 from common import DEFAULT_STARTING_BUDGET
 from races.asset import AssetType
@@ -171,6 +172,30 @@ def factory_team_row(row_assets: dict[str, float], race: Race, num_drivers: int
     return t
 
 
+def factory_team_picks(driver_picks: Sequence[int], constructor_picks: Sequence[int], race: Race, total_budget: float = DEFAULT_STARTING_BUDGET) -> Team:
+    """Create a Team from positions in the race line-up, as yielded by :func:`races.first_picks.iter_starting_teams`.
+
+    Assets are added, and their prices summed into the unused budget, in
+    line-up order, so the team matches :func:`factory_team_row` on the same
+    selection.
+    """
+    t = Team(num_drivers=len(driver_picks), num_constructors=len(constructor_picks))
+    driver_names = race.arrays(AssetType.DRIVER).names
+    constructor_names = race.arrays(AssetType.CONSTRUCTOR).names
+
+    total_value = 0.0
+
+    for i in sorted(driver_picks):
+        t.add_asset(asset_type=AssetType.DRIVER, asset=driver_names[i])
+        total_value += race.drivers[driver_names[i]].price
+    for i in sorted(constructor_picks):
+        t.add_asset(asset_type=AssetType.CONSTRUCTOR, asset=constructor_names[i])
+        total_value += race.constructors[constructor_names[i]].price
+
+    t.unused_budget = total_budget - total_value
+    return t
+
+
 def factory_team_lists(drivers: list[str], constructors: list[str], race: Race, total_budget: float = DEFAULT_STARTING_BUDGET) -> Team:
     """Create a Team from explicit driver and constructor name lists.
 
@@ -0,0 +1,168 @@
+"""Append-only store for batch simulation results.
+
+Each checkpoint is written as a new parquet fragment in a directory partitioned
+by season and strategy (`season=2025/strategy=StrategyMaxP2PM/part-*.parquet`),
+so a checkpoint only costs the rows it adds instead of rewriting every result
+so far.  The whole directory reads back as one dataset, optionally filtered to
+the partitions of interest, and `compact_batch_results` merges each partition's
+fragments once a sweep is done.
+
+The sim_keys already in the store are also kept in a sidecar text file, read by
+`SimKeyIndex`, so resuming a sweep does not need to load any results.
+"""
+
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+PARTITION_COLS = ["season", "strategy"]
+
+# Leading underscore keeps the sidecar out of the parquet dataset when the store is read
+_FILE_SIM_KEYS = "_sim_keys.txt"
+
+
+def write_batch_fragment(rows: list[dict], root: str) -> int:
+    """Append results rows to the store as new fragments, one per partition.
+
+    Returns:
+        The number of rows written.
+    """
+    if len(rows) == 0:
+        return 0
+
+    df = pd.DataFrame(rows)
+    pq.write_to_dataset(
+        pa.Table.from_pandas(df, preserve_index=False),
+        root_path=root,
+        partition_cols=PARTITION_COLS,
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    logging.debug(f"Wrote fragment of shape {df.shape} to {root}")
+    return len(df.index)
+
+
+def read_batch_results(root: str, columns: list[str] | None = None, filters: list[tuple] | None = None) -> pd.DataFrame:
+    """Read the store, or a single legacy results file, as one dataframe.
+
+    Args:
+        root: Store directory, or a parquet file written before the store existed.
+        columns: Columns to read, default all.
+        filters: pyarrow filters, e.g. `[("season", "==", 2025)]`.  Filters on
+            the partition columns skip the other partitions' files entirely.
+
+    Returns:
+        The matching results, or an empty frame with a `sim_key` column if there
+        are none yet.
+    """
+    if not os.path.exists(root):
+        return pd.DataFrame(columns=["sim_key"])
+
+    df = pd.read_parquet(root, columns=columns, filters=filters)
+
+    # Partition values come back as categoricals, restore the types the rows were written with
+    if "season" in df.columns and isinstance(df["season"].dtype, pd.CategoricalDtype):
+        df["season"] = df["season"].astype(int)
+    if "strategy" in df.columns and isinstance(df["strategy"].dtype, pd.CategoricalDtype):
+        df["strategy"] = df["strategy"].astype(str)
+
+    return df
+
+
+def list_batch_fragments(root: str) -> dict[Path, list[Path]]:
+    """Return the fragment files in each partition directory of the store."""
+    partitions = {}
+    for fragment in sorted(Path(root).rglob("*.parquet")):
+        partitions.setdefault(fragment.parent, []).append(fragment)
+    return partitions
+
+
+def compact_batch_results(root: str) -> int:
+    """Merge each partition's fragments into one file, dropping duplicate simulations.
+
+    The merged file is written before the fragments it replaces are removed, so
+    an interrupted compaction leaves duplicate rows rather than lost ones, and
+    those are dropped by the next compaction.
+
+    Returns:
+        The number of partitions compacted.
+    """
+    compacted = 0
+    for partition, fragments in list_batch_fragments(root).items():
+        if len(fragments) < 2:
+            continue
+
+        df = pa.concat_tables([pq.read_table(f) for f in fragments], promote_options="default").to_pandas()
+        df = df.drop_duplicates(subset=["sim_key"], keep="first")
+        pq.write_table(
+            pa.Table.from_pandas(df, preserve_index=False),
+            partition / f"part-{uuid.uuid4().hex}-compacted.parquet",
+        )
+        for fragment in fragments:
+            fragment.unlink()
+
+        logging.info(f"Compacted {len(fragments)} fragments in {partition}, {len(df.index)} rows")
+        compacted += 1
+
+    return compacted
+
+
+class SimKeyIndex:
+    """Set of the sim_keys in the store, backed by a sidecar file in the store directory.
+
+    Keys are appended to the sidecar as they are added, one per line, so it only
+    ever grows by each checkpoint's keys.  If the sidecar is missing, e.g. for a
+    store from before it existed, it is rebuilt from the store's sim_key column.
+    """
+    def __init__(self, root: str):
+        self._fn = Path(root) / _FILE_SIM_KEYS
+        self._keys: set[str] = set()
+
+        if self._fn.exists():
+            self._keys = set(self._fn.read_text().splitlines())
+        elif os.path.exists(root):
+            self.add(read_batch_results(root, columns=["sim_key"])["sim_key"])
+            logging.info(f"Rebuilt {self._fn} from the store, {len(self._keys)} keys")
+
+    def __contains__(self, sim_key: str) -> bool:
+        return sim_key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, sim_keys: Iterable[str]):
+        """Add keys to the index, appending any new ones to the sidecar."""
+        new_keys = [k for k in dict.fromkeys(sim_keys) if k not in self._keys]
+        if len(new_keys) == 0:
+            return
+
+        self._fn.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._fn, "a") as f:
+            f.writelines(f"{k}\n" for k in new_keys)
+        self._keys.update(new_keys)
+
+
+def import_batch_results_file(fn: str, root: str) -> int:
+    """Move a results file from before the store existed into the store.
+
+    The file is renamed with an `.imported` suffix afterwards, so it is not
+    picked up twice.
+
+    Returns:
+        The number of rows imported.
+    """
+    if not os.path.exists(fn):
+        return 0
+
+    rows = pd.read_parquet(fn).to_dict("records")
+    written = write_batch_fragment(rows, root)
+    SimKeyIndex(root).add(row["sim_key"] for row in rows)
+    os.rename(fn, f"{fn}.imported")
+    logging.info(f"Imported {written} rows from {fn} into {root}")
+    return written
@@ -1,16 +1,15 @@
-"""Script to read the batch results parquet file and write a CSV file for Excel/CSV consumption."""
+"""Script to read the batch results parquet store and write a CSV file for Excel/CSV consumption."""
 
-import pandas as pd
 import logging
 
 from common import setup_logging
-from scripts.run_multiple_teams import _FILE_BATCH_RESULTS_PARQET, _FILE_BATCH_RESULTS_EXCEL
+from scripts.run_multiple_teams import _DIR_BATCH_RESULTS, _FILE_BATCH_RESULTS_EXCEL, open_batch_results_file
 
 if __name__ == "__main__":
     setup_logging()
 
-    logging.info(f"Reading {_FILE_BATCH_RESULTS_PARQET}...")
-    df = pd.read_parquet(_FILE_BATCH_RESULTS_PARQET)
+    logging.info(f"Reading {_DIR_BATCH_RESULTS}...")
+    df = open_batch_results_file(_DIR_BATCH_RESULTS)
     logging.info(f"... read {df.shape}")
 
     logging.info(f"Writing {_FILE_BATCH_RESULTS_EXCEL}...")
@@ -0,0 +1,75 @@
+"""Benchmark the rolling derivations against the per-group pandas lambdas they replaced.
+
+Times `rolling_sum_shifted` against a `groupby().transform(lambda ...)` over the
+whole archive, and over a synthetic archive 100 times the size made by
+repeating every season under new season numbers, checking the two agree bit
+for bit each time.
+"""
+
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+
+from common import AssetType, F1_SEASON_CONSTRUCTORS, setup_logging
+from import_data.derivations import get_group_starts, rolling_sum_shifted
+from import_data.import_history import load_archive_data
+
+_ROLLING_WINDOW = 3
+_SYNTHETIC_SCALE = 100
+_REPEATS = 5
+
+
+def rolling_sum_shifted_lambda(df: pd.DataFrame, group_cols: list[str], col: str, rolling_window: int) -> np.ndarray:
+    """The original per-group implementation."""
+    return df.groupby(group_cols)[col] \
+        .transform(lambda s: s.fillna(0).shift(1).rolling(window=rolling_window, min_periods=1).sum()) \
+        .to_numpy()
+
+
+def get_archive_frame(asset_type: AssetType, scale: int = 1) -> pd.DataFrame:
+    """Return the archive for an asset type, grouped and sorted as `derivation_cum_tot` does, repeated `scale` times."""
+    dfs = load_archive_data([asset_type], list(F1_SEASON_CONSTRUCTORS.keys()))
+    df = pd.concat(dfs.values(), ignore_index=True)[["Season", "Race", asset_type.value, "Points", "Price"]]
+    df = pd.concat([df.assign(Season=df["Season"] + 10_000 * i) for i in range(scale)], ignore_index=True)
+    df = df.groupby(["Season", asset_type.value, "Race"]).sum().reset_index()
+    return df.sort_values(["Season", asset_type.value, "Race"], ignore_index=True)
+
+
+def time_best(func) -> tuple[float, np.ndarray]:
+    """Return the best of `_REPEATS` timings in seconds, and the result."""
+    best = np.inf
+    for _ in range(_REPEATS):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_derivations(asset_type: AssetType, scale: int):
+    df = get_archive_frame(asset_type, scale)
+    group_cols = ["Season", asset_type.value]
+
+    for col in ["Points", "Price"]:
+        (secs_lambda, expected) = time_best(lambda: rolling_sum_shifted_lambda(df, group_cols, col, _ROLLING_WINDOW))
+        (secs_vector, actual) = time_best(
+            lambda: rolling_sum_shifted(df[col].to_numpy(dtype=float), get_group_starts(df, group_cols), _ROLLING_WINDOW)
+        )
+
+        if not np.array_equal(actual, expected, equal_nan=True):
+            raise ValueError(f"Rolling sums differ for {asset_type.value} {col} at scale {scale}")
+
+        logging.info(
+            f"{asset_type.value} {col} x{scale} ({len(df.index)} rows): "
+            f"lambda {secs_lambda * 1000:.2f}ms, vectorised {secs_vector * 1000:.2f}ms, "
+            f"speed-up {secs_lambda / secs_vector:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    setup_logging()
+
+    for _scale in [1, _SYNTHETIC_SCALE]:
+        for _asset_type in AssetType:
+            bench_derivations(_asset_type, _scale)
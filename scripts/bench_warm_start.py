@@ -0,0 +1,100 @@
+"""Benchmark warm-started solves against cold ones, over whole seasons of starting teams.
+
+Runs each starting team through a season with CBC, with and without the
+previous race's team as the starting solution and objective cutoff, and
+compares wall time and the branch-and-bound nodes and LP iterations CBC
+reports in its log.
+The in-process `EnumerationSolver` is timed the same way, the cutoff being
+all it takes from a warm start. Each pair of runs is checked to finish on the
+same points.
+"""
+
+import logging
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from pulp import LpSolver, PULP_CBC_CMD
+
+from common import setup_logging
+from helpers import load_with_derivations
+from linear.solver_enumerate import EnumerationSolver
+from linear.strategy_base import StrategyBase
+from linear.strategy_p2pm import StrategyMaxP2PM
+from races.first_picks import iter_starting_teams
+from races.season import Season, factory_season
+from races.team import factory_team_picks
+from scripts.run_single_team import run_for_team
+
+_SEASON_YEAR = 2025
+_NUM_TEAMS = 20
+_MIN_TOTAL_VALUE = 99.5
+
+_RE_CBC_NODES = re.compile(r"Enumerated nodes:\s+(\d+)")
+_RE_CBC_ITERATIONS = re.compile(r"Total iterations:\s+(\d+)")
+
+
+class LoggedCbc(PULP_CBC_CMD):
+    """CBC writing each solve's log to a file, so the nodes and iterations it took can be read back."""
+    def __init__(self, log_dir: Path, warm_start: bool):
+        self.log_dir = log_dir
+        self.nodes = 0
+        self.iterations = 0
+        self.solves = 0
+        super().__init__(msg=0, warmStart=warm_start, logPath=str(log_dir / "cbc.log"))
+
+    def actualSolve(self, lp, **kwargs):
+        status = super().actualSolve(lp, **kwargs)
+        log = Path(self.optionsDict["logPath"]).read_text()
+        for (pattern, attr) in [(_RE_CBC_NODES, "nodes"), (_RE_CBC_ITERATIONS, "iterations")]:
+            match = pattern.search(log)
+            setattr(self, attr, getattr(self, attr) + (int(match.group(1)) if match is not None else 0))
+        self.solves += 1
+        return status
+
+
+def run_teams(strategy: type[StrategyBase], season: Season, solver: LpSolver, warm_start: bool) -> tuple[float, list[int]]:
+    """Return the wall time in seconds to run the benchmark teams through the season, and their final points."""
+    chunk = next(iter_starting_teams(_SEASON_YEAR, 1, _MIN_TOTAL_VALUE, chunk_size=_NUM_TEAMS))
+
+    points = []
+    start = time.perf_counter()
+    for (driver_picks, constructor_picks) in zip(chunk.driver_picks, chunk.constructor_picks):
+        team = factory_team_picks(driver_picks, constructor_picks, season.races[1])
+        rows = run_for_team(strategy, team, season, _SEASON_YEAR, 1, solver=solver, warm_start=warm_start)
+        points.append(rows[-1]["total_points"])
+    return time.perf_counter() - start, points
+
+
+def bench_warm_start(strategy: type[StrategyBase], season: Season):
+    with tempfile.TemporaryDirectory() as log_dir:
+        results = {}
+        for warm_start in [False, True]:
+            solver = LoggedCbc(Path(log_dir), warm_start)
+            (secs, points) = run_teams(strategy, season, solver, warm_start)
+            results[warm_start] = (secs, points)
+            logging.info(
+                f"{strategy.__name__} CBC {'warm' if warm_start else 'cold'}: {solver.solves} solves, "
+                f"{solver.nodes} nodes, {solver.iterations} iterations, {secs:.2f}s"
+            )
+
+    if results[False][1] != results[True][1]:
+        logging.warning(f"{strategy.__name__} CBC final points differ, {results[False][1]} vs {results[True][1]}")
+
+    results = {}
+    for warm_start in [False, True]:
+        results[warm_start] = run_teams(strategy, season, EnumerationSolver(), warm_start)
+        logging.info(f"{strategy.__name__} EnumerationSolver {'warm' if warm_start else 'cold'}: {results[warm_start][0]:.2f}s")
+
+    if results[False][1] != results[True][1]:
+        logging.warning(f"{strategy.__name__} EnumerationSolver final points differ, {results[False][1]} vs {results[True][1]}")
+
+
+if __name__ == "__main__":
+    setup_logging()
+
+    (_df_driver_ppm, _df_constructor_ppm, _df_driver_pairs) = load_with_derivations(season=_SEASON_YEAR)
+    _season = factory_season(_df_driver_ppm, _df_constructor_ppm, _df_driver_pairs, _SEASON_YEAR)
+
+    bench_warm_start(StrategyMaxP2PM, _season)
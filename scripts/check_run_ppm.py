@@ -3,18 +3,18 @@
 import pandas as pd
 import logging
 
-from common import setup_logging, AssetType
-from import_data.derivations import derivation_cum_tot
-from import_data.import_history import load_all_archive_data
+from common import setup_logging, AssetType, F1_SEASON_CONSTRUCTORS
+from helpers import load_seasons_with_derivations
 
 _FILE_DERIVED_DRIVER = "outputs/f1_fantasy_derived_ppm_driver.xlsx"
 _FILE_DERIVED_CONSTRUCTOR = "outputs/f1_fantasy_derived_ppm_constructor.xlsx"
 
 
 def load_all_archives_add_derived(asset_type: AssetType, rolling_window: int = -1) -> pd.DataFrame:
-    df = load_all_archive_data(asset_type)
-    df = derivation_cum_tot(df, asset_type=asset_type, rolling_window=rolling_window)
-    return df
+    # Through the archive cache, so once a race is archived only that race is derived
+    seasons = load_seasons_with_derivations(F1_SEASON_CONSTRUCTORS.keys(), [rolling_window])
+    df = pd.concat([df_driver if asset_type == AssetType.DRIVER else df_constructor for (df_driver, df_constructor, _) in seasons.values()])
+    return df.reset_index(drop=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,19 @@
+"""Compact the batch results store, merging each partition's checkpoint fragments into a single parquet file.
+
+A results file written before the store existed is imported first, so it is compacted along with everything else.
+"""
+
+import logging
+
+from common import setup_logging
+from scripts.batch_results_store import compact_batch_results, import_batch_results_file
+from scripts.run_multiple_teams import _DIR_BATCH_RESULTS, _FILE_BATCH_RESULTS_PARQET
+
+if __name__ == "__main__":
+    setup_logging()
+
+    import_batch_results_file(_FILE_BATCH_RESULTS_PARQET, _DIR_BATCH_RESULTS)
+
+    logging.info(f"Compacting {_DIR_BATCH_RESULTS}...")
+    compacted = compact_batch_results(_DIR_BATCH_RESULTS)
+    logging.info(f"... done, compacted {compacted} partitions")
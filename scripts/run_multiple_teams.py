@@ -1,52 +1,143 @@
-"""Run batch simulations across seasons and strategies, appending results to a parquet batch results file."""
+"""Run batch simulations across seasons and strategies, appending results to the parquet batch results store."""
 
 import os
 import pandas as pd
 import logging
+from multiprocessing import Pool
+from typing import Iterable, Iterator
 
 from common import F1_SEASON_CONSTRUCTORS, setup_logging
 from helpers import load_with_derivations
+from linear.solver_enumerate import EnumerationSolver
 from linear.strategy_base import StrategyBase
 from linear.strategy_budget import StrategyMaxBudget
 from linear.strategy_p2pm import StrategyMaxP2PM
 from linear.strategy_zero_stop import StrategyZeroStop
-from races.first_picks import get_starting_combinations
-from races.season import factory_race, factory_season
-from races.team import Team, factory_team_row
-from scripts.run_single_team import get_strat_display_name, run_for_team
+from races.first_picks import Prescreen, iter_starting_teams
+from races.season import Season, factory_race, factory_season
+from races.team import Team, factory_team_picks
+from scripts.batch_results_store import SimKeyIndex, read_batch_results, write_batch_fragment
+from scripts.run_single_team import TrajectoryMemo, get_strat_display_name, run_for_team
 
 ALL_STRATEGIES = [StrategyZeroStop, StrategyMaxP2PM, StrategyMaxBudget]
 
 _SEASONS = F1_SEASON_CONSTRUCTORS.keys()
-_FILE_BATCH_RESULTS_PARQET = "outputs/f1_fantasy_results_batch.parquet"
+_DIR_BATCH_RESULTS = "outputs/f1_fantasy_results_batch"
+_FILE_BATCH_RESULTS_PARQET = "outputs/f1_fantasy_results_batch.parquet"  # Single file used before the store, see compact_batch_results.py
 _FILE_BATCH_RESULTS_EXCEL = "outputs/f1_fantasy_results_batch.csv"
 _SUB_STRAT = "unlimited_chip_4"
 
+# Cut-off on the starting teams simulated, e.g. Prescreen("Odds", 1, 500); None simulates them all.  Teams start at
+# race 1, so only race 1 prices, odds or derivations can be scored without looking ahead
+_PRESCREEN: Prescreen | None = None
 
-def get_starting_key(strat_name: str, season: int, team: Team, sub_strat: str = "") -> str:
+# Every race of every team is solved, so keep the solves in-process rather than one CBC subprocess each
+_SOLVER = EnumerationSolver()
+
+# Worker processes for the batch, each starting team is independent of every other
+_JOBS = os.cpu_count() or 1
+# Starting teams handed to a worker at a time, enough to amortise the round trip without starving the pool
+_POOL_CHUNKSIZE = 8
+
+# Per-worker copy of the season being simulated, set once by the pool initialiser rather than pickled per task
+_worker_state: dict = {}
+
+
+def get_starting_key(strat_name: str, season: int, team: Team, sub_strat: str = "", cut_off: str = "") -> str:
     if len(sub_strat) > 0:
-        return f"({strat_name}:{sub_strat})({season}){team}"
+        strat_name = f"{strat_name}:{sub_strat}"
+    if len(cut_off) > 0:
+        return f"({strat_name})({season})({cut_off}){team}"
     else:
         return f"({strat_name})({season}){team}"
     
 
-def open_batch_results_file(fn: str) -> pd.DataFrame:
-    if not os.path.exists(fn):
-        return pd.DataFrame(columns=["sim_key"])
-    
-    df = pd.read_parquet(fn)
+def open_batch_results_file(fn: str, columns: list[str] | None = None, filters: list[tuple] | None = None) -> pd.DataFrame:
+    df = read_batch_results(fn, columns=columns, filters=filters)
     logging.debug(f"Opened {fn} with shape {df.shape}")
     return df
 
-def write_batch_results(df_batch_results: pd.DataFrame, rows_append: list) -> pd.DataFrame:
-    df_tmp = pd.DataFrame(rows_append)
-    df_batch_results = pd.concat([df_batch_results, df_tmp])
-    logging.info(f"Writing {_FILE_BATCH_RESULTS_PARQET}, new shape {df_tmp.shape}, total shape {df_batch_results.shape}")
-    df_batch_results.to_parquet(_FILE_BATCH_RESULTS_PARQET)
-    return df_batch_results
-
 
-def run_strategy_for_season(season_year: int, strategy: type[StrategyBase]):
+def write_batch_results(rows_append: list, sim_key_index: SimKeyIndex, root: str = _DIR_BATCH_RESULTS) -> int:
+    written = write_batch_fragment(rows_append, root)
+    # Only index the keys once their rows are safely on disk
+    sim_key_index.add(row["sim_key"] for row in rows_append)
+    logging.info(f"Writing {root}, new rows {written}, total simulations {len(sim_key_index)}")
+    return written
+
+
+def run_starting_team(
+    strategy: type[StrategyBase],
+    season: Season,
+    season_year: int,
+    sim_key: str,
+    team: Team,
+    memo: TrajectoryMemo | None = None,
+) -> dict:
+    """Simulate one starting team through the season, returning its final results row."""
+    rows_intermediate = run_for_team(strategy, team, season, season_year, 1, _SUB_STRAT, solver=_SOLVER, memo=memo, warm_start=True)
+    row_final = rows_intermediate[-1]
+    row_final["sim_key"] = sim_key
+    return row_final
+
+
+def _init_worker(strategy: type[StrategyBase], season: Season, season_year: int, memoise: bool):
+    _worker_state["strategy"] = strategy
+    _worker_state["season"] = season
+    _worker_state["season_year"] = season_year
+    _worker_state["memo"] = TrajectoryMemo() if memoise else None
+
+
+def _run_worker_task(task: tuple[str, Team]) -> tuple[dict, int, int]:
+    """Run one task in a worker, returning its final row and the memo hits and misses it added."""
+    (sim_key, team) = task
+    memo = _worker_state["memo"]
+    (hits, misses) = (memo.hits, memo.misses) if memo is not None else (0, 0)
+    row_final = run_starting_team(
+        _worker_state["strategy"],
+        _worker_state["season"],
+        _worker_state["season_year"],
+        sim_key,
+        team,
+        memo,
+    )
+    if memo is not None:
+        (hits, misses) = (memo.hits - hits, memo.misses - misses)
+    return row_final, hits, misses
+
+
+def run_starting_teams(
+    strategy: type[StrategyBase],
+    season: Season,
+    season_year: int,
+    tasks: Iterable[tuple[str, Team]],
+    jobs: int = 1,
+    memo: TrajectoryMemo | None = None,
+) -> Iterator[dict]:
+    """Simulate each (sim_key, starting team) task, yielding final rows as they finish.
+
+    With more than one job the tasks are fanned out across a process pool.  The
+    season is sent to each worker once when it starts, and rows arrive in
+    completion order rather than task order, so callers checkpoint as they go.
+
+    If `memo` is given, races already simulated for another starting team are
+    replayed rather than solved.  Each pool worker keeps a memo of its own, and
+    their hits and misses are added to `memo`'s counts.
+    """
+    if jobs <= 1:
+        for (sim_key, team) in tasks:
+            yield run_starting_team(strategy, season, season_year, sim_key, team, memo)
+        return
+
+    with Pool(processes=jobs, initializer=_init_worker, initargs=(strategy, season, season_year, memo is not None)) as pool:
+        for (row_final, hits, misses) in pool.imap_unordered(_run_worker_task, tasks, chunksize=_POOL_CHUNKSIZE):
+            if memo is not None:
+                memo.hits += hits
+                memo.misses += misses
+            yield row_final
+
+
+def run_strategy_for_season(season_year: int, strategy: type[StrategyBase], jobs: int = _JOBS, prescreen: Prescreen | None = _PRESCREEN):
     (df_driver_ppm, df_constructor_ppm, df_driver_pairs) = load_with_derivations(season=season_year)
     
     _season = factory_season(
@@ -63,41 +154,47 @@ def run_strategy_for_season(season_year: int, strategy: type[StrategyBase]):
         1,
     )
 
-    _df_batch_results = open_batch_results_file(_FILE_BATCH_RESULTS_PARQET)
-    _df_combinations = get_starting_combinations(season_year, 1, 99.5)
+    strat_display_name = get_strat_display_name(strategy, _SUB_STRAT)
+
+    _sim_key_index = SimKeyIndex(_DIR_BATCH_RESULTS)
 
     counter = 0
     skipped = 0
     _rows_append = []
+    _memo = TrajectoryMemo()
+    _cut_off = prescreen.get_key() if prescreen is not None else ""
 
-    strat_display_name = get_strat_display_name(strategy, _SUB_STRAT)
-    logging.info(f"Running simulation for season {season_year} strategy {strat_display_name}")
+    logging.info(f"Running simulation for season {season_year} strategy {strat_display_name} across {jobs} jobs")
 
-    for _idx, _row in _df_combinations.iterrows():
-        _team = factory_team_row(_row.to_dict(), _race_first)
-        _sim_key = get_starting_key(strategy.__name__, season_year, _team, _SUB_STRAT)
+    def _iter_tasks() -> Iterator[tuple[str, Team]]:
+        nonlocal skipped
+        for _chunk in iter_starting_teams(season_year, 1, 99.5, prescreen=prescreen):
+            for (_driver_picks, _constructor_picks) in zip(_chunk.driver_picks, _chunk.constructor_picks):
+                _team = factory_team_picks(_driver_picks, _constructor_picks, _race_first)
+                _sim_key = get_starting_key(strategy.__name__, season_year, _team, _SUB_STRAT, _cut_off)
 
-        if _sim_key in _df_batch_results["sim_key"].unique():
-            logging.debug(f"Skipping batch for {_sim_key}")
-            skipped += 1
+                if _sim_key in _sim_key_index:
+                    logging.debug(f"Skipping batch for {_sim_key}")
+                    skipped += 1
+                else:
+                    yield (_sim_key, _team)
 
-        else:
-            _rows_intermediate = run_for_team(strategy, _team, _season, season_year, 1, _SUB_STRAT)
-            _row_final = _rows_intermediate[-1]
-            _row_final["sim_key"] = _sim_key
-            _rows_append.append(_row_final)
+    for _row_final in run_starting_teams(strategy, _season, season_year, _iter_tasks(), jobs, _memo):
+        _rows_append.append(_row_final)
 
-            counter += 1
-            if counter % 100 == 0:
-                logging.info(f"Batch {counter} of {len(_df_combinations.index)-skipped}, writing to disk, skipped {skipped}...")
-                _df_batch_results = write_batch_results(_df_batch_results, _rows_append)
-                _rows_append = []
+        counter += 1
+        if counter % 100 == 0:
+            logging.info(f"Batch {counter}, writing to disk, skipped {skipped}...")
+            write_batch_results(_rows_append, _sim_key_index)
+            _rows_append = []
 
     # Write any remaining results
     logging.info(f"Writing remaining {len(_rows_append)} batches to disk, skipped {skipped}...")
-    _df_batch_results = write_batch_results(_df_batch_results, _rows_append)
+    write_batch_results(_rows_append, _sim_key_index)
     _rows_append = []
 
+    logging.info(f"Trajectory memo {_memo.hits} hits, {_memo.misses} misses, hit rate {_memo.hit_rate():.1%}")
+
 
 if __name__ == "__main__":
     setup_logging()
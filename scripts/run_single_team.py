@@ -2,13 +2,15 @@
 
 import pandas as pd
 import logging
+from typing import NamedTuple
+from pulp import LpSolver
 from pulp.constants import LpStatusOptimal
 
 from common import AssetType, setup_logging
 from helpers import load_with_derivations
 from linear.strategy_base import StrategyBase, VarType
 from linear.strategy_budget import StrategyMaxBudget
-from linear.strategy_factory import factory_strategy
+from linear.strategy_factory import factory_strategy, factory_strategy_model
 from linear.strategy_p2pm import StrategyMaxP2PM
 from linear.strategy_zero_stop import StrategyZeroStop
 from races.season import Season, factory_season, Race
@@ -40,6 +42,116 @@ TEAM_START_CONSTRUCTORS = ["FER", "VRB"]
 STARTING_RACE = 12
 STARTING_UNUSED_BUDGET = 0.1
 
+# Unused budget is only ever float noise away from a multiple of the 0.1 price step
+_MEMO_BUDGET_PRECISION = 6
+# Bound on cached races per process, each holds a results row
+_MEMO_MAX_ENTRIES = 50_000
+
+
+class TrajectoryStep(NamedTuple):
+    """One race of a cached trajectory: its results row, the team it ended with, and the key of the next race."""
+    row: dict
+    drivers: tuple[str, ...]
+    constructors: tuple[str, ...]
+    unused_budget: float
+    drs_driver: str
+    next_key: tuple | None
+
+
+class TrajectoryMemo:
+    """Cache of simulated races, shared across the starting teams of a batch.
+
+    Once two starting teams arrive at a race with the same team, unused budget and
+    free transfer, the rest of their season is identical, so it only needs solving
+    once.  Each race is cached against that state, linked to the race after it, so
+    a hit replays the rest of the season from the cache.
+
+    Attributes:
+        hits: Lookups which found a cached race.
+        misses: Lookups which had to be solved.
+        max_entries: Races to cache before new ones are no longer added.
+    """
+    def __init__(self, max_entries: int = _MEMO_MAX_ENTRIES):
+        self._steps: dict[tuple, TrajectoryStep] = {}
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._steps
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    @classmethod
+    def get_key(cls, strat_name: str, season_year: int, race_num: int, team: Team, bonus_free_transfer: bool) -> tuple:
+        """Return the state which decides every race from `race_num` onwards."""
+        return (
+            strat_name,
+            season_year,
+            race_num,
+            tuple(sorted(team.assets[AssetType.DRIVER])),
+            tuple(sorted(team.assets[AssetType.CONSTRUCTOR])),
+            round(team.unused_budget, _MEMO_BUDGET_PRECISION),
+            bonus_free_transfer,
+            team.drs_driver,
+        )
+
+    def add(self, steps: list):
+        """Cache the races of one trajectory, given in race order as (key, step) pairs.
+
+        Added from the last race backwards, so a cached race can always follow its
+        links to the end of the season, even once the cache is full.
+        """
+        for key, step in reversed(steps):
+            if len(self._steps) >= self.max_entries:
+                break
+            self._steps[key] = step
+
+    def lookup(self, key: tuple, team: Team, starting_value: float, starting_value_d: float, starting_value_c: float) -> list | None:
+        """Return the replayed rows from `key` to the end of the season, or None if `key` is not cached.
+
+        This is the lookup counted in `hits` and `misses`; see `replay` for the rows and `team`.
+        """
+        if key not in self._steps:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.replay(key, team, starting_value, starting_value_d, starting_value_c)
+
+    def replay(self, key: tuple, team: Team, starting_value: float, starting_value_d: float, starting_value_c: float) -> list:
+        """Return the cached rows from `key` to the end of the season, leaving `team` as it would finish.
+
+        Cumulative points and starting values belong to the team being simulated,
+        so those are rebased onto it in each row.
+        """
+        rows = []
+        step = None
+        next_key = key
+        while next_key is not None:
+            step = self._steps[next_key]
+            team.total_points += step.row["points"]
+            row = step.row.copy()
+            row["total_points"] = team.total_points
+            row["starting_value"] = starting_value
+            row["starting_value_d"] = starting_value_d
+            row["starting_value_c"] = starting_value_c
+            rows.append(row)
+            next_key = step.next_key
+
+        team.remove_all_assets()
+        for d in step.drivers:
+            team.add_asset(AssetType.DRIVER, d)
+        for c in step.constructors:
+            team.add_asset(AssetType.CONSTRUCTOR, c)
+        team.unused_budget = step.unused_budget
+        team.drs_driver = step.drs_driver
+        return rows
+
 
 def get_row_intermediate_results(
         strat_name: str,
@@ -93,7 +205,17 @@ def get_strat_display_name(strategy: type[StrategyBase], sub_strat: str = ""):
         return f"{strategy.__name__}"
 
 
-def run_for_team(strategy: type[StrategyBase], team: Team, season: Season, season_year: int, race_num_start: int, sub_strat: str = "") -> list:
+def run_for_team(
+    strategy: type[StrategyBase],
+    team: Team,
+    season: Season,
+    season_year: int,
+    race_num_start: int,
+    sub_strat: str = "",
+    solver: LpSolver | None = None,
+    memo: TrajectoryMemo | None = None,
+    warm_start: bool = False,
+) -> list:
     # Strategy name we'll use for the results data set
     strat_name = get_strat_display_name(strategy, sub_strat)
     
@@ -114,6 +236,12 @@ def run_for_team(strategy: type[StrategyBase], team: Team, season: Season, seaso
     starting_value_d = team.total_value_drivers(season.races[race_num_start], season.races[race_num_start])
     starting_value_c = team.total_value_constructors(season.races[race_num_start])
 
+    # Races simulated here, to add to the memo once the season is done
+    memo_steps = []
+
+    # One LP model for the whole season, only its coefficients change from race to race
+    strategy_model = factory_strategy_model(season)
+
     for race_num in races:
         # Do we have a bonus free transfer from the previous race?
         max_moves = 3 if bonus_free_transfer else 2
@@ -124,9 +252,19 @@ def run_for_team(strategy: type[StrategyBase], team: Team, season: Season, seaso
         # First race already has a team selection, skip this out
         if race_num > race_num_start:
 
-            strat = factory_strategy(season.races[race_num], race_prev, team, strategy, max_moves=max_moves, season_year=season_year)
+            # If another starting team has already been here, the rest of the season is the same as theirs
+            if memo is not None:
+                memo_key = TrajectoryMemo.get_key(strat_name, season_year, race_num, team, bonus_free_transfer)
+                if len(memo_steps) > 0:
+                    memo_steps[-1][1] = memo_steps[-1][1]._replace(next_key=memo_key)
+                rows_cached = memo.lookup(memo_key, team, starting_value, starting_value_d, starting_value_c)
+                if rows_cached is not None:
+                    rows = rows + rows_cached
+                    break
+
+            strat = factory_strategy(season.races[race_num], race_prev, team, strategy, max_moves=max_moves, season_year=season_year, solver=solver, warm_start=warm_start)
 
-            model = strat.execute()
+            model = strat.execute(strategy_model)
 
             # If model failed, we need to barf - it should never be impossible to solve
             if model.status != LpStatusOptimal:
@@ -182,6 +320,22 @@ def run_for_team(strategy: type[StrategyBase], team: Team, season: Season, seaso
             )
         )
 
+        if memo is not None and race_num > race_num_start:
+            memo_steps.append([
+                memo_key,
+                TrajectoryStep(
+                    row=rows[-1].copy(),
+                    drivers=tuple(team.assets[AssetType.DRIVER]),
+                    constructors=tuple(team.assets[AssetType.CONSTRUCTOR]),
+                    unused_budget=team.unused_budget,
+                    drs_driver=team.drs_driver,
+                    next_key=None,
+                ),
+            ])
+
+    if memo is not None:
+        memo.add(memo_steps)
+
     return rows
 
 
@@ -213,7 +367,7 @@ if __name__ == "__main__":
         if STARTING_RACE > 1:
             _team.unused_budget = STARTING_UNUSED_BUDGET
         
-        _rows = _rows + run_for_team(strat, _team, _season, SEASON, STARTING_RACE)
+        _rows = _rows + run_for_team(strat, _team, _season, SEASON, STARTING_RACE, warm_start=True)
 
     # Create a DataFrame from the results rows and save to Excel
     pd.DataFrame(_rows).to_excel(_FILE_BATCH_RESULTS, index=False)
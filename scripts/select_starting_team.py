@@ -3,7 +3,7 @@ from helpers import load_with_derivations
 from races.first_picks import get_starting_combinations
 from races.season import factory_race
 from races.team import Team, factory_team_row
-from scripts.run_multiple_teams import _FILE_BATCH_RESULTS_PARQET, ALL_STRATEGIES, get_starting_key, open_batch_results_file
+from scripts.run_multiple_teams import _DIR_BATCH_RESULTS, ALL_STRATEGIES, get_starting_key, open_batch_results_file
 import logging
 
 _SEASON_YEAR = 2026
@@ -21,7 +21,11 @@ def select_starting_team(season_year=_SEASON_YEAR, min_budget=_MIN_BUDGET) -> Te
     )
 
     _df_combinations = get_starting_combinations(season_year, 1, min_budget)
-    _df_batch_results = open_batch_results_file(_FILE_BATCH_RESULTS_PARQET)
+    _df_batch_results = open_batch_results_file(
+        _DIR_BATCH_RESULTS,
+        columns=["sim_key", "total_points"],
+        filters=[("season", "==", season_year)],
+    )
 
     _min_starting_ratio = 999.99
     final_team = None
@@ -24,3 +24,17 @@ def isolate_betting_odds(monkeypatch):
     """
     monkeypatch.setattr("fast_f1.output.load_odds", lambda *args, **kwargs: {})
     yield
+
+
+@pytest.fixture(autouse=True)
+def isolate_archive_cache(monkeypatch, tmp_path):
+    """Keep archive cache writes from `helpers.load_with_derivations` inside a temporary test path."""
+    monkeypatch.setattr("helpers._DIR_ARCHIVE_CACHE", str(tmp_path / "archive_cache"))
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolate_event_schedules(monkeypatch):
+    """Start every test without the schedules an earlier test loaded into `fast_f1.api`."""
+    monkeypatch.setattr("fast_f1.api._season_schedules", {})
+    yield
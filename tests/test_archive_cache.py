@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+from pathlib import Path
+
+import helpers
+from import_data import derivations
+from import_data.archive_cache import get_cache_path, get_file_hash, read_cached_frames, write_cached_frames
+
+
+def test_file_hash_follows_contents(tmp_path: Path):
+    fn = tmp_path / "archive.xlsx"
+    fn.write_bytes(b"version 1")
+    hash_1 = get_file_hash(str(fn))
+    assert get_file_hash(str(fn)) == hash_1
+
+    fn.write_bytes(b"version 2, edited")
+    assert get_file_hash(str(fn)) != hash_1
+
+
+def test_write_read_cached_frames(tmp_path: Path):
+    fn = tmp_path / "archive.xlsx"
+    fn.write_bytes(b"version 1")
+    cache_dir = str(tmp_path / "cache")
+
+    df_a = pd.DataFrame({"Driver": ["VER@RED", "NOR@MCL"], "Race": [1, 1], "PPM": [1.5, np.nan]})
+    df_b = pd.DataFrame({"Constructor": ["RED"], "Race": [2]}, index=[7])
+
+    cache_path = get_cache_path(cache_dir, str(fn), "window_3")
+    assert read_cached_frames(cache_path, ["a", "b"]) is None
+
+    write_cached_frames(cache_path, {"a": df_a, "b": df_b})
+    frames = read_cached_frames(cache_path, ["a", "b"])
+    pdt.assert_frame_equal(frames["a"], df_a)
+    pdt.assert_frame_equal(frames["b"], df_b)
+
+    # Only some of the frames cached
+    assert read_cached_frames(cache_path, ["a", "c"]) is None
+
+    # Editing the workbook moves to a new cache, and writing there removes the old one
+    fn.write_bytes(b"version 2, edited")
+    cache_path_2 = get_cache_path(cache_dir, str(fn), "window_3")
+    assert cache_path_2 != cache_path
+    assert read_cached_frames(cache_path_2, ["a"]) is None
+
+    write_cached_frames(cache_path_2, {"a": df_a})
+    assert not cache_path.exists()
+    assert [p.name for p in Path(cache_dir).iterdir()] == [cache_path_2.parent.name]
+
+
+def test_load_with_derivations_uses_cache(monkeypatch):
+    load_with_derivations = helpers._load_with_derivations.__wrapped__
+    frames = load_with_derivations(2024, (3,))
+
+    # Served from the cache without touching the workbook
+    def fail(*args, **kwargs):
+        raise AssertionError("Archive read despite cache")
+
+    monkeypatch.setattr(helpers, "load_archive_data", fail)
+    for df_cached, df in zip(load_with_derivations(2024, (3,)), frames):
+        pdt.assert_frame_equal(df_cached, df)
+
+    # Another season or set of windows is not cached yet
+    with pytest.raises(AssertionError):
+        load_with_derivations(2023, (3,))
+    with pytest.raises(AssertionError):
+        load_with_derivations(2024, (2, 3))
+
+
+def test_load_with_derivations_from_previous_version(tmp_path: Path, monkeypatch):
+    season = 2025
+    names = [f"{season}_driver_ppm", f"{season}_constructor_ppm", f"{season}_driver_pairs"]
+    (df_driver_ppm, df_constructor_ppm, df_driver_pairs) = helpers.load_with_derivations(season, [3])
+
+    # A previous version of the workbook, before the last race was archived
+    last_race = df_driver_ppm["Race"].max()
+    cache_path_previous = tmp_path / "previous_hash" / "window_3"
+    write_cached_frames(cache_path_previous, {
+        names[0]: df_driver_ppm[df_driver_ppm["Race"] < last_race].reset_index(drop=True),
+        names[1]: df_constructor_ppm[df_constructor_ppm["Race"] < last_race].reset_index(drop=True),
+        names[2]: df_driver_pairs[df_driver_pairs["Race"] < last_race],
+    })
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Season derived from scratch despite previous version")
+
+    monkeypatch.setattr(helpers, "_DIR_ARCHIVE_CACHE", str(tmp_path))
+    monkeypatch.setattr(derivations, "derivation_cum_tot", fail)
+    frames = helpers.load_seasons_with_derivations([season], [3])[season]
+
+    pdt.assert_frame_equal(frames[0], df_driver_ppm, check_exact=True)
+    pdt.assert_frame_equal(frames[1], df_constructor_ppm, check_exact=True)
+    assert not cache_path_previous.exists()
@@ -1,8 +1,19 @@
+import pickle
 import pytest
 import pandas as pd
 import numpy as np
 
-from races.asset import factory_driver, factory_constructor
+from common import AssetType
+from races.asset import (
+    AssetIndex,
+    Constructor,
+    Derivs,
+    Driver,
+    factory_asset,
+    factory_constructor,
+    factory_driver,
+    get_deriv_schema,
+)
 
 
 def test_factory_driver():
@@ -187,3 +198,85 @@ def test_factory_constructor():
         )
     assert constructor_3.derivs["col1"] == 0.5
     assert constructor_3.derivs["col2"] == 0.6
+
+
+def test_asset_index_matches_factory_asset():
+    df = pd.DataFrame(
+        columns=["Driver", "Race", "col1", "Price", "Points", "col2", "Season"],
+        data=[["VER", 1, 0.5, 33.33, 13, 0.6, 2023], ["VER", 2, 4.4, 44.44, 14, np.nan, 2023], ["HAM", 2, 1.1, 11.11, 2, 0.2, 2023]]
+    )
+    index = AssetIndex(df, AssetType.DRIVER)
+
+    for driver, race in [("VER", 1), ("VER", 2), ("HAM", 2)]:
+        (derivs, price, points) = index.get(driver, race)
+        (derivs_exp, price_exp, points_exp) = factory_asset(df, AssetType.DRIVER, driver, race)
+        assert derivs.keys() == derivs_exp.keys()
+        np.testing.assert_array_equal(list(derivs.values()), list(derivs_exp.values()))
+        assert price == price_exp
+        assert points == points_exp
+
+    with pytest.raises(ValueError) as excinfo:
+        index.get("HAM", 1)
+    assert str(excinfo.value) == "Driver HAM not found for race 1"
+
+    # Duplicates only raise when that asset and race is looked up
+    index = AssetIndex(pd.concat([df, df.iloc[[2]]]), AssetType.DRIVER)
+    assert index.get("VER", 2)[2] == 14
+    with pytest.raises(ValueError) as excinfo:
+        index.get("HAM", 2)
+    assert str(excinfo.value) == "Multiple entries found for Driver HAM in race 2"
+
+
+def test_asset_index_constructor():
+    df = pd.DataFrame(
+        columns=["Constructor", "Race", "col1", "Price", "Points", "col2"],
+        data=[["RED", 1, 0.5, 33.33, 13, 0.6], ["RED", 2, 4.4, 44.44, 14, np.nan], ["MER", 2, 1.1, 11.11, 2, 0.2]]
+    )
+    index = AssetIndex(df, AssetType.CONSTRUCTOR)
+
+    # Derivations in column order, missing values kept as NaN
+    (derivs, price, points) = index.get("RED", 2)
+    assert list(derivs.keys()) == ["col1", "col2"]
+    assert derivs["col1"] == 4.4
+    assert np.isnan(derivs["col2"])
+    assert (price, points) == (44.44, 14)
+    assert index.get("MER", 2)[0].schema is derivs.schema
+
+    with pytest.raises(ValueError) as excinfo:
+        index.get("MER", 1)
+    assert str(excinfo.value) == "Constructor MER not found for race 1"
+
+    # Price and points are only needed for an asset found
+    index = AssetIndex(pd.DataFrame(columns=["Constructor", "Race"], data=[["RED", 1], ["RED", 1]]), AssetType.CONSTRUCTOR)
+    with pytest.raises(ValueError) as excinfo:
+        index.get("RED", 1)
+    assert str(excinfo.value) == "Multiple entries found for Constructor RED in race 1"
+    with pytest.raises(ValueError) as excinfo:
+        index.get("RED", 2)
+    assert str(excinfo.value) == "Constructor RED not found for race 2"
+
+
+def test_asset_derivs_share_schema():
+    driver = Driver("VER", "RED", 33.3, 13, {"col1": 0.5, "col2": 0.6})
+    constructor = Constructor("RED", 66.6, 16, {"col1": 1.5, "col2": 1.6})
+
+    # Slotted, derivations read like a dict
+    assert not hasattr(driver, "__dict__")
+    assert driver.derivs["col2"] == 0.6
+    assert dict(constructor.derivs) == {"col1": 1.5, "col2": 1.6}
+    assert list(driver.derivs.keys()) == ["col1", "col2"]
+    assert len(driver.derivs) == 2
+    with pytest.raises(KeyError):
+        driver.derivs["col3"]
+
+    # One schema for every asset with the same derivations, including across a pickle
+    assert driver.derivs.schema is constructor.derivs.schema
+    (driver_copy, constructor_copy) = pickle.loads(pickle.dumps((driver, constructor)))
+    assert driver_copy.derivs.schema is driver.derivs.schema
+    assert (driver_copy.driver, driver_copy.constructor, driver_copy.price, driver_copy.points) == ("VER", "RED", 33.3, 13)
+    assert dict(driver_copy.derivs) == dict(driver.derivs)
+    assert isinstance(constructor_copy, Constructor)
+    assert dict(constructor_copy.derivs) == dict(constructor.derivs)
+
+    with pytest.raises(ValueError):
+        Derivs(get_deriv_schema(("col1", "col2")), (1.0,))
@@ -0,0 +1,120 @@
+import pandas as pd
+import pandas.testing as pdt
+from pathlib import Path
+
+from scripts.batch_results_store import (
+    SimKeyIndex,
+    compact_batch_results,
+    import_batch_results_file,
+    list_batch_fragments,
+    read_batch_results,
+    write_batch_fragment,
+)
+
+
+def _get_rows(season: int, strategy: str, keys: list[str]) -> list[dict]:
+    return [{"strategy": strategy, "season": season, "total_points": i, "sim_key": k} for i, k in enumerate(keys)]
+
+
+def _sorted(df: pd.DataFrame) -> pd.DataFrame:
+    return df[["strategy", "season", "total_points", "sim_key"]].sort_values("sim_key").reset_index(drop=True)
+
+
+def test_read_missing_store_returns_empty(tmp_path: Path):
+    df = read_batch_results(str(tmp_path / "missing"))
+    assert df.empty
+    assert list(df.columns) == ["sim_key"]
+
+
+def test_write_appends_fragments_per_partition(tmp_path: Path):
+    root = str(tmp_path / "store")
+
+    assert write_batch_fragment(_get_rows(2025, "StrategyMaxP2PM:unlimited_chip_4", ["a", "b"]) + _get_rows(2024, "StrategyZeroStop", ["c"]), root) == 3
+    assert write_batch_fragment(_get_rows(2025, "StrategyMaxP2PM:unlimited_chip_4", ["d"]), root) == 1
+    assert write_batch_fragment([], root) == 0
+
+    # One fragment per partition per write
+    fragments = list_batch_fragments(root)
+    assert sorted(len(f) for f in fragments.values()) == [1, 2]
+
+    # Partition columns come back with the types they were written with
+    df = read_batch_results(root)
+    assert df["season"].dtype == int
+    assert df["strategy"].dtype == object
+    pdt.assert_frame_equal(
+        _sorted(df),
+        _sorted(pd.DataFrame(_get_rows(2025, "StrategyMaxP2PM:unlimited_chip_4", ["a", "b"]) + _get_rows(2024, "StrategyZeroStop", ["c"]) + _get_rows(2025, "StrategyMaxP2PM:unlimited_chip_4", ["d"]))),
+    )
+
+    # Filtering on partitions
+    df = read_batch_results(root, columns=["sim_key"], filters=[("season", "==", 2025), ("strategy", "==", "StrategyMaxP2PM:unlimited_chip_4")])
+    assert list(df.columns) == ["sim_key"]
+    assert sorted(df["sim_key"]) == ["a", "b", "d"]
+
+
+def test_compact_merges_fragments_and_drops_duplicates(tmp_path: Path):
+    root = str(tmp_path / "store")
+    write_batch_fragment(_get_rows(2025, "StrategyMaxP2PM", ["a", "b"]), root)
+    write_batch_fragment(_get_rows(2025, "StrategyMaxP2PM", ["c"]), root)
+    write_batch_fragment(_get_rows(2025, "StrategyMaxP2PM", ["a"]), root)  # e.g. left over from an interrupted compaction
+    write_batch_fragment(_get_rows(2024, "StrategyMaxP2PM", ["d"]), root)
+
+    assert compact_batch_results(root) == 1
+
+    fragments = list_batch_fragments(root)
+    assert sorted(len(f) for f in fragments.values()) == [1, 1]
+
+    df = read_batch_results(root)
+    assert sorted(df["sim_key"]) == ["a", "b", "c", "d"]
+
+    # Nothing left to do
+    assert compact_batch_results(root) == 0
+
+
+def test_import_legacy_results_file(tmp_path: Path):
+    fn = tmp_path / "results.parquet"
+    root = str(tmp_path / "store")
+    pd.DataFrame(_get_rows(2023, "StrategyMaxBudget", ["a", "b"])).to_parquet(fn)
+
+    assert import_batch_results_file(str(fn), root) == 2
+    assert not fn.exists()
+    assert (tmp_path / "results.parquet.imported").exists()
+    assert sorted(read_batch_results(root)["sim_key"]) == ["a", "b"]
+
+    # Already imported
+    assert import_batch_results_file(str(fn), root) == 0
+
+    # Imported keys are indexed
+    assert "a" in SimKeyIndex(root)
+
+
+def test_sim_key_index_persists_and_rebuilds(tmp_path: Path):
+    root = tmp_path / "store"
+
+    # Nothing written yet
+    index = SimKeyIndex(str(root))
+    assert len(index) == 0
+    assert "a" not in index
+    assert not root.exists()
+
+    write_batch_fragment(_get_rows(2025, "StrategyMaxP2PM", ["a", "b"]), str(root))
+    index.add(["a", "b", "a"])
+    index.add(["b"])
+    assert "a" in index
+    assert len(index) == 2
+
+    # Sidecar only holds each key once, and is not read back as part of the results
+    assert (root / "_sim_keys.txt").read_text().splitlines() == ["a", "b"]
+    assert sorted(read_batch_results(str(root))["sim_key"]) == ["a", "b"]
+
+    # A restart picks the keys up from the sidecar alone
+    write_batch_fragment(_get_rows(2025, "StrategyMaxP2PM", ["c"]), str(root))
+    index = SimKeyIndex(str(root))
+    assert "c" not in index
+    assert len(index) == 2
+
+    # Without a sidecar, the keys are rebuilt from the store
+    (root / "_sim_keys.txt").unlink()
+    index = SimKeyIndex(str(root))
+    assert len(index) == 3
+    assert (root / "_sim_keys.txt").exists()
@@ -1,13 +1,19 @@
+import pytest
 import pandas as pd
 import numpy as np
 from pandas.testing import assert_frame_equal, assert_series_equal
 
 from common import AssetType
 from import_data.derivations import (
+    derivation_cum_tot_append,
+    derivation_cum_tot_update,
     derivation_cum_tot_driver,
     derivation_cum_tot_constructor,
+    get_group_starts,
     get_race_driver_constructor_pairs,
+    rolling_sum_shifted,
 )
+from import_data.import_history import load_all_archive_data
 from scripts.check_run_ppm import load_all_archives_add_derived
 
 _FILE_EXPECTED_RESULTS = "data/test_expected_values.xlsx"
@@ -282,3 +288,122 @@ def test_get_race_driver_constructor_pairs():
     df_resuls = get_race_driver_constructor_pairs(df_merged)
 
     assert_frame_equal(df_resuls.reset_index(drop=True), df_expected.reset_index(drop=True))
+
+
+@pytest.mark.parametrize("rolling_window", [1, 2, 3, 8, 1000])
+def test_rolling_sum_shifted_matches_pandas(rolling_window):
+    rng = np.random.default_rng(rolling_window)
+    num_rows = 500
+    df = pd.DataFrame({
+        "Group": np.sort(rng.integers(0, 40, num_rows)),
+        "Value": np.round(rng.normal(10.0, 5.0, num_rows), 1),
+    })
+    df.loc[rng.random(num_rows) < 0.1, "Value"] = np.nan
+    df.loc[rng.random(num_rows) < 0.2, "Value"] = 0.3
+
+    expected = df.groupby(["Group"])["Value"] \
+        .transform(lambda s: s.fillna(0).shift(1).rolling(window=rolling_window, min_periods=1).sum()) \
+        .to_numpy()
+    actual = rolling_sum_shifted(df["Value"].to_numpy(), get_group_starts(df, ["Group"]), rolling_window)
+
+    assert np.array_equal(actual, expected, equal_nan=True)
+
+
+@pytest.mark.parametrize("asset_type", list(AssetType))
+def test_rolling_sums_shifted_match_pandas_on_archive(asset_type):
+    df = load_all_archive_data(asset_type)[["Season", "Race", asset_type.value, "Points", "Price"]]
+    df = df.groupby(["Season", asset_type.value, "Race"]).sum().reset_index()
+    group_cols = ["Season", asset_type.value]
+
+    # Bit for bit, fractional prices included
+    for rolling_window in [1, 3, len(df.index)]:
+        expected = df.groupby(group_cols)["Price"] \
+            .transform(lambda s: s.fillna(0).shift(1).rolling(window=rolling_window, min_periods=1).sum()) \
+            .to_numpy()
+        actual = rolling_sum_shifted(df["Price"].to_numpy(dtype=float), get_group_starts(df, group_cols), rolling_window)
+        assert np.array_equal(actual, expected, equal_nan=True)
+
+
+def test_get_group_starts():
+    df = pd.DataFrame({"Season": [2023, 2023, 2023, 2024, 2024], "Driver": ["A", "A", "B", "B", "B"]})
+    assert get_group_starts(df, ["Season", "Driver"]).tolist() == [0, 2, 3]
+    assert get_group_starts(df.iloc[:0], ["Season", "Driver"]).tolist() == []
+
+
+def test_derivation_cum_tot_multiple_windows():
+    df_input = load_all_archive_data(AssetType.CONSTRUCTOR)
+    df_multi = derivation_cum_tot_constructor(df_input, rolling_window=[1, 3, -1, 8])
+
+    # Every window's columns, identical to computing that window on its own
+    for rolling_window in [1, 3, -1, 8]:
+        df_single = derivation_cum_tot_constructor(df_input, rolling_window=rolling_window)
+        assert_frame_equal(df_multi[df_single.columns], df_single, check_exact=True)
+
+    assert list(df_multi.columns[5:9]) == [
+        "Points Cumulative (1)",
+        "Price Cumulative (1)",
+        "PPM Cumulative (1)",
+        "P2PM Cumulative (1)",
+    ]
+    assert len(df_multi.columns) == 5 + 4 * 4
+
+
+@pytest.mark.parametrize("rolling_window", [3, [1, 3, -1]])
+def test_derivation_cum_tot_append_matches_full(rolling_window):
+    df_input = load_all_archive_data(AssetType.DRIVER)
+    df_full = derivation_cum_tot_driver(df_input, rolling_window=rolling_window)
+
+    # The last two races of 2025 added one at a time
+    last_race = df_input[df_input["Season"] == 2025]["Race"].max()
+    flt_new = (df_input["Season"] == 2025) & (df_input["Race"] >= last_race - 1)
+    df_derived = derivation_cum_tot_driver(df_input[~flt_new], rolling_window=rolling_window)
+    for race in [last_race - 1, last_race]:
+        df_race = df_input[flt_new & (df_input["Race"] == race)]
+        df_derived = derivation_cum_tot_append(df_derived, df_race, AssetType.DRIVER, rolling_window, check=True)
+
+    assert_frame_equal(df_derived, df_full, check_exact=True)
+
+    # Both races at once
+    df_both = derivation_cum_tot_driver(df_input[~flt_new], rolling_window=rolling_window)
+    df_both = derivation_cum_tot_append(df_both, df_input[flt_new], AssetType.DRIVER, rolling_window)
+    assert_frame_equal(df_both, df_full, check_exact=True)
+
+    # A whole season, every driver new to it
+    flt_season = df_input["Season"] == 2024
+    df_season = derivation_cum_tot_driver(df_input[~flt_season], rolling_window=rolling_window)
+    df_season = derivation_cum_tot_append(df_season, df_input[flt_season], AssetType.DRIVER, rolling_window, check=True)
+    assert_frame_equal(df_season, df_full, check_exact=True)
+
+    # A race already derived cannot be added again
+    with pytest.raises(ValueError):
+        derivation_cum_tot_append(df_derived, df_race, AssetType.DRIVER, rolling_window)
+
+
+def test_derivation_cum_tot_append_check_detects_difference():
+    df_input = load_all_archive_data(AssetType.CONSTRUCTOR)
+    flt_new = (df_input["Season"] == 2024) & (df_input["Race"] == 24)
+    df_derived = derivation_cum_tot_constructor(df_input[~flt_new], rolling_window=3)
+
+    # Derived values which no longer match their points
+    df_derived.loc[df_derived["Season"] == 2024, "Points Cumulative (3)"] += 1
+    with pytest.raises(ValueError):
+        derivation_cum_tot_append(df_derived, df_input[flt_new], AssetType.CONSTRUCTOR, 3, check=True)
+
+
+def test_derivation_cum_tot_update():
+    df_input = load_all_archive_data(AssetType.DRIVER)
+    df_full = derivation_cum_tot_driver(df_input, rolling_window=[3, -1])
+
+    flt_new = (df_input["Season"] == 2025) & (df_input["Race"] == df_input[df_input["Season"] == 2025]["Race"].max())
+    df_derived = derivation_cum_tot_driver(df_input[~flt_new], rolling_window=[3, -1])
+    df_updated = derivation_cum_tot_update(df_derived, df_input, AssetType.DRIVER, [3, -1])
+    assert_frame_equal(df_updated, df_full, check_exact=True)
+
+    # Nothing new
+    assert derivation_cum_tot_update(df_full, df_input, AssetType.DRIVER, [3, -1]) is df_full
+
+    # A correction to a race already derived is picked up by recomputing
+    df_corrected = df_input.copy()
+    df_corrected.loc[(df_corrected["Season"] == 2023) & (df_corrected["Race"] == 1), "Points"] += 1
+    df_updated = derivation_cum_tot_update(df_derived, df_corrected, AssetType.DRIVER, [3, -1])
+    assert_frame_equal(df_updated, derivation_cum_tot_driver(df_corrected, rolling_window=[3, -1]), check_exact=True)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
+from datetime import datetime, timezone
 
 import pandas as pd
 import pytest
@@ -9,9 +12,12 @@ from fast_f1.api import (
     SessionDataUnavailable,
     _save_cached_dataframe,
     get_event_for_race,
+    get_event_schedule,
     get_race_numbers_for_season,
     get_race_results,
     get_session_laps,
+    list_cached_sessions,
+    prefetch_sessions,
 )
 from fast_f1.cache import setup_fastf1_cache
 
@@ -91,7 +97,7 @@ def test_api_caches_race_results_and_session_laps(monkeypatch, tmp_path):
 
     first_result = get_race_results(2025, 1)
     assert not first_result.empty
-    cache_file = tmp_path / "local_cache" / "race_results_2025_1.pkl"
+    cache_file = tmp_path / "local_cache" / "race_results_2025_1.arrow"
     assert cache_file.exists()
 
     monkeypatch.setattr("fast_f1.api.get_event_for_race", lambda season, race: (_ for _ in ()).throw(RuntimeError("Should not be called")))
@@ -101,7 +107,7 @@ def test_api_caches_race_results_and_session_laps(monkeypatch, tmp_path):
 
     first_session = get_session_laps(2025, 1, "FP2")
     assert not first_session.empty
-    session_cache_file = tmp_path / "local_cache" / "session_laps_2025_1_FP2.pkl"
+    session_cache_file = tmp_path / "local_cache" / "session_laps_2025_1_FP2.arrow"
     assert session_cache_file.exists()
 
     monkeypatch.setattr("fast_f1.api.get_event_for_race", lambda season, race: (_ for _ in ()).throw(RuntimeError("Should not be called")))
@@ -272,10 +278,67 @@ def test_api_logs_event_schedule_cache_hits(monkeypatch, tmp_path, caplog):
     )
     caplog.set_level(logging.INFO, logger="fast_f1.api")
 
+    # A fresh process, which has no schedule loaded yet
+    monkeypatch.setattr("fast_f1.api._season_schedules", {})
     get_event_for_race(2025, 1)
     assert "Loaded cached DataFrame from" in caplog.text
 
 
+def test_api_loads_the_event_schedule_once_per_process(monkeypatch, tmp_path, caplog):
+    """Every race of a historical run looks its event up, so only the first may touch the disk."""
+    setup_fastf1_cache(cache_dir=tmp_path, interactive=False)
+    monkeypatch.setattr("fastf1.get_event_schedule", lambda season_year, include_testing=False: _event_schedule())
+    get_event_for_race(2025, 1)
+
+    monkeypatch.setattr("fastf1.get_event_schedule", lambda *args, **kwargs: (_ for _ in ()).throw(RuntimeError("Should not be called")))
+    (tmp_path / "local_cache" / "event_schedule_2025.pkl").unlink()
+    caplog.set_level(logging.INFO, logger="fast_f1.api")
+
+    assert get_event_for_race(2025, 2)["EventName"] == "Chinese Grand Prix"
+    assert get_race_numbers_for_season(2025) == [1, 2]
+    assert get_event_schedule(2025)["RoundNumber"].tolist() == [1, 2]
+    with pytest.raises(SessionDataUnavailable):
+        get_event_for_race(2025, 3)
+    assert "Loaded cached DataFrame from" not in caplog.text
+
+
+def _age_cached_schedule(cache_path, fetched_at: datetime) -> None:
+    os.utime(cache_path, (fetched_at.timestamp(), fetched_at.timestamp()))
+
+
+def test_api_refetches_a_schedule_cached_before_its_season_was_over(monkeypatch, tmp_path):
+    setup_fastf1_cache(cache_dir=tmp_path, interactive=False)
+    cache_path = tmp_path / "local_cache" / "event_schedule_2025.pkl"
+    monkeypatch.setattr("fastf1.get_event_schedule", lambda season_year, include_testing=False: _event_schedule())
+    get_event_for_race(2025, 1)
+
+    # Cached mid-season: rounds may have moved since, so it is fetched again
+    _age_cached_schedule(cache_path, datetime(2025, 6, 1, tzinfo=timezone.utc))
+    monkeypatch.setattr("fast_f1.api._season_schedules", {})
+    rescheduled = _event_schedule().assign(EventName=["Australian Grand Prix", "Japanese Grand Prix"])
+    monkeypatch.setattr("fastf1.get_event_schedule", lambda season_year, include_testing=False: rescheduled)
+    assert get_event_for_race(2025, 2)["EventName"] == "Japanese Grand Prix"
+
+    # Cached after the season ended: it can no longer change
+    _age_cached_schedule(cache_path, datetime(2026, 1, 5, tzinfo=timezone.utc))
+    monkeypatch.setattr("fast_f1.api._season_schedules", {})
+    monkeypatch.setattr("fastf1.get_event_schedule", lambda *args, **kwargs: (_ for _ in ()).throw(RuntimeError("Should not be called")))
+    assert get_event_for_race(2025, 2)["EventName"] == "Japanese Grand Prix"
+
+
+def test_api_falls_back_to_a_stale_schedule_when_the_refetch_fails(monkeypatch, tmp_path, caplog):
+    setup_fastf1_cache(cache_dir=tmp_path, interactive=False)
+    monkeypatch.setattr("fastf1.get_event_schedule", lambda season_year, include_testing=False: _event_schedule())
+    get_event_for_race(2025, 1)
+
+    _age_cached_schedule(tmp_path / "local_cache" / "event_schedule_2025.pkl", datetime(2025, 6, 1, tzinfo=timezone.utc))
+    monkeypatch.setattr("fast_f1.api._season_schedules", {})
+    monkeypatch.setattr("fastf1.get_event_schedule", lambda *args, **kwargs: (_ for _ in ()).throw(ConnectionError("network down")))
+
+    assert get_event_for_race(2025, 2)["EventName"] == "Chinese Grand Prix"
+    assert "Could not refresh event schedule for season 2025" in caplog.text
+
+
 def test_api_returns_empty_dataframe_when_race_data_is_missing(monkeypatch, tmp_path, caplog):
     setup_fastf1_cache(cache_dir=tmp_path, interactive=False)
 
@@ -347,3 +410,82 @@ def test_api_lets_an_unexpected_failure_propagate(monkeypatch, tmp_path):
 
     with pytest.raises(ConnectionError):
         get_session_laps(2025, 1, "FP2")
+
+
+class BarrierSession(FakeSession):
+    """Session whose load waits until every other load in the barrier has started too."""
+    def __init__(self, laps: pd.DataFrame, barrier: threading.Barrier):
+        super().__init__(laps)
+        self._barrier = barrier
+
+    def load(self, **kwargs):
+        super().load(**kwargs)
+        self._barrier.wait()
+
+
+def _session_laps() -> pd.DataFrame:
+    return pd.DataFrame({"Driver": ["HAM"], "LapTime": [80.0], "LapNumber": [1], "Stint": [1]})
+
+
+def test_prefetch_sessions_loads_missing_sessions_concurrently(monkeypatch, tmp_path):
+    """Three loads that can only finish together prove they ran at once."""
+    setup_fastf1_cache(cache_dir=tmp_path, interactive=False)
+
+    barrier = threading.Barrier(3, timeout=10)
+    race_results = pd.DataFrame({"Abbreviation": ["HAM"], "Points": [25], "TeamName": ["Mercedes"]})
+    race_session = FakeRaceSession(race_results)
+    race_session.load = lambda **kwargs: barrier.wait()
+    event = FakeEvent({
+        "R": race_session,
+        "FP2": BarrierSession(_session_laps(), barrier),
+        "FP3": BarrierSession(_session_laps(), barrier),
+    })
+    monkeypatch.setattr("fast_f1.api.get_event_for_race", lambda season, race: event)
+
+    keys = [(2025, 1, "FP2"), (2025, 1, "FP3"), (2025, 1, "R"), (2025, 1, "FP2")]
+    loaded = prefetch_sessions(keys, max_workers=3)
+
+    assert sorted(loaded) == [(2025, 1, "FP2"), (2025, 1, "FP3"), (2025, 1, "R")]
+    assert (tmp_path / "local_cache" / "race_results_2025_1.arrow").exists()
+    assert (tmp_path / "local_cache" / "session_laps_2025_1_FP3.arrow").exists()
+
+    # Everything now comes from the cache, and nothing is loaded twice
+    monkeypatch.setattr("fast_f1.api.get_event_for_race", lambda season, race: (_ for _ in ()).throw(RuntimeError("Should not be called")))
+    assert prefetch_sessions(keys) == []
+    assert get_session_laps(2025, 1, "FP2")["SessionType"].tolist() == ["FP2"]
+    assert get_race_results(2025, 1)["Constructor"].tolist() == ["Mercedes"]
+
+
+def test_prefetch_sessions_steps_over_sessions_that_fail(monkeypatch, tmp_path):
+    """Prefetching is best-effort; the later call is the one that reports a failure."""
+    setup_fastf1_cache(cache_dir=tmp_path, interactive=False)
+
+    broken = FakeSession(_session_laps())
+    broken.load = lambda **kwargs: (_ for _ in ()).throw(ConnectionError("network down"))
+    event = FakeEvent({"FP1": FakeSession(_session_laps()), "FP2": broken})
+    monkeypatch.setattr("fast_f1.api.get_event_for_race", lambda season, race: event)
+
+    loaded = prefetch_sessions([(2025, 2, "FP1"), (2025, 2, "FP2"), (2025, 2, "SQ")])
+
+    assert loaded == [(2025, 2, "FP1")]
+    assert not (tmp_path / "local_cache" / "session_laps_2025_2_FP2.arrow").exists()
+    with pytest.raises(ConnectionError):
+        get_session_laps(2025, 2, "FP2")
+
+
+def test_api_serves_and_lists_sessions_cached_as_pickles_before_the_columnar_format(monkeypatch, tmp_path):
+    setup_fastf1_cache(cache_dir=tmp_path, interactive=False)
+    legacy_laps = _session_laps().assign(Season=2024, Race=3, SessionType="FP1")
+    legacy_laps.to_pickle(tmp_path / "local_cache" / "session_laps_2024_3_FP1.pkl")
+    monkeypatch.setattr("fast_f1.api.get_event_for_race", lambda season, race: (_ for _ in ()).throw(RuntimeError("Should not be called")))
+
+    assert list_cached_sessions().empty
+    assert prefetch_sessions([(2024, 3, "FP1")]) == []
+    assert get_session_laps(2024, 3, "FP1").equals(legacy_laps)
+    assert list_cached_sessions()["key"].tolist() == ["session_laps_2024_3_FP1"]
+
+
+def test_prefetch_sessions_does_nothing_without_a_local_cache(monkeypatch):
+    monkeypatch.setattr("fast_f1.api.get_event_for_race", lambda season, race: (_ for _ in ()).throw(RuntimeError("Should not be called")))
+
+    assert prefetch_sessions([(2025, 1, "FP2"), (2025, 1, "R")]) == []
@@ -48,7 +48,7 @@ def test_cli_historical_mode(monkeypatch, tmp_path):
         called["cache"] = (cache_dir, interactive)
         return tmp_path, tmp_path / "local_cache"
 
-    def fake_generate_historical_metrics(season_years, output_path=None):
+    def fake_generate_historical_metrics(season_years, output_path=None, jobs=1):
         called["historical"] = (tuple(season_years), output_path)
         return pd.DataFrame()
 
@@ -72,7 +72,7 @@ def test_cli_historical_mode_restricted_to_one_season(monkeypatch, tmp_path):
     def fake_setup_fastf1_cache(cache_dir=None, interactive=True):
         return tmp_path, tmp_path / "local_cache"
 
-    def fake_generate_historical_metrics(season_years, output_path=None):
+    def fake_generate_historical_metrics(season_years, output_path=None, jobs=1):
         called["historical"] = (tuple(season_years), output_path)
         return pd.DataFrame()
 
@@ -86,6 +86,49 @@ def test_cli_historical_mode_restricted_to_one_season(monkeypatch, tmp_path):
     assert called["historical"][1] == str(tmp_path / "historical.xlsx")
 
 
+def test_cli_historical_mode_passes_jobs_through(monkeypatch, tmp_path):
+    monkeypatch.setattr(sys, "argv", ["fast_f1", "--historical", "--season", "2025", "--jobs", "4"])
+    called = {}
+
+    def fake_generate_historical_metrics(season_years, output_path=None, jobs=1):
+        called["jobs"] = jobs
+        return pd.DataFrame()
+
+    monkeypatch.setattr(cli, "setup_fastf1_cache", lambda **kwargs: (tmp_path, tmp_path / "local_cache"))
+    monkeypatch.setattr(cli, "generate_historical_metrics", fake_generate_historical_metrics)
+
+    cli.main()
+
+    assert called["jobs"] == 4
+
+
+def test_cli_export_mode(monkeypatch, tmp_path):
+    output_path = tmp_path / "historical.xlsx"
+    monkeypatch.setattr(sys, "argv", ["fast_f1", "--export", "--output", str(output_path)])
+    called = {}
+
+    def fake_export_historical_metrics(store_path, output_path):
+        called["export"] = (store_path, output_path)
+        return pd.DataFrame({"Season": [2025], "Race": [1]})
+
+    def explode(*args, **kwargs):
+        raise AssertionError("export mode must not touch FastF1")
+
+    monkeypatch.setattr(cli, "setup_fastf1_cache", explode)
+    monkeypatch.setattr(cli, "generate_historical_metrics", explode)
+    monkeypatch.setattr(cli, "export_historical_metrics", fake_export_historical_metrics)
+
+    cli.main()
+
+    assert called["export"] == (tmp_path / "historical_store", output_path)
+
+    # Nothing stored to export
+    monkeypatch.setattr(cli, "export_historical_metrics", lambda store_path, output_path: pd.DataFrame())
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main()
+    assert exit_info.value.code == 1
+
+
 def test_cli_historical_mode_does_not_prompt_for_a_season(monkeypatch, tmp_path):
     """--historical must not fall through to the single-race interactive prompt."""
     monkeypatch.setattr(sys, "argv", ["fast_f1", "--historical"])
@@ -94,7 +137,7 @@ def test_cli_historical_mode_does_not_prompt_for_a_season(monkeypatch, tmp_path)
     def fake_setup_fastf1_cache(cache_dir=None, interactive=True):
         return tmp_path, tmp_path / "local_cache"
 
-    def fake_generate_historical_metrics(season_years, output_path=None):
+    def fake_generate_historical_metrics(season_years, output_path=None, jobs=1):
         called["historical"] = tuple(season_years)
         return pd.DataFrame()
 
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+
+import pandas as pd
+
+from fast_f1 import local_cache
+from fast_f1.local_cache import (
+    MANIFEST_FILENAME,
+    SCHEMA_VERSION,
+    is_frame_cached,
+    list_cached_frames,
+    read_cached_frame,
+    write_cached_frame,
+)
+
+
+def _session_laps() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Driver": ["HAM", "VER", "NOR"],
+            "LapTime": pd.to_timedelta([80.1, 79.8, None], unit="s"),
+            "LapNumber": [1.0, 1.0, 2.0],
+            "Compound": ["SOFT", "MEDIUM", "SOFT"],
+            "Deleted": [False, True, None],
+        }
+    )
+
+
+def test_frames_round_trip_and_are_listed_from_the_manifest(tmp_path):
+    laps = _session_laps()
+
+    assert write_cached_frame(tmp_path, "session_laps_2025_1_FP2", laps, "2025-03-14T02:00:00+00:00")
+    assert write_cached_frame(tmp_path, "race_results_2025_1", pd.DataFrame({"Abbreviation": ["NOR"]}))
+
+    assert read_cached_frame(tmp_path, "session_laps_2025_1_FP2").equals(laps)
+    listing = list_cached_frames(tmp_path)
+    assert listing["key"].tolist() == ["race_results_2025_1", "session_laps_2025_1_FP2"]
+    assert listing["rows"].tolist() == [1, 3]
+    assert listing["schema_version"].tolist() == [SCHEMA_VERSION, SCHEMA_VERSION]
+    assert listing["source_timestamp"].iloc[1] == "2025-03-14T02:00:00+00:00"
+
+
+def test_a_read_can_be_limited_to_some_columns(tmp_path):
+    write_cached_frame(tmp_path, "session_laps_2025_1_FP2", _session_laps())
+
+    projected = read_cached_frame(tmp_path, "session_laps_2025_1_FP2", columns=["Driver", "LapTime"])
+
+    assert projected.columns.tolist() == ["Driver", "LapTime"]
+    assert projected.equals(_session_laps()[["Driver", "LapTime"]])
+
+
+def test_a_rewrite_replaces_the_manifest_entry(tmp_path):
+    write_cached_frame(tmp_path, "race_results_2025_1", pd.DataFrame({"Abbreviation": ["NOR"]}))
+    write_cached_frame(tmp_path, "race_results_2025_1", pd.DataFrame({"Abbreviation": ["NOR", "PIA"]}))
+
+    assert list_cached_frames(tmp_path)["rows"].tolist() == [2]
+
+
+def test_an_empty_frame_is_never_cached(tmp_path):
+    assert not write_cached_frame(tmp_path, "race_results_2025_1", pd.DataFrame())
+
+    assert not is_frame_cached(tmp_path, "race_results_2025_1")
+    assert not (tmp_path / "race_results_2025_1.arrow").exists()
+
+
+def test_a_legacy_pickle_is_migrated_on_first_lookup(tmp_path):
+    laps = _session_laps()
+    legacy_path = tmp_path / "session_laps_2024_3_FP1.pkl"
+    laps.to_pickle(legacy_path)
+
+    assert read_cached_frame(tmp_path, "session_laps_2024_3_FP1").equals(laps)
+
+    assert not legacy_path.exists()
+    assert (tmp_path / "session_laps_2024_3_FP1.arrow").exists()
+    assert list_cached_frames(tmp_path)["rows"].tolist() == [3]
+
+
+def test_an_unreadable_legacy_pickle_is_a_cache_miss(tmp_path):
+    (tmp_path / "session_laps_2024_3_FP1.pkl").write_bytes(b"not a pickle")
+
+    assert read_cached_frame(tmp_path, "session_laps_2024_3_FP1") is None
+
+
+def test_entries_from_another_schema_version_are_not_cached(tmp_path):
+    write_cached_frame(tmp_path, "race_results_2025_1", pd.DataFrame({"Abbreviation": ["NOR"]}))
+    entry = {"key": "race_results_2025_2", "schema_version": SCHEMA_VERSION + 1, "rows": 1, "source_timestamp": ""}
+    with open(tmp_path / MANIFEST_FILENAME, "a", encoding="utf-8") as manifest:
+        manifest.write(json.dumps(entry) + "\n")
+        # A line cut short by a crash mid-append
+        manifest.write('{"key": "race_results_2025_3", "sche')
+
+    assert not is_frame_cached(tmp_path, "race_results_2025_2")
+    assert is_frame_cached(tmp_path, "race_results_2025_1")
+    assert list_cached_frames(tmp_path)["key"].tolist() == ["race_results_2025_1"]
+
+
+def test_no_manifest_means_nothing_is_cached(tmp_path):
+    assert local_cache.read_manifest(tmp_path) == {}
+    assert list_cached_frames(tmp_path).empty
+    assert read_cached_frame(tmp_path, "race_results_2025_1") is None
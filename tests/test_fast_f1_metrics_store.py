@@ -0,0 +1,52 @@
+from pathlib import Path
+
+import pandas as pd
+
+from fast_f1.metrics_store import get_fragment_path, list_stored_races, read_stored_metrics, write_race_metrics
+
+
+def _race_metrics(season_year: int, race_num: int, session_code: str) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Season": [season_year, season_year],
+            "Race": [race_num, race_num],
+            "Driver": ["HAM", "VER"],
+            f"{session_code}_MinLapTime": [80.1, 79.8],
+            "AggregateRank": [1.5, 2.0],
+        }
+    )
+
+
+def test_races_are_listed_and_read_back_in_order(tmp_path: Path):
+    write_race_metrics(tmp_path, 2025, 10, _race_metrics(2025, 10, "FP2"))
+    write_race_metrics(tmp_path, 2024, 3, _race_metrics(2024, 3, "FP1"))
+    write_race_metrics(tmp_path, 2025, 2, _race_metrics(2025, 2, "FP2"))
+
+    assert list_stored_races(tmp_path) == [(2024, 3), (2025, 2), (2025, 10)]
+
+    stored = read_stored_metrics(tmp_path)
+    assert list(zip(stored["Season"], stored["Race"])) == [(2024, 3), (2024, 3), (2025, 2), (2025, 2), (2025, 10), (2025, 10)]
+    # Races keep the columns of the sessions they held
+    assert stored["FP1_MinLapTime"].notna().tolist() == [True, True, False, False, False, False]
+
+
+def test_writing_a_race_again_replaces_it(tmp_path: Path):
+    write_race_metrics(tmp_path, 2025, 1, _race_metrics(2025, 1, "FP2"))
+    write_race_metrics(tmp_path, 2025, 1, _race_metrics(2025, 1, "FP2").head(1))
+
+    assert list_stored_races(tmp_path) == [(2025, 1)]
+    assert len(read_stored_metrics(tmp_path).index) == 1
+
+
+def test_files_that_are_not_fragments_are_ignored(tmp_path: Path):
+    write_race_metrics(tmp_path, 2025, 1, _race_metrics(2025, 1, "FP2"))
+    season_dir = get_fragment_path(tmp_path, 2025, 1).parent
+    (season_dir / ".race=2.parquet.0123.tmp").write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("")
+
+    assert list_stored_races(tmp_path) == [(2025, 1)]
+
+
+def test_missing_store_is_empty(tmp_path: Path):
+    assert list_stored_races(tmp_path / "missing") == []
+    assert read_stored_metrics(tmp_path / "missing").empty
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import multiprocessing
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
 from fast_f1.metrics import METRIC_WEIGHTS, get_rolling_window_races
-from fast_f1.output import build_race_metrics, generate_historical_metrics
+from fast_f1.metrics_store import list_stored_races
+from fast_f1.output import build_race_metrics, generate_historical_metrics, get_historical_store_path, save_metrics
 
 
 class DummySession:
@@ -742,3 +744,166 @@ def test_historical_metrics_walks_over_a_gap_in_the_round_numbers(monkeypatch, t
     generate_historical_metrics([2025], output_path=tmp_path / "historical.xlsx")
 
     assert attempted == [(2025, 1), (2025, 2), (2025, 5)]
+
+
+def test_build_race_metrics_prefetches_every_session_it_reads(monkeypatch):
+    season_year, race_num = 2025, 5
+    _patch_minimal_race(monkeypatch, season_year, race_num, ["HAM", "VER"])
+
+    prefetched: list[list[tuple[int, int, str]]] = []
+    monkeypatch.setattr("fast_f1.output.prefetch_sessions", lambda keys: prefetched.append(list(keys)))
+
+    build_race_metrics(season_year, race_num)
+
+    assert prefetched == [[
+        (2025, 5, "FP2"),
+        (2025, 5, "FP3"),
+        (2025, 2, "R"),
+        (2025, 3, "R"),
+        (2025, 4, "R"),
+        (2025, 5, "R"),
+    ]]
+
+
+def test_historical_metrics_prefetches_only_races_still_to_build(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        "fastf1.get_event_schedule",
+        lambda season_year, include_testing=False: pd.DataFrame({"RoundNumber": [1, 2]}),
+    )
+    monkeypatch.setattr(
+        "fast_f1.output.load_existing_metrics",
+        lambda path: pd.DataFrame({"Season": [2025], "Race": [1]}),
+    )
+    monkeypatch.setattr(
+        "fast_f1.output.build_race_metrics",
+        lambda *args, **kwargs: (_ for _ in ()).throw(RuntimeError("No data published for this race")),
+    )
+
+    prefetched: list[list[tuple[int, int, str]]] = []
+    monkeypatch.setattr("fast_f1.output.prefetch_sessions", lambda keys: prefetched.append(list(keys)))
+    monkeypatch.setattr("fast_f1.output.save_metrics", lambda dataframe, path: None)
+
+    generate_historical_metrics([2025], output_path=tmp_path / "historical.xlsx")
+
+    # Race 2's candidate practice sessions, the race before it and its own result
+    assert prefetched == [[
+        (2025, 2, "FP1"),
+        (2025, 2, "FP2"),
+        (2025, 2, "FP3"),
+        (2025, 2, "SQ"),
+        (2025, 1, "R"),
+        (2025, 2, "R"),
+    ]]
+
+
+def test_historical_metrics_appends_to_the_store_and_exports_once(monkeypatch, tmp_path):
+    """Races built before the store existed are imported from the workbook and skipped.
+
+    Each new race is one fragment in the store; the workbook is written once,
+    after the run, with every race in it.
+    """
+    monkeypatch.setattr(
+        "fastf1.get_event_schedule",
+        lambda season_year, include_testing=False: pd.DataFrame({"RoundNumber": [1, 2, 3]}),
+    )
+    monkeypatch.setattr("fast_f1.output.prefetch_sessions", lambda keys: [])
+
+    def fake_build_race_metrics(season_year, race_num, *args, **kwargs):
+        if race_num == 3:
+            raise RuntimeError("No data published for this race")
+        return pd.DataFrame({"Season": [season_year], "Race": [race_num], "Driver": ["HAM"], "AggregateRank": [1.0]})
+
+    output_path = tmp_path / "historical.xlsx"
+    save_metrics(fake_build_race_metrics(2025, 1), output_path)
+
+    built: list[tuple[int, int]] = []
+
+    def record_build_race_metrics(season_year, race_num):
+        built.append((season_year, race_num))
+        return fake_build_race_metrics(season_year, race_num)
+
+    monkeypatch.setattr("fast_f1.output.build_race_metrics", record_build_race_metrics)
+    exported: list[Path] = []
+
+    def record_save_metrics(dataframe, path):
+        exported.append(Path(path))
+        save_metrics(dataframe, path)
+
+    monkeypatch.setattr("fast_f1.output.save_metrics", record_save_metrics)
+
+    metrics = generate_historical_metrics([2025], output_path=output_path)
+
+    assert built == [(2025, 2), (2025, 3)]
+    assert list(zip(metrics["Season"], metrics["Race"])) == [(2025, 1), (2025, 2)]
+    assert list_stored_races(get_historical_store_path(output_path)) == [(2025, 1), (2025, 2)]
+    assert exported == [output_path]
+
+    # Resumed from the store alone, and with nothing new since the export there is nothing to export
+    built.clear()
+    generate_historical_metrics([2025], output_path=output_path)
+    assert built == [(2025, 3)]
+    assert exported == [output_path]
+
+
+def test_historical_metrics_retries_a_failed_export(monkeypatch, tmp_path):
+    """A race stored by a run whose export failed is exported by the next run, though it adds nothing."""
+    monkeypatch.setattr(
+        "fastf1.get_event_schedule",
+        lambda season_year, include_testing=False: pd.DataFrame({"RoundNumber": [1, 2]}),
+    )
+    monkeypatch.setattr("fast_f1.output.prefetch_sessions", lambda keys: [])
+    published = {1}
+
+    def fake_build_race_metrics(season_year, race_num):
+        if race_num not in published:
+            raise RuntimeError("No data published for this race")
+        return pd.DataFrame({"Season": [season_year], "Race": [race_num], "Driver": ["HAM"], "AggregateRank": [1.0]})
+
+    monkeypatch.setattr("fast_f1.output.build_race_metrics", fake_build_race_metrics)
+    output_path = tmp_path / "historical.xlsx"
+    generate_historical_metrics([2025], output_path=output_path)
+
+    # Race 2 stored, then the export failing, leaving the workbook older than the store
+    def locked_workbook(dataframe, path):
+        raise PermissionError(f"{path} is open in another program")
+
+    published.add(2)
+    monkeypatch.setattr("fast_f1.output.save_metrics", locked_workbook)
+    with pytest.raises(PermissionError):
+        generate_historical_metrics([2025], output_path=output_path)
+    assert list_stored_races(get_historical_store_path(output_path)) == [(2025, 1), (2025, 2)]
+
+    exported: list[Path] = []
+    monkeypatch.setattr("fast_f1.output.save_metrics", lambda dataframe, path: exported.append(Path(path)))
+    generate_historical_metrics([2025], output_path=output_path)
+    assert exported == [output_path]
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="Workers only see the patched build_race_metrics when forked",
+)
+def test_historical_metrics_built_in_parallel_match_a_serial_run(monkeypatch, tmp_path):
+    """Worker processes change how fast races are built, not which or in what order."""
+    monkeypatch.setattr(
+        "fastf1.get_event_schedule",
+        lambda season_year, include_testing=False: pd.DataFrame({"RoundNumber": [1, 2, 3, 4, 5]}),
+    )
+    monkeypatch.setattr("fast_f1.output.prefetch_sessions", lambda keys: [])
+
+    def fake_build_race_metrics(season_year, race_num, *args, **kwargs):
+        if race_num == 4:
+            raise RuntimeError("No data published for this race")
+        return pd.DataFrame(
+            {"Season": [season_year] * 2, "Race": [race_num] * 2, "Driver": ["HAM", "VER"], "AggregateRank": [1.0, race_num / 10]}
+        )
+
+    monkeypatch.setattr("fast_f1.output.build_race_metrics", fake_build_race_metrics)
+
+    serial = generate_historical_metrics([2024, 2025], output_path=tmp_path / "serial" / "historical.xlsx")
+    parallel = generate_historical_metrics([2024, 2025], output_path=tmp_path / "parallel" / "historical.xlsx", jobs=3)
+
+    assert list_stored_races(get_historical_store_path(tmp_path / "parallel" / "historical.xlsx")) == [
+        (season_year, race_num) for season_year in [2024, 2025] for race_num in [1, 2, 3, 5]
+    ]
+    assert parallel.equals(serial)
@@ -1,11 +1,20 @@
 
 import pandas as pd
 import itertools
+import pytest
 
 from races.first_picks import get_all_combinations
 from races.first_picks import set_combination_assets, get_starting_combinations
+from races.first_picks import get_budget_window_pairs
+from races.first_picks import iter_starting_teams, Prescreen, select_prescreen, get_asset_scores
+from races.first_picks import rank_combinations, unrank_combinations, get_team_index, get_team_picks
 import numpy as np
 
+from common import AssetType
+from helpers import load_with_derivations
+from import_data.odds import load_odds
+from races.season import factory_race
+
 
 def test_get_all_combinations_shape_and_columns():
 	df = get_all_combinations(10, 3, "col")
@@ -137,3 +146,165 @@ def test_get_starting_combinations_standalone():
 	# 823 teams are worth exactly 99.0 and 826 exactly 100.0, so the bounds
 	# have to fall the right side of both
 	assert df_combinations.shape == (8143, 31)
+
+
+def test_get_budget_window_pairs_matches_dense_mask():
+	rng = np.random.default_rng(0)
+	# Sums of prices on a fine grid, so plenty of totals land on the window edges give or take float noise
+	driver_values = rng.integers(50, 800, 500) * 0.1 + rng.integers(0, 10, 500) * 0.01
+	constructor_values = rng.integers(50, 300, 40) * 0.1
+
+	for (min_total_value, max_total_value) in [(80.0, 100.0), (99.5, 100.0), (100.0, 100.0), (-1.0, 1000.0)]:
+		total_values = np.round(driver_values[:, None] + constructor_values[None, :], 6)
+		driver_rows, constructor_rows = np.nonzero((total_values <= max_total_value) & (total_values > min_total_value))
+
+		act_driver_rows, act_constructor_rows, act_total_values = get_budget_window_pairs(
+			driver_values, constructor_values, min_total_value, max_total_value)
+
+		assert np.array_equal(act_driver_rows, driver_rows)
+		assert np.array_equal(act_constructor_rows, constructor_rows)
+		assert np.array_equal(act_total_values, total_values[driver_rows, constructor_rows])
+
+
+def test_rank_and_unrank_combinations_follow_combination_order():
+	for (num_total, num_allowed) in [(22, 5), (11, 2), (5, 5), (6, 1)]:
+		picks = np.array(list(itertools.combinations(range(num_total), num_allowed)))
+		ranks = np.arange(len(picks))
+
+		assert np.array_equal(unrank_combinations(ranks, num_total, num_allowed), picks)
+		assert np.array_equal(rank_combinations(picks, num_total), ranks)
+
+	# Order within a row does not matter
+	assert rank_combinations(np.array([[4, 0, 2]]), 6)[0] == rank_combinations(np.array([[0, 2, 4]]), 6)[0]
+
+	try:
+		unrank_combinations(np.array([6]), 4, 2)
+	except ValueError:
+		pass
+	else:
+		raise AssertionError("expected ValueError for a rank past the last combination")
+
+
+def test_get_team_picks_round_trips_starting_combination_index():
+	df_combinations = get_starting_combinations(2023, 1, 99.0)
+	num_drivers_total = sum("@" in c for c in df_combinations.columns)
+	num_constructors_total = len(df_combinations.columns) - num_drivers_total - 1  # Less total_value
+
+	driver_picks, constructor_picks = get_team_picks(df_combinations.index.to_numpy(), num_drivers_total, num_constructors_total)
+
+	# Every pick is one of the team's assets, and the index is recovered from the picks alone
+	driver_cols = df_combinations.columns[:num_drivers_total]
+	constructor_cols = df_combinations.columns[num_drivers_total:num_drivers_total + num_constructors_total]
+	assert (df_combinations[driver_cols].to_numpy()[np.arange(len(df_combinations))[:, None], driver_picks] > 0).all()
+	assert (df_combinations[constructor_cols].to_numpy()[np.arange(len(df_combinations))[:, None], constructor_picks] > 0).all()
+	assert np.array_equal(
+		get_team_index(driver_picks, constructor_picks, num_drivers_total, num_constructors_total),
+		df_combinations.index.to_numpy(),
+	)
+
+
+def test_iter_starting_teams_matches_starting_combinations():
+	df_combinations = get_starting_combinations(2023, 1, 99.0)
+	chunks = list(iter_starting_teams(2023, 1, 99.0, chunk_size=1000))
+
+	# Fixed-size chunks, the last one holding the remainder
+	assert [len(c.index) for c in chunks] == [1000] * 8 + [143]
+	assert all(c.driver_picks.shape == (len(c.index), 5) and c.constructor_picks.shape == (len(c.index), 2) for c in chunks)
+
+	assert np.array_equal(np.concatenate([c.index for c in chunks]), df_combinations.index.to_numpy())
+	assert np.array_equal(np.concatenate([c.total_value for c in chunks]), df_combinations["total_value"].to_numpy())
+
+	# Picks select exactly the priced assets of each row
+	values = df_combinations.drop(columns="total_value").to_numpy()
+	picks = np.hstack([
+		np.concatenate([c.driver_picks for c in chunks]),
+		np.concatenate([c.constructor_picks for c in chunks]) + 20,
+	])
+	selected = np.zeros(values.shape, dtype=bool)
+	np.put_along_axis(selected, picks, True, axis=1)
+	assert np.array_equal(selected, ~np.isnan(values))
+
+
+def test_select_prescreen_top_k_and_bands():
+	total_values = np.array([90.5, 99.0, 91.0, 100.0, 95.0, 95.0, 99.9])
+	scores = np.array([5.0, 1.0, 7.0, 3.0, 2.0, 7.0, 6.0])
+
+	# Best 3 overall, ties to the earlier team, returned in original order
+	assert select_prescreen(total_values, scores, 90.0, 100.0, 3).tolist() == [2, 5, 6]
+	# Best 2 in (90, 95] and best 2 in (95, 100], 95.0 falling in the lower band
+	assert select_prescreen(total_values, scores, 90.0, 100.0, 4, 2).tolist() == [2, 3, 5, 6]
+	# The remainder goes to the cheaper band, 3 and 2
+	assert select_prescreen(total_values, scores, 90.0, 100.0, 5, 2).tolist() == [0, 2, 3, 5, 6]
+
+	with pytest.raises(ValueError, match="value bands"):
+		select_prescreen(total_values, scores, 90.0, 100.0, 1, 2)
+
+
+def test_prescreen_look_ahead():
+	Prescreen("P2PM Cumulative (3)", 2, 500).check_look_ahead(2)
+	Prescreen("Price", 1, 500).check_look_ahead(1)
+	Prescreen("Points", 1, 500).check_look_ahead(2)
+
+	for prescreen in [Prescreen("P2PM Cumulative (3)", 2, 500), Prescreen("Points", 1, 500), Prescreen("Odds", 2, 500)]:
+		with pytest.raises(ValueError, match="looks ahead"):
+			prescreen.check_look_ahead(1)
+
+
+def test_iter_starting_teams_prescreen():
+	prescreen = Prescreen("P2PM Cumulative (3)", 2, 500, 5)
+	assert prescreen.get_key() == "top500x5:P2PM Cumulative 3:r2"
+
+	chunks = list(iter_starting_teams(2023, 2, 99.0, prescreen=prescreen))
+	index = np.concatenate([c.index for c in chunks])
+	total_value = np.concatenate([c.total_value for c in chunks])
+
+	# A subset of the unscreened teams, 100 from each fifth of the window
+	df_combinations = get_starting_combinations(2023, 2, 99.0)
+	assert len(index) == 500
+	assert np.isin(index, df_combinations.index).all()
+	tenths_over = np.round((total_value - 99.0) * 10).astype(int)  # Prices are in tenths, so 1 to 10
+	assert np.array_equal(np.bincount((tenths_over - 1) // 2), [100] * 5)
+
+	with pytest.raises(ValueError, match="Unable to score"):
+		list(iter_starting_teams(2023, 2, 99.0, prescreen=Prescreen("Odds (3)", 2, 10)))
+	with pytest.raises(ValueError, match="looks ahead"):
+		list(iter_starting_teams(2023, 1, 99.0, prescreen=prescreen))
+
+
+def test_iter_starting_teams_prescreen_scores_by_name():
+	# In 2024 BEA@FER replaces SAI@FER for race 2, and PIA@MCL moves down a place in the line-up
+	(df_driver_ppm, df_constructor_ppm, df_driver_pairs) = load_with_derivations(2024)
+	race_1 = factory_race(df_driver_ppm, df_constructor_ppm, df_driver_pairs, 1)
+	race_2 = factory_race(df_driver_ppm, df_constructor_ppm, df_driver_pairs, 2)
+	names = race_2.arrays(AssetType.DRIVER).names
+	assert names != race_1.arrays(AssetType.DRIVER).names
+
+	scores = get_asset_scores(race_1, AssetType.DRIVER, "Points", 2024, names)
+	assert scores.tolist() == [race_1.drivers[name].points if name in race_1.drivers else 0.0 for name in names]
+	assert scores[names.index("BEA@FER")] == 0.0
+
+	def get_team_points(chunks) -> np.ndarray:
+		return np.concatenate([
+			[sum(race_1.drivers[names[i]].points for i in picks if names[i] in race_1.drivers)
+				+ sum(race_1.constructors[c].points for c in np.array(race_2.arrays(AssetType.CONSTRUCTOR).names)[picks_c])
+				for picks, picks_c in zip(c.driver_picks, c.constructor_picks)]
+			for c in chunks
+		])
+
+	# The teams kept are the best on their own drivers' points
+	points_all = get_team_points(list(iter_starting_teams(2024, 2, 99.0)))
+	points_kept = get_team_points(list(iter_starting_teams(2024, 2, 99.0, prescreen=Prescreen("Points", 1, 50))))
+	assert len(points_kept) == 50
+	assert np.array_equal(np.sort(points_kept), np.sort(points_all)[-50:])
+
+
+def test_get_asset_scores_odds():
+	(df_driver_ppm, df_constructor_ppm, df_driver_pairs) = load_with_derivations(2026)
+	race = factory_race(df_driver_ppm, df_constructor_ppm, df_driver_pairs, 1)
+
+	for asset_type in AssetType:
+		odds = load_odds(asset_type, 2026, 1)
+		scores = get_asset_scores(race, asset_type, "Odds", 2026)
+		names = race.arrays(asset_type).names
+		assert scores.tolist() == [odds.get(name, 0.0) for name in names]
+		assert (scores > 0).any()
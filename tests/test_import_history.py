@@ -12,6 +12,8 @@ from import_data.import_history import (
     check_merged_integrity_drivers,
     check_merged_integrity_constructors,
     check_drivers_against_constructors,
+    load_archive_data,
+    load_archive_data_season,
 )
 
 def test_convert_data_sheet_two_column():
@@ -417,3 +419,44 @@ def test_check_drivers_against_constructors():
     df_drivers_removed = df_drivers_ok[df_drivers_ok["Constructor"] == "Team A"]
     with pytest.raises(ValueError):
         check_drivers_against_constructors(df_drivers_removed, df_constructors_ok)
+
+
+def test_load_archive_data_opens_workbook_once(tmp_path, monkeypatch):
+    fn = tmp_path / "archive.xlsx"
+    with pd.ExcelWriter(fn) as writer:
+        for season in [2023, 2024]:
+            pd.DataFrame(columns=["Team", "Driver", 1, 2], data=[["RED", "VER", 25, 18], ["RED", "PER", 18, 25]]).to_excel(
+                writer, sheet_name=f"{season} Drivers Points", index=False)
+            pd.DataFrame(columns=["Team", "Driver", 1, 2], data=[["RED", "VER", 30.0, 30.1], ["RED", "PER", 20.0, 19.9]]).to_excel(
+                writer, sheet_name=f"{season} Drivers Price", index=False)
+            pd.DataFrame(columns=["Constructor", 1, 2], data=[["RED", 43, 43]]).to_excel(
+                writer, sheet_name=f"{season} Constructors Points", index=False)
+            pd.DataFrame(columns=["Constructor", 1, 2], data=[["RED", 28.0, 28.2]]).to_excel(
+                writer, sheet_name=f"{season} Constructors Price", index=False)
+
+    calls = []
+    read_excel = pd.read_excel
+
+    def read_excel_counted(*args, **kwargs):
+        calls.append(kwargs["sheet_name"])
+        return read_excel(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_excel", read_excel_counted)
+
+    dfs = load_archive_data([AssetType.DRIVER, AssetType.CONSTRUCTOR], [2023, 2024], str(fn))
+    assert len(calls) == 1
+    assert len(calls[0]) == 8
+    assert list(dfs.keys()) == [
+        (AssetType.DRIVER, 2023),
+        (AssetType.DRIVER, 2024),
+        (AssetType.CONSTRUCTOR, 2023),
+        (AssetType.CONSTRUCTOR, 2024),
+    ]
+
+    df_drivers = dfs[(AssetType.DRIVER, 2024)]
+    assert list(df_drivers.columns) == ["Constructor", "Driver", "Race", "Points", "Season", "Price"]
+    assert df_drivers[(df_drivers["Driver"] == "PER@RED") & (df_drivers["Race"] == 2)][["Points", "Price"]].values.tolist() == [[25, 19.9]]
+
+    # Loading one season is the same as loading it alongside others
+    assert_frame_equal(load_archive_data_season(AssetType.CONSTRUCTOR, 2023, str(fn)), dfs[(AssetType.CONSTRUCTOR, 2023)])
+    assert len(calls) == 2
@@ -1,13 +1,15 @@
+import pytest
 import pandas as pd
 import pandas.testing as pdt
 from pathlib import Path
 
 from helpers import load_with_derivations
 from linear.strategy_p2pm import StrategyMaxP2PM
+from linear.solver_enumerate import EnumerationSolver
 from races.season import factory_season
 from races.team import factory_team_lists
-from scripts.run_multiple_teams import open_batch_results_file
-from scripts.run_single_team import run_for_team
+from scripts.run_multiple_teams import get_starting_key, open_batch_results_file, run_starting_teams
+from scripts.run_single_team import TrajectoryMemo, run_for_team
 
 
 def test_load_nonexistent_returns_empty(tmp_path: Path):
@@ -54,3 +56,112 @@ def test_run_single_batch():
     rows = run_for_team(StrategyMaxP2PM, _team, _season, 2025, 1)
 
     assert len(rows) == 24
+
+
+def test_get_starting_key_records_cut_off():
+    (df_driver_ppm, df_constructor_ppm, df_driver_pairs) = load_with_derivations(season=2025)
+    _season = factory_season(df_driver_ppm, df_constructor_ppm, df_driver_pairs, 2025)
+    team = factory_team_lists(drivers=["TSU@VRB", "SAI@WIL", "BEA@HAA", "HAD@VRB", "DOO@ALP"], constructors=["MCL", "FER"], race=_season.races[1])
+
+    # Keys without a cut-off are unchanged, so results already in the store still match
+    assert get_starting_key("StrategyMaxP2PM", 2025, team, "unlimited_chip_4") == f"(StrategyMaxP2PM:unlimited_chip_4)(2025){team}"
+    assert get_starting_key("StrategyMaxP2PM", 2025, team, "unlimited_chip_4", "top500:Points:r2") \
+        == f"(StrategyMaxP2PM:unlimited_chip_4)(2025)(top500:Points:r2){team}"
+
+
+def test_run_starting_teams_pool_matches_serial():
+    (df_driver_ppm, df_constructor_ppm, df_driver_pairs) = load_with_derivations(season=2025)
+
+    _season = factory_season(
+        df_driver_ppm,
+        df_constructor_ppm,
+        df_driver_pairs,
+        2025,
+    )
+
+    def get_tasks():
+        tasks = []
+        for drivers in [
+            ["TSU@VRB", "SAI@WIL", "BEA@HAA", "HAD@VRB", "DOO@ALP"],
+            ["VER@RED", "SAI@WIL", "BEA@HAA", "HAD@VRB", "DOO@ALP"],
+            ["TSU@VRB", "ALB@WIL", "BEA@HAA", "OCO@HAA", "DOO@ALP"],
+        ]:
+            team = factory_team_lists(drivers=drivers, constructors=["MCL", "FER"], race=_season.races[1])
+            tasks.append((get_starting_key(StrategyMaxP2PM.__name__, 2025, team), team))
+        return tasks
+
+    rows_serial = list(run_starting_teams(StrategyMaxP2PM, _season, 2025, get_tasks(), jobs=1))
+    memo = TrajectoryMemo()
+    rows_pool = list(run_starting_teams(StrategyMaxP2PM, _season, 2025, get_tasks(), jobs=2, memo=memo))
+
+    # Rows come back in completion order from the pool
+    assert sorted(rows_pool, key=lambda r: r["sim_key"]) == sorted(rows_serial, key=lambda r: r["sim_key"])
+    assert len(rows_serial) == 3
+
+    # Worker memo counts are collected, one lookup per race solved plus any hit
+    assert memo.hits + memo.misses >= 3 * 23
+
+
+def test_run_for_team_memo_matches_unmemoised():
+    (df_driver_ppm, df_constructor_ppm, df_driver_pairs) = load_with_derivations(season=2025)
+
+    _season = factory_season(
+        df_driver_ppm,
+        df_constructor_ppm,
+        df_driver_pairs,
+        2025,
+    )
+
+    solver = EnumerationSolver()
+    memo = TrajectoryMemo()
+
+    # The second team catches up with the first for the last race, and the first is repeated outright
+    for drivers in [
+        ["TSU@VRB", "SAI@WIL", "BEA@HAA", "HAD@VRB", "DOO@ALP"],
+        ["TSU@VRB", "SAI@WIL", "BEA@HAA", "HAD@VRB", "ALB@WIL"],
+        ["TSU@VRB", "SAI@WIL", "BEA@HAA", "HAD@VRB", "DOO@ALP"],
+    ]:
+        team = factory_team_lists(drivers=drivers, constructors=["MCL", "FER"], race=_season.races[1])
+        rows_exp = run_for_team(StrategyMaxP2PM, team, _season, 2025, 1, solver=solver)
+
+        team_memo = factory_team_lists(drivers=drivers, constructors=["MCL", "FER"], race=_season.races[1])
+        rows_act = run_for_team(StrategyMaxP2PM, team_memo, _season, 2025, 1, solver=solver, memo=memo)
+
+        assert rows_act == rows_exp
+        assert team_memo.total_points == team.total_points
+        assert str(team_memo) == str(team)
+        assert team_memo.unused_budget == pytest.approx(team.unused_budget)
+
+    assert memo.hits == 2
+    assert memo.misses == 23 + 22
+    assert len(memo) == memo.misses
+
+
+def test_trajectory_memo_only_lookup_counts():
+    (df_driver_ppm, df_constructor_ppm, df_driver_pairs) = load_with_derivations(season=2025)
+
+    _season = factory_season(
+        df_driver_ppm,
+        df_constructor_ppm,
+        df_driver_pairs,
+        2025,
+    )
+
+    memo = TrajectoryMemo()
+    team = factory_team_lists(drivers=["TSU@VRB", "SAI@WIL", "BEA@HAA", "HAD@VRB", "DOO@ALP"], constructors=["MCL", "FER"], race=_season.races[1])
+    run_for_team(StrategyMaxP2PM, team, _season, 2025, 1, solver=EnumerationSolver(), memo=memo)
+    (hits, misses) = (memo.hits, memo.misses)
+
+    team = factory_team_lists(drivers=["TSU@VRB", "SAI@WIL", "BEA@HAA", "HAD@VRB", "DOO@ALP"], constructors=["MCL", "FER"], race=_season.races[1])
+    key = TrajectoryMemo.get_key(StrategyMaxP2PM.__name__, 2025, 2, team, False)
+    key_missing = TrajectoryMemo.get_key(StrategyMaxP2PM.__name__, 2025, 1, team, False)
+
+    # Membership is a plain test
+    assert key in memo
+    assert key_missing not in memo
+    assert (memo.hits, memo.misses) == (hits, misses)
+
+    assert memo.lookup(key_missing, team, 0.0, 0.0, 0.0) is None
+    rows = memo.lookup(key, team, 0.0, 0.0, 0.0)
+    assert len(rows) == 23
+    assert (memo.hits, memo.misses) == (hits + 1, misses + 1)
@@ -9,6 +9,7 @@ from import_data.derivations import (
     get_race_driver_constructor_pairs,
 )
 from import_data.import_history import load_archive_data_season
+from races.asset import factory_constructor, factory_driver
 from races.season import factory_race, factory_season
 
 
@@ -181,3 +182,66 @@ def test_factory_season_real_data():
 
     cons_mcl = race_12.constructors["MCL"]
     assert cons_mcl.price == 11.8
+
+
+def test_factory_season_matches_factory_race():
+    df_driver_2024 = load_archive_data_season(AssetType.DRIVER, 2024)
+    df_constructor_2024 = load_archive_data_season(AssetType.CONSTRUCTOR, 2024)
+    df_driver_pairs_2024 = get_race_driver_constructor_pairs(df_driver_2024)
+    df_driver_ppm_2024 = derivation_cum_tot_driver(df_driver_2024, rolling_window=3)
+    df_constructor_ppm_2024 = derivation_cum_tot_constructor(df_constructor_2024, rolling_window=3)
+
+    season = factory_season(df_driver_ppm_2024, df_constructor_ppm_2024, df_driver_pairs_2024, 2024)
+
+    # Indexing the whole season at once builds the same assets as scanning the data for each one
+    for race_num, race in season.races.items():
+        df_pairs = df_driver_pairs_2024[df_driver_pairs_2024["Race"] == race_num]
+        assert list(race.drivers.keys()) == list(df_pairs["Driver"])
+        assert list(race.constructors.keys()) == list(df_pairs["Constructor"].unique())
+
+        for driver, constructor in zip(df_pairs["Driver"], df_pairs["Constructor"]):
+            exp = factory_driver(df_driver_ppm_2024, driver, constructor, race_num)
+            act = race.drivers[driver]
+            assert (act.driver, act.constructor, act.price, act.points) == (exp.driver, exp.constructor, exp.price, exp.points)
+            assert act.derivs == pytest.approx(exp.derivs, nan_ok=True)
+
+        for constructor in race.constructors.keys():
+            exp = factory_constructor(df_constructor_ppm_2024, constructor, race_num)
+            act = race.constructors[constructor]
+            assert (act.constructor, act.price, act.points) == (exp.constructor, exp.price, exp.points)
+            assert act.derivs == pytest.approx(exp.derivs, nan_ok=True)
+
+
+def test_race_arrays():
+    race = factory_race(
+        pd.DataFrame(
+            columns=["Driver", "Race", "col", "Price", "Points"],
+            data=[["VER", 1, 3.3, 33.3, 13], ["NOR", 1, np.nan, 22.2, 11]]
+        ),
+        pd.DataFrame(
+            columns=["Constructor", "Race", "col", "Price", "Points"],
+            data=[["RED", 1, 6.6, 66.6, 16], ["MCL", 1, 5.5, 55.5, 15]]
+        ),
+        pd.DataFrame(
+            columns=["Race", "Constructor", "Driver"],
+            data=[[1, "RED", "VER"], [1, "MCL", "NOR"]]
+        ),
+        1,
+    )
+
+    drivers = race.arrays(AssetType.DRIVER)
+    assert drivers.names == ["VER", "NOR"]
+    assert drivers.index == {"VER": 0, "NOR": 1}
+    assert drivers.constructors == ["RED", "MCL"]
+    np.testing.assert_array_equal(drivers.price, [33.3, 22.2])
+    np.testing.assert_array_equal(drivers.points, [13, 11])
+    np.testing.assert_array_equal(drivers.derivs["col"], [3.3, np.nan])
+
+    constructors = race.arrays(AssetType.CONSTRUCTOR)
+    assert constructors.names == ["RED", "MCL"]
+    assert constructors.constructors == ["RED", "MCL"]
+    np.testing.assert_array_equal(constructors.price, [66.6, 55.5])
+    np.testing.assert_array_equal(constructors.points[constructors.index["MCL"]], 15)
+
+    # Built once and kept
+    assert race.arrays(AssetType.DRIVER) is drivers
@@ -0,0 +1,306 @@
+import pytest
+from pulp import LpMaximize, LpMinimize, LpProblem, LpVariable, lpSum, PULP_CBC_CMD
+from pulp.constants import LpStatusInfeasible, LpStatusOptimal
+
+from helpers import load_with_derivations
+from linear.solver_enumerate import EnumerationSolver, get_selection_groups
+from linear.strategy_base import StrategyBase, StrategyModel, VarType
+from linear.strategy_p2pm import StrategyMaxP2PM
+from races.season import factory_season
+from races.team import factory_team_lists
+from scripts.run_single_team import run_for_team
+
+
+_DRIVERS = ["VER", "LEC", "HAM", "ALO", "HUL", "MAG", "BOT", "NOR"]
+_CONSTRUCTORS = ["RED", "FER", "MER", "MCL"]
+_PAIRINGS = {
+    "VER": "RED",
+    "LEC": "FER",
+    "HAM": "FER",
+    "ALO": "MCL",
+    "HUL": "MCL",
+    "MAG": "MER",
+    "BOT": "MER",
+    "NOR": "RED",
+}
+_PRICES = {
+    "VER": 9.0,
+    "LEC": 7.5,
+    "HAM": 7.0,
+    "ALO": 4.0,
+    "HUL": 3.5,
+    "MAG": 3.0,
+    "BOT": 2.0,
+    "NOR": 8.0,
+    "RED": 9.0,
+    "FER": 8.0,
+    "MER": 5.0,
+    "MCL": 4.0,
+}
+# Powers of two, so every team has a distinct score and the optimum is unique
+_SCORES = {
+    "VER": 2048.0,
+    "LEC": 256.0,
+    "HAM": 64.0,
+    "ALO": 128.0,
+    "HUL": 1.0,
+    "MAG": 32.0,
+    "BOT": 16.0,
+    "NOR": 1024.0,
+    "RED": 512.0,
+    "FER": 4.0,
+    "MER": 8.0,
+    "MCL": 2.0,
+}
+
+
+class ScoreStrategyDummy(StrategyBase):
+    def __init__(self, *args, sense=LpMaximize, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sense = sense
+
+    def get_problem(self) -> LpProblem:
+        problem = LpProblem("ScoreStrategyDummy", self.sense)
+        drivers = self._lp_variables[VarType.TeamDrivers]
+        constructors = self._lp_variables[VarType.TeamConstructors]
+        problem += lpSum([_SCORES.get(d, 0.0) * v for d, v in drivers.items()] + [_SCORES[c] * v for c, v in constructors.items()])
+        return problem
+
+    def get_objective(self) -> dict[str, float] | None:
+        # The model only maximises
+        return _SCORES if self.sense == LpMaximize else None
+
+
+def _get_strategy(solver, max_cost=30.0, max_moves=2, team_drivers=None, sense=LpMaximize, warm_start: bool | None = True) -> ScoreStrategyDummy:
+    # None leaves warm starts at the strategy's default
+    return ScoreStrategyDummy(
+        team_drivers=team_drivers or ["HUL", "MAG", "BOT"],
+        team_constructors=["MER"],
+        all_available_drivers=_DRIVERS,
+        all_available_constructors=_CONSTRUCTORS,
+        all_available_driver_pairs=_PAIRINGS,
+        prev_available_driver_pairs=_PAIRINGS,
+        max_cost=max_cost,
+        max_moves=max_moves,
+        prices_assets=_PRICES,
+        derivs_assets={},
+        race_num=-1,
+        season_year=-1,
+        solver=solver,
+        sense=sense,
+        **({"warm_start": warm_start} if warm_start is not None else {}),
+    )
+
+
+def _get_selected(strategy: StrategyBase) -> tuple[list[str], list[str]]:
+    drivers = sorted(d for d, v in strategy._lp_variables[VarType.TeamDrivers].items() if v.varValue == 1)
+    constructors = sorted(c for c, v in strategy._lp_variables[VarType.TeamConstructors].items() if v.varValue == 1)
+    return drivers, constructors
+
+
+@pytest.mark.parametrize("max_cost,max_moves", [(30.0, 2), (30.0, 4), (22.0, 1), (40.0, 0), (18.5, 3)])
+@pytest.mark.parametrize("sense", [LpMaximize, LpMinimize])
+def test_enumeration_matches_cbc(max_cost, max_moves, sense):
+    # The optimum is unique, so both solvers must agree on the team
+    strat_cbc = _get_strategy(PULP_CBC_CMD(msg=0), max_cost, max_moves, sense=sense)
+    strat_enum = _get_strategy(EnumerationSolver(), max_cost, max_moves, sense=sense)
+
+    model_cbc = strat_cbc.execute()
+    model_enum = strat_enum.execute()
+
+    assert model_enum.status == model_cbc.status == LpStatusOptimal
+    assert _get_selected(strat_enum) == _get_selected(strat_cbc)
+    assert model_enum.objective.value() == pytest.approx(model_cbc.objective.value())
+    assert strat_enum._lp_variables[VarType.UnusedBudget].value() == pytest.approx(strat_cbc._lp_variables[VarType.UnusedBudget].value())
+    assert strat_enum._lp_variables[VarType.TeamMoves].value() == strat_cbc._lp_variables[VarType.TeamMoves].value()
+
+
+def test_enumeration_sells_unavailable_driver():
+    # RUS is no longer available so carries a prohibitive price, and must be moved out
+    strat = _get_strategy(EnumerationSolver(), max_cost=30.0, max_moves=1, team_drivers=["RUS", "MAG", "BOT"])
+    model = strat.execute()
+
+    assert model.status == LpStatusOptimal
+    assert strat._lp_variables[VarType.TeamDrivers]["RUS"].varValue == 0.0
+    assert strat._lp_variables[VarType.TeamMoves].value() == 1
+
+
+def test_enumeration_reports_infeasible():
+    # The cheapest three drivers and a constructor cost 11.5
+    strat = _get_strategy(EnumerationSolver(), max_cost=10.0, max_moves=4)
+    model = strat.execute()
+
+    assert model.status == LpStatusInfeasible
+
+
+@pytest.mark.parametrize("solver", [EnumerationSolver(), PULP_CBC_CMD(msg=0)])
+def test_strategy_model_reused_across_races_matches_new_problems(solver):
+    model = StrategyModel(_DRIVERS + ["RUS"], _CONSTRUCTORS)
+
+    # Budgets, move limits and teams changing race to race, including a team driver who has left the grid
+    for (max_cost, max_moves, team_drivers) in [
+        (30.0, 2, ["HUL", "MAG", "BOT"]),
+        (22.0, 1, ["RUS", "MAG", "BOT"]),
+        (40.0, 0, ["VER", "ALO", "BOT"]),
+        (18.5, 3, ["HUL", "MAG", "BOT"]),
+        (30.0, 4, ["RUS", "LEC", "HAM"]),
+    ]:
+        strat_new = _get_strategy(solver, max_cost, max_moves, team_drivers=team_drivers)
+        strat_model = _get_strategy(solver, max_cost, max_moves, team_drivers=team_drivers)
+
+        problem_new = strat_new.execute()
+        problem_model = strat_model.execute(model)
+
+        assert problem_model is model.problem
+        assert problem_model.status == problem_new.status == LpStatusOptimal
+        assert _get_selected(strat_model) == _get_selected(strat_new)
+        assert problem_model.objective.value() == pytest.approx(problem_new.objective.value())
+        assert strat_model._lp_variables[VarType.UnusedBudget].value() == pytest.approx(strat_new._lp_variables[VarType.UnusedBudget].value())
+        assert strat_model._lp_variables[VarType.TeamMoves].value() == strat_new._lp_variables[VarType.TeamMoves].value()
+        assert strat_model._lp_variables[VarType.TeamDrivers]["RUS"].varValue == 0.0
+
+
+def test_strategy_model_not_used_for_other_objectives():
+    model = StrategyModel(_DRIVERS, _CONSTRUCTORS)
+    strat = _get_strategy(EnumerationSolver(), sense=LpMinimize)
+
+    assert strat.execute(model) is not model.problem
+    assert strat.execute(model).status == LpStatusOptimal
+
+
+def test_strategy_model_rejects_unknown_assets():
+    model = StrategyModel(_DRIVERS[:-1], _CONSTRUCTORS)
+    with pytest.raises(ValueError, match="Asset NOR is not in the model"):
+        _get_strategy(EnumerationSolver()).execute(model)
+
+
+def test_get_incumbent():
+    # Current team costs 13.5
+    assert _get_strategy(EnumerationSolver()).get_incumbent() == {"HUL", "MAG", "BOT", "MER"}
+    assert _get_strategy(EnumerationSolver(), warm_start=False).get_incumbent() is None
+    # Off unless asked for, so a plain execute adds no cutoff
+    strat_default = _get_strategy(EnumerationSolver(), warm_start=None)
+    assert strat_default.get_incumbent() is None
+    strat_default.execute()
+    assert VarType.ObjectiveCutoff not in strat_default._lp_constraints
+    assert _get_strategy(EnumerationSolver(), team_drivers=["RUS", "MAG", "BOT"]).get_incumbent() is None
+    assert _get_strategy(EnumerationSolver(), max_cost=13.4).get_incumbent() is None
+
+    # Keeping the team scores 1 + 32 + 16 + 8, less the tolerance
+    assert ScoreStrategyDummy.get_cutoff(_SCORES, {"HUL", "MAG", "BOT", "MER"}) == pytest.approx(57.0)
+    assert ScoreStrategyDummy.get_cutoff(None, {"HUL"}) is None
+
+
+@pytest.mark.parametrize("solver", [EnumerationSolver(), PULP_CBC_CMD(msg=0, warmStart=True)])
+@pytest.mark.parametrize("max_cost,max_moves", [(30.0, 2), (30.0, 0), (22.0, 1), (15.0, 4)])
+def test_warm_start_matches_cold_start(solver, max_cost, max_moves):
+    strat_cold = _get_strategy(solver, max_cost, max_moves, warm_start=False)
+    strat_warm = _get_strategy(solver, max_cost, max_moves)
+
+    problem_cold = strat_cold.execute()
+    problem_warm = strat_warm.execute()
+
+    assert VarType.ObjectiveCutoff not in strat_cold._lp_constraints
+    assert VarType.ObjectiveCutoff in strat_warm._lp_constraints
+    assert problem_warm.status == problem_cold.status == LpStatusOptimal
+    assert _get_selected(strat_warm) == _get_selected(strat_cold)
+
+    # And the same again on a reused model, whose cutoff is switched off without an incumbent
+    model = StrategyModel(_DRIVERS + ["RUS"], _CONSTRUCTORS)
+    for team_drivers in [["HUL", "MAG", "BOT"], ["RUS", "MAG", "BOT"], ["HUL", "MAG", "BOT"]]:
+        strat_model = _get_strategy(solver, max_cost, max(max_moves, 1), team_drivers=team_drivers)
+        strat_cold = _get_strategy(solver, max_cost, max(max_moves, 1), team_drivers=team_drivers, warm_start=False)
+        strat_model.execute(model)
+        strat_cold.execute()
+        assert _get_selected(strat_model) == _get_selected(strat_cold)
+
+
+def test_get_selection_groups():
+    x = LpVariable.dicts("x", ["a", "b", "c"], cat="Binary")
+    y = LpVariable.dicts("y", ["d", "e"], cat="Binary")
+
+    problem = LpProblem("groups", LpMaximize)
+    problem += lpSum(x.values()) + lpSum(y.values())
+    problem += lpSum(x.values()) == 2, "x_size"
+    problem += lpSum(y.values()) == 1, "y_size"
+    problem += x["a"] + y["d"] <= 1, "limit"
+
+    groups = get_selection_groups(problem)
+    assert list(groups.keys()) == ["x_size", "y_size"]
+    assert [v.name for v in groups["x_size"][0]] == ["x_a", "x_b", "x_c"]
+    assert groups["x_size"][1] == 2
+    assert groups["y_size"][1] == 1
+
+    # A continuous variable cannot be enumerated
+    z = LpVariable("z", lowBound=0)
+    problem += z == x["a"] + x["b"], "aux"
+    assert get_selection_groups(problem) is None
+
+
+def test_enumeration_falls_back_when_not_enumerable():
+    class RecordingSolver(PULP_CBC_CMD):
+        def __init__(self):
+            super().__init__(msg=0)
+            self.calls = 0
+
+        def actualSolve(self, lp, **kwargs):
+            self.calls += 1
+            return super().actualSolve(lp, **kwargs)
+
+    x = LpVariable.dicts("x", ["a", "b", "c"], cat="Binary")
+    z = LpVariable("z", lowBound=0, upBound=5)
+    problem = LpProblem("fallback", LpMaximize)
+    problem += lpSum(x.values()) + z
+    problem += lpSum(x.values()) == 2, "x_size"
+
+    fallback = RecordingSolver()
+    EnumerationSolver(fallback=fallback).solve(problem)
+
+    assert fallback.calls == 1
+    assert problem.status == LpStatusOptimal
+    assert z.value() == 5
+
+
+def test_run_for_team_matches_cbc():
+    (df_driver_ppm, df_constructor_ppm, df_driver_pairs) = load_with_derivations(season=2025)
+    season = factory_season(df_driver_ppm, df_constructor_ppm, df_driver_pairs, 2025)
+
+    rows = {}
+    for name, solver in [("cbc", None), ("enum", EnumerationSolver())]:
+        team = factory_team_lists(
+            drivers=["TSU@VRB", "SAI@WIL", "BEA@HAA", "HAD@VRB", "DOO@ALP"],
+            constructors=["MCL", "FER"],
+            race=season.races[1],
+        )
+        rows[name] = run_for_team(StrategyMaxP2PM, team, season, 2025, 1, solver=solver)
+
+    assert rows["enum"] == rows["cbc"]
+
+
+def test_strategy_model_update_rewrites_constraints():
+    model = StrategyModel(_DRIVERS + ["RUS"], _CONSTRUCTORS)
+    total_cost = model.problem.get_constraint_by_name("total_cost")
+    team_moves = model.problem.get_constraint_by_name("team_moves")
+    cutoff = model.problem.get_constraint_by_name("objective_cutoff")
+
+    def coefficients(constraint) -> dict[str, float]:
+        return {v.name: c for v, c in constraint.items()}
+
+    strat = _get_strategy(EnumerationSolver(), 30.0, 2, team_drivers=["HUL", "MAG", "BOT"])
+    strat.execute(model)
+    assert coefficients(total_cost)["driver_VER"] == 9.0
+    assert coefficients(total_cost)["driver_RUS"] == 0.0
+    assert coefficients(team_moves)["driver_HUL"] == -1
+    assert coefficients(cutoff)["driver_VER"] == _SCORES["VER"]
+    assert total_cost.constant == pytest.approx(-30.0)
+
+    # Another race, with new prices, budget and team
+    strat = _get_strategy(EnumerationSolver(), 22.0, 1, team_drivers=["RUS", "MAG", "BOT"])
+    strat._prices_assets = _PRICES | {"VER": 9.5, "RUS": 6.0}
+    strat._all_available_drivers = _DRIVERS + ["RUS"]
+    strat.execute(model)
+    assert coefficients(total_cost)["driver_VER"] == 9.5
+    assert coefficients(total_cost)["driver_RUS"] == 6.0
+    assert coefficients(team_moves)["driver_HUL"] == 0
+    assert coefficients(team_moves)["driver_RUS"] == -1
+    assert total_cost.constant == pytest.approx(-22.0)
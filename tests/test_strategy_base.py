@@ -175,6 +175,16 @@ def test_construct_strategy(
     assert sb._prices_assets["RUS"] == COST_PROHIBITIVE
     assert sb._race_num == 123
     assert sb._season_year == 456
+    assert sb.get_price("RUS") == COST_PROHIBITIVE
+    assert sb.get_race_num() == 123
+    assert sb.get_team_drivers() == ["VER", "RUS"]
+    assert sb.get_team_constructors() == ["MCL"]
+    assert sb.get_available_drivers() == fixture_all_available_drivers
+    assert sb.get_available_constructors() == fixture_all_available_constructors
+    assert sb.get_max_cost() == 0.0
+    assert sb.get_max_moves() == 2
+    # Nothing solved, so nothing to choose DRS from
+    assert sb.get_drs_driver() == ""
 
     # Everything in price assets is available in either all drivers or all constructors (check both)
     fap2 = fixture_asset_prices.copy()
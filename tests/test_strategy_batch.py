@@ -0,0 +1,75 @@
+import random
+
+import pytest
+from pulp.constants import LpStatusOptimal
+
+from common import AssetType
+from helpers import load_with_derivations
+from linear.solver_enumerate import EnumerationSolver
+from linear.strategy_base import VarType
+from linear.strategy_batch import BatchSelection, execute_batch
+from linear.strategy_budget import StrategyMaxBudget
+from linear.strategy_factory import factory_strategies, factory_strategy, factory_strategy_model
+from linear.strategy_p2pm import StrategyMaxP2PM
+from races.season import factory_season
+from races.team import Team
+
+
+def _get_random_teams(race, race_prev, num_teams: int, seed: int) -> tuple[list[Team], list[int]]:
+    """Teams picked from the previous race, with budgets from overspent to plenty and moves from none to unlimited."""
+    rng = random.Random(seed)
+    constructors = [c for c in race_prev.constructors if c in race.constructors]
+    teams = []
+    max_moves = []
+    for _ in range(num_teams):
+        team = Team(num_drivers=5, num_constructors=2, unused_budget=rng.choice([-1.0, 0.0, 0.1, 1.3, 3.0]))
+        for d in rng.sample(list(race_prev.drivers), 5):
+            team.add_asset(AssetType.DRIVER, d)
+        for c in rng.sample(constructors, 2):
+            team.add_asset(AssetType.CONSTRUCTOR, c)
+        teams.append(team)
+        max_moves.append(rng.choice([0, 1, 2, 3, 7]))
+    return teams, max_moves
+
+
+@pytest.mark.parametrize("strategy", [StrategyMaxP2PM, StrategyMaxBudget])
+def test_execute_batch_matches_execute(strategy):
+    season = factory_season(*load_with_derivations(season=2023), 2023)
+    model = factory_strategy_model(season)
+
+    for race_num in [2, 5, 9]:
+        (race, race_prev) = (season.races[race_num], season.races[race_num - 1])
+        (teams, max_moves) = _get_random_teams(race, race_prev, 40, race_num)
+
+        strategies = factory_strategies(race, race_prev, teams, strategy, max_moves, 2023)
+        results = execute_batch(strategies, model)
+        # Only the first strategy is set up on the model, the others are left unsolved
+        assert all(len(s._lp_variables) == 0 for s in strategies[1:])
+
+        for (team, team_max_moves, result) in zip(teams, max_moves, results):
+            strat = factory_strategy(race, race_prev, team, strategy, team_max_moves, 2023, solver=EnumerationSolver())
+            problem = strat.execute(model)
+
+            if result is None:
+                assert problem.status != LpStatusOptimal
+                continue
+            assert result == BatchSelection(
+                drivers=[d for d, v in model.drivers.items() if v.varValue == 1],
+                constructors=[c for c, v in model.constructors.items() if v.varValue == 1],
+                unused_budget=strat._lp_variables[VarType.UnusedBudget].value(),
+                moves=strat._lp_variables[VarType.TeamMoves].value(),
+                drs_driver=strat.get_drs_driver(),
+            )
+
+
+def test_execute_batch_rejects_mixed_races():
+    season = factory_season(*load_with_derivations(season=2023), 2023)
+    model = factory_strategy_model(season)
+    (teams, max_moves) = _get_random_teams(season.races[3], season.races[2], 2, 0)
+
+    strategies = factory_strategies(season.races[2], season.races[1], teams[:1], StrategyMaxP2PM, max_moves[:1], 2023) \
+        + factory_strategies(season.races[3], season.races[2], teams[1:], StrategyMaxP2PM, max_moves[1:], 2023)
+    with pytest.raises(ValueError, match="cannot be batched"):
+        execute_batch(strategies, model)
+
+    assert execute_batch([], model) == []
@@ -2,7 +2,7 @@ import pytest
 
 from common import AssetType
 from import_data.import_history import load_archive_data_season
-from races.team import Team, factory_team_row, factory_team_lists
+from races.team import Team, factory_team_row, factory_team_lists, factory_team_picks
 from races.season import Race, factory_race
 import numpy as np
 from import_data.derivations import (
@@ -188,6 +188,27 @@ def test_factory_team_row(race_1):
         factory_team_row(row_extra, race_1)
 
 
+def test_factory_team_picks_matches_factory_team_row(race_1):
+    drivers = list(race_1.drivers.keys())
+    constructors = list(race_1.constructors.keys())
+    driver_picks = [13, 2, 7, 0, 19]
+    constructor_picks = [8, 3]
+
+    row_assets = {d: race_1.drivers[d].price if i in driver_picks else np.nan for i, d in enumerate(drivers)}
+    row_assets.update({c: race_1.constructors[c].price if i in constructor_picks else np.nan for i, c in enumerate(constructors)})
+    team_row = factory_team_row(row_assets, race_1, total_budget=100.0)
+
+    team = factory_team_picks(driver_picks, constructor_picks, race_1, total_budget=100.0)
+
+    # Same assets in the same order, and exactly the same float budget
+    assert team.assets == team_row.assets
+    assert team.unused_budget == team_row.unused_budget
+    assert str(team) == str(team_row)
+
+    with pytest.raises(ValueError, match="already present"):
+        factory_team_picks([0, 0, 1, 2, 3], constructor_picks, race_1)
+
+
 def test_factory_team_lists(race_1):
     drivers = [
          "SAR@WIL",  # 4.0